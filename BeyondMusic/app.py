@@ -11,26 +11,32 @@
 # app.py
 import sys
 import os
+import csv
 import json
 import random
+import re
 import ctypes
+import hashlib
+import itertools
+import threading
+import time
+import unicodedata
+_START_TIME = time.perf_counter()  # für das Startprofil (Import-Dauer)
 from pathlib import Path
-from io import BytesIO
-import webbrowser
-import requests  # musst du in requirements aufnehmen
-from packaging import version
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache, partial
+# requests, packaging, webbrowser, QtSvg und QtMultimedia werden erst bei Bedarf importiert (schnellerer Start)
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QLabel, QPushButton, QListWidget,
-    QListWidgetItem, QHBoxLayout, QVBoxLayout, QFileDialog, QSlider,
+    QApplication, QMainWindow, QWidget, QLabel, QPushButton, QListView,
+    QStyledItemDelegate, QHBoxLayout, QVBoxLayout, QFileDialog, QSlider,
     QMessageBox, QSizePolicy, QFrame, QTabWidget, QLineEdit, QStyle, 
-    QTabBar, QProgressBar, QComboBox, QStyleOptionSlider, QScrollArea, QGridLayout, QGraphicsDropShadowEffect
+    QTabBar, QProgressBar, QComboBox, QStyleOptionSlider, QGraphicsDropShadowEffect
 )
-from PySide6.QtCore import Qt, QTimer, QSize, Signal, QPropertyAnimation, QVariantAnimation, QUrl
-from PySide6.QtGui import QPixmap, QIcon, QPainter, QColor, QFont, QFontMetrics, QPainterPath, QBrush
-from PySide6.QtSvgWidgets import QSvgWidget
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PySide6.QtCore import Qt, QTimer, QSize, QRect, QPoint, QEvent, Signal, QPropertyAnimation, QVariantAnimation, QUrl, QObject, QRunnable, QThreadPool, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QPixmap, QImage, QIcon, QPainter, QPen, QColor, QFont, QFontMetrics, QPainterPath, QBrush
 
 # import vlc
 def get_root_path():
@@ -50,14 +56,428 @@ os.environ['PATH'] = vlc_path + os.pathsep + os.environ.get('PATH', '')
 # 2. vlc importieren (erst jetzt)
 import vlc
 
-# 3. VLC Instanz erzeugen
-try:
-    vlc_instance = vlc.Instance()
-    vlc_player = vlc_instance.media_player_new()
-    print("VLC Init erfolgreich")
-except Exception as e:
-    print(f"VLC Init Fehler: {e}")
-    sys.exit(1)
+# 3. Wiedergabe-Engine (wird als eigener Schritt im SplashScreen erzeugt)
+class PlaybackEvents(QObject):
+    """Leitet libVLC-Ereignisse als Qt-Signale weiter.
+
+    Die VLC-Callbacks laufen in einem VLC-Thread; die Empfänger verbinden sich
+    mit Qt.QueuedConnection und landen so immer im GUI-Thread. Dort darf man
+    wieder libVLC aufrufen (aus dem Callback heraus würde das blockieren)."""
+    state_changed = Signal(str)   # "opening", "playing", "paused", "stopped", "ended", "error"
+    length_changed = Signal(int)  # ms
+    end_reached = Signal()
+    error = Signal()
+    track_changed = Signal(str)   # Gapless/Crossfade: der vorgeladene Titel läuft jetzt
+    now_playing = Signal(str)     # Streams: neuer ICY-Titel ("Interpret - Titel")
+    first_audio = Signal(float)   # Streams: ms vom Öffnen bis zum ersten Audio
+    buffering_changed = Signal(bool)  # Streams: True = Puffer leergelaufen, False = läuft wieder
+    # intern (Engine -> GUI-Thread)
+    handover_due = Signal(int)
+    crossfade_due = Signal(int)
+    meta_changed = Signal(int)
+
+
+class PlaybackEngine:
+    """Besitzt die einzige VLC-Instanz samt Media-Player.
+
+    Media-Objekte lokaler Dateien werden in einem kleinen LRU wiederverwendet
+    (z. B. bei Zurück/Weiter) und beim Verdrängen bzw. release() sofort
+    freigegeben, statt bis zum Programmende liegen zu bleiben.
+
+    Für Gapless gibt es einen zweiten Player, der den nächsten Titel schon
+    geöffnet und pausiert bei 0 bereithält (preload). Am Ende des aktuellen
+    Titels wird nur noch umgeschaltet statt Demuxer/Decoder neu zu starten;
+    mit crossfade_ms > 0 werden beide Player kurz überblendet."""
+
+    MEDIA_CACHE_SIZE = 8
+    FADE_STEP_MS = 50
+
+    def __init__(self, *args, instance=None):
+        # instance: fertige (z. B. nachgebildete) VLC-Instanz statt vlc.Instance(*args)
+        self.instance = instance if instance is not None else vlc.Instance(*args)
+        self.player = self.instance.media_player_new()    # aktiver Player
+        self._standby = self.instance.media_player_new()  # hält den nächsten Titel bereit
+        self._media = OrderedDict()     # mrl -> vlc.Media (nur lokale Dateien)
+        self._owned = {}                # player -> eigenes Media (Stream/Vorladen), nie gecacht
+        self._lock = threading.Lock()   # media_new/parse auch aus Worker-Threads
+        self._volume = 100
+        self._equalizer = None
+        self._is_stream = False
+        self._generation = 0            # erkennt veraltete Ereignisse nach einem Wechsel
+
+        # Gapless / Crossfade
+        self.gapless = True
+        self.crossfade_ms = 0
+        self._standby_path = None
+        self._standby_ready = False
+        self._pending_preload = None    # wartet, bis ein Crossfade fertig ist
+        self._fading = None             # ausblendender Player während eines Crossfades
+        self._fade_ms = 0
+        self._fade_start = 0.0
+        self._fade_due = False
+        self._ended_at = None
+        self._measure_gap = False
+        self.handover_gap_ms = None     # Lücke zwischen Titelende und Start des nächsten
+
+        # Zustand kommt per Ereignis vom Player, nicht per Polling
+        self.events = PlaybackEvents()
+        self.events.handover_due.connect(self._on_handover_due, Qt.QueuedConnection)
+        self.events.crossfade_due.connect(self._on_crossfade_due, Qt.QueuedConnection)
+        self.events.meta_changed.connect(self._on_meta_changed, Qt.QueuedConnection)
+        self.now_playing = ""           # letzter ICY-Titel des laufenden Streams
+        self._opened_at = None          # play_url-Zeitpunkt, bis das erste Audio kommt
+        self._stalled = False
+        self._fade_timer = QTimer(self.events)
+        self._fade_timer.setInterval(self.FADE_STEP_MS)
+        self._fade_timer.timeout.connect(self._fade_step)
+        self.state_name = "idle"
+        self.position = 0               # ms, aus MediaPlayerTimeChanged
+        self.duration = 0               # ms, aus MediaPlayerLengthChanged
+        self._attach_events(self.player)
+        self._attach_events(self._standby)
+
+    # ---- Ereignisse (laufen im VLC-Thread: nur Werte merken und Signale senden) ----
+    def _event_handlers(self):
+        E = vlc.EventType
+        return [
+            (E.MediaPlayerTimeChanged, self._on_vlc_time),
+            (E.MediaPlayerLengthChanged, self._on_vlc_length),
+            (E.MediaPlayerEndReached, self._on_vlc_end),
+            (E.MediaPlayerEncounteredError, self._on_vlc_error),
+            (E.MediaPlayerBuffering, self._on_vlc_buffering),
+            (E.MediaPlayerOpening, self._on_vlc_state, "opening"),
+            (E.MediaPlayerPlaying, self._on_vlc_state, "playing"),
+            (E.MediaPlayerPaused, self._on_vlc_state, "paused"),
+            (E.MediaPlayerStopped, self._on_vlc_state, "stopped"),
+        ]
+
+    def _attach_events(self, player):
+        em = player.event_manager()
+        for event_type, callback, *args in self._event_handlers():
+            em.event_attach(event_type, callback, player, *args)
+
+    def _detach_events(self, player):
+        em = player.event_manager()
+        for event_type, *_ in self._event_handlers():
+            em.event_detach(event_type)
+
+    def _set_state(self, name):
+        self.state_name = name
+        self.events.state_changed.emit(name)
+
+    def _on_vlc_state(self, event, player, name):
+        if player is self._standby:
+            # mit :start-paused meldet der Vorlade-Player "paused", sobald er bereit ist
+            if name == "paused" and self._standby_path is not None:
+                self._standby_ready = True
+            return
+        if player is self.player:
+            self._set_state(name)
+
+    def _on_vlc_time(self, event, player):
+        if player is not self.player:
+            return
+        self.position = event.u.new_time
+        if self._opened_at is not None and self.position > 0:
+            self.events.first_audio.emit((time.perf_counter() - self._opened_at) * 1000)
+            self._opened_at = None
+        if self._measure_gap and self.position > 0:
+            self._measure_gap = False
+            if self._ended_at is not None:
+                self.handover_gap_ms = (time.perf_counter() - self._ended_at) * 1000
+                self._ended_at = None
+        if (self.crossfade_ms and self._standby_ready and not self._fade_due
+                and self.duration > 0 and self.duration - self.position <= self.crossfade_ms):
+            self._fade_due = True
+            self.events.crossfade_due.emit(self._generation)
+
+    def _on_vlc_length(self, event, player):
+        if player is not self.player:
+            return
+        self.duration = event.u.new_length
+        self.events.length_changed.emit(self.duration)
+
+    def _on_vlc_end(self, event, player):
+        if player is not self.player:
+            return
+        self._ended_at = time.perf_counter()
+        if self._standby_ready and not self._is_stream:
+            self.events.handover_due.emit(self._generation)
+        else:
+            self._set_state("ended")
+            self.events.end_reached.emit()
+
+    def _on_vlc_buffering(self, event, player):
+        # kommt sehr oft; weitergegeben wird nur der Wechsel läuft <-> leergelaufen
+        if player is not self.player or not self._is_stream:
+            return
+        stalled = event.u.new_cache < 100
+        if stalled != self._stalled and (self.position > 0 or not stalled):
+            self._stalled = stalled
+            self.events.buffering_changed.emit(stalled)
+
+    def _on_vlc_meta(self, event, generation):
+        # libVLC liest die ICY-Blöcke ohnehin mit; hier nur Bescheid geben,
+        # get_meta() erst im GUI-Thread (_on_meta_changed)
+        self.events.meta_changed.emit(generation)
+
+    def _on_vlc_error(self, event, player):
+        if player is self._standby:
+            self._standby_ready = False
+            self._standby_path = None
+            return
+        if player is self.player:
+            self._set_state("error")
+            self.events.error.emit()
+
+    # ---- Media ----
+    def media(self, path):
+        """Media-Objekt für eine lokale Datei (aus dem Cache oder neu)."""
+        media = self._media.get(path)
+        if media is not None:
+            self._media.move_to_end(path)
+            return media
+        with self._lock:
+            media = self.instance.media_new(path)
+        self._media[path] = media
+        while len(self._media) > self.MEDIA_CACHE_SIZE:
+            # libVLC zählt Referenzen: ein gerade spielendes Media bleibt gültig
+            self._media.popitem(last=False)[1].release()
+        return media
+
+    def read_meta(self, path, *keys):
+        """Parst die Datei einmal mit VLC: ([Meta-Werte zu keys], Dauer in ms)."""
+        with self._lock:
+            m = self.instance.media_new(path)
+        try:
+            try:
+                m.parse()
+            except Exception:
+                pass
+            return [m.get_meta(k) for k in keys], max(m.get_duration(), 0)
+        finally:
+            m.release()
+
+    def _load(self, player, media, owned=False):
+        """Setzt media auf player und gibt ein vorher eigenes Media frei."""
+        old = self._owned.pop(player, None)
+        player.set_media(media)
+        if old is not None:
+            old.release()
+        if owned:
+            self._owned[player] = media
+
+    # ---- Wiedergabe ----
+    def play_file(self, path):
+        self._finish_fade()
+        self._is_stream = False
+        self._opened_at = None
+        self._measure_gap = self._ended_at is not None
+        if path == self._standby_path and self._standby_ready:
+            # schon vorgeladen (Weiter-Taste oder Titelende): nur umschalten
+            self.player.stop()
+            self._swap(notify=False)
+            return 0
+        self._generation += 1
+        self.position = self.duration = 0
+        self._load(self.player, self.media(path))
+        return self.player.play()
+
+    def play_url(self, url, caching_ms=None):
+        """Spielt einen Stream; caching_ms setzt VLCs Netzwerkpuffer für diesen Stream."""
+        self._finish_fade()
+        self._is_stream = True
+        self._ended_at = None
+        self._generation += 1
+        self.position = self.duration = 0
+        self.now_playing = ""
+        self._stalled = False
+        self._opened_at = time.perf_counter()
+        with self._lock:
+            media = self.instance.media_new(url)
+        if caching_ms is not None:
+            media.add_option(f":network-caching={int(caching_ms)}")
+        media.event_manager().event_attach(vlc.EventType.MediaMetaChanged, self._on_vlc_meta, self._generation)
+        self._load(self.player, media, owned=True)
+        return self.player.play()
+
+    def _on_meta_changed(self, generation):
+        if generation != self._generation or not self._is_stream:
+            return
+        media = self.player.get_media()
+        text = (media.get_meta(vlc.Meta.NowPlaying) or "").strip() if media is not None else ""
+        if text and text != self.now_playing:
+            self.now_playing = text
+            self.events.now_playing.emit(text)
+
+    def preload(self, path):
+        """Öffnet path pausiert im zweiten Player, damit der nächste Wechsel ohne Lücke klappt."""
+        if not self.gapless or not path:
+            self.cancel_preload()
+            return
+        if self._standby is None:
+            # Crossfade läuft noch, der zweite Player ist gerade belegt
+            self._pending_preload = path
+            return
+        if path == self._standby_path:
+            return
+        self._standby.stop()
+        with self._lock:
+            media = self.instance.media_new(path)
+        media.add_option(":start-paused")
+        self._standby_path, self._standby_ready = path, False
+        self._load(self._standby, media, owned=True)
+        self._standby.audio_set_volume(0)
+        self._standby.play()
+
+    def cancel_preload(self):
+        self._pending_preload = None
+        if self._standby is None or self._standby_path is None:
+            return
+        self._standby_path, self._standby_ready = None, False
+        self._standby.stop()
+        self._load(self._standby, None)
+
+    def _swap(self, fade_ms=0, notify=True):
+        """Übergabe an den vorgeladenen Player; der alte wird Vorlade-Player (ggf. nach dem Fade)."""
+        old, path = self.player, self._standby_path
+        self.player, self._standby = self._standby, None
+        self._standby_path, self._standby_ready, self._fade_due = None, False, False
+        self._generation += 1
+        self._measure_gap = self._ended_at is not None
+        self.position, self.duration = 0, max(self.player.get_length(), 0)
+        self.player.audio_set_volume(0 if fade_ms else self._volume)
+        self.player.set_pause(0)
+        if fade_ms:
+            self._fading, self._fade_ms = old, fade_ms
+            self._fade_start = time.perf_counter()
+            self._fade_timer.start()
+        else:
+            self._retire(old)
+        if notify:
+            self.events.track_changed.emit(path)
+        if self.duration:
+            self.events.length_changed.emit(self.duration)
+        return path
+
+    def _retire(self, player):
+        player.stop()
+        self._load(player, None)
+        self._standby = player
+        pending, self._pending_preload = self._pending_preload, None
+        if pending:
+            self.preload(pending)
+
+    def _on_handover_due(self, generation):
+        if generation != self._generation:
+            return
+        if self._standby_ready:
+            self._swap()
+        else:
+            self._set_state("ended")
+            self.events.end_reached.emit()
+
+    def _on_crossfade_due(self, generation):
+        if generation != self._generation or not self._standby_ready or self._fading:
+            return
+        remaining = self.duration - self.position
+        self._swap(fade_ms=max(self.FADE_STEP_MS, min(self.crossfade_ms, remaining)))
+
+    def _fade_step(self):
+        t = min(1.0, (time.perf_counter() - self._fade_start) * 1000 / self._fade_ms)
+        self.player.audio_set_volume(int(self._volume * t))
+        self._fading.audio_set_volume(int(self._volume * (1 - t)))
+        if t >= 1.0:
+            self._finish_fade()
+
+    def _finish_fade(self):
+        if self._fading is None:
+            return
+        self._fade_timer.stop()
+        fading, self._fading = self._fading, None
+        self.player.audio_set_volume(self._volume)
+        self._retire(fading)
+
+    def resume(self):
+        return self.player.play()
+
+    def pause(self):
+        self._finish_fade()
+        self.player.pause()
+
+    def stop(self):
+        self._finish_fade()
+        self._ended_at = None
+        if self.player.is_playing():
+            self.player.stop()
+
+    def is_playing(self):
+        return bool(self.player.is_playing())
+
+    def has_media(self):
+        return self.player.get_media() is not None
+
+    def state(self):
+        return self.player.get_state()
+
+    def length(self):
+        return self.player.get_length()
+
+    def time(self):
+        return self.player.get_time()
+
+    def seek(self, ms):
+        self.player.set_time(int(ms))
+        self.position = int(ms)
+        self._fade_due = False
+
+    def volume(self):
+        return self._volume
+
+    def set_volume(self, value):
+        self._volume = int(value)
+        if self._fading is None:
+            self.player.audio_set_volume(self._volume)
+
+    def set_equalizer(self, eq):
+        self._equalizer = eq
+        self.player.set_equalizer(eq)
+        if self._standby is not None:
+            self._standby.set_equalizer(eq)
+        if self._fading is not None:
+            self._fading.set_equalizer(eq)
+
+    def release(self):
+        """Gibt beide Player, alle Media-Objekte und die Instanz frei (beim Beenden)."""
+        self._fade_timer.stop()
+        players = [p for p in (self.player, self._standby, self._fading) if p is not None]
+        for player in players:
+            try:
+                self._detach_events(player)
+                player.stop()
+            except Exception:
+                pass
+        for media in self._owned.values():
+            media.release()
+        self._owned.clear()
+        for media in self._media.values():
+            media.release()
+        self._media.clear()
+        for player in players:
+            player.release()
+        self.instance.release()
+
+
+engine = None
+
+
+def init_engine():
+    """Erzeugt die Wiedergabe-Engine beim ersten Aufruf."""
+    global engine
+    if engine is None:
+        engine = PlaybackEngine()
+        print("VLC Init erfolgreich")
+    return engine
 
 # Optional mutagen
 try:
@@ -79,20 +499,48 @@ APPDATA_DIR = os.path.join(base_dir, APP_NAME)
 os.makedirs(APPDATA_DIR, exist_ok=True)
 
 CONFIG_PATH = os.path.join(APPDATA_DIR, CONFIG_FILENAME)
+PLAYLIST_PATH = os.path.join(APPDATA_DIR, "playlist.m3u8")
+STARTUP_PROFILE_PATH = os.path.join(APPDATA_DIR, "startup_profile.json")
 print("Config wird gespeichert unter:", CONFIG_PATH)
 
+THUMB_DIR = os.path.join(APPDATA_DIR, "thumbs")
+THUMB_SIZES = (52, 56, 260)        # Playlist-Zeile, Player-Leiste, Cover rechts
+THUMB_CACHE_MAX_BYTES = 200 * 1024 * 1024
+SCAN_WORKERS = 8                # parallele Verzeichnis-Listings beim Ordner-Import
+LIBRARY_PATH = os.path.join(APPDATA_DIR, "library.db")
+LIBRARY_SYNC_DELAY_MS = 5000    # Abgleich der bekannten Ordner erst nach dem Start
+
 SUPPORTED_FORMATS = (".mp3", ".wav", ".ogg", ".flac", ".m4a", ".aac")
 APP_VERSION = "0.1.7"
 FORCE_UPDATE_CHECK = False  # Für Development True setzen
 GITHUB_REPO = "BeyondDevWorks/BDW-BeyondMusic"  # GitHub User/Repo
+UPDATE_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+UPDATE_CACHE_PATH = os.path.join(APPDATA_DIR, "update_check.json")
+STATIONS_JSON_PATH = os.path.join(APPDATA_DIR, "stations.json")  # optionale große Senderliste
+STATIONS_CSV_PATH = os.path.join(APPDATA_DIR, "stations.csv")
+STATION_SEARCH_LIMIT = 2000  # so viele Treffer zeigt der Webradio-Tab bei einer Suche
+STREAM_PROBE_CACHE_PATH = os.path.join(APPDATA_DIR, "stream_probe.json")
+STREAM_PROBE_TTL = 30 * 60      # Sekunden, so lange gilt eine Stream-Prüfung
+STREAM_PROBE_TIMEOUT = 5.0      # Sekunden pro Verbindung
+TIMESHIFT_SEGMENT_SIZE = 4 * 1024 * 1024   # Bytes pro Segmentdatei
+TIMESHIFT_SEGMENTS = 16                    # 64 MB, bei 128 kbit/s gut eine Stunde
+STREAM_CACHING_MS = 1500        # VLC-Netzwerkpuffer für Sender (pro Sender änderbar)
+TIMESHIFT_CACHING_MS = 300      # mit Time-Shift kommt alles vom lokalen Puffer
+STREAM_METRICS_PATH = os.path.join(APPDATA_DIR, "stream_metrics.json")
+UPDATE_CHECK_TTL = 6 * 60 * 60  # Sekunden, so lange gilt das letzte Ergebnis
 
 DEFAULT_SETTINGS = {
     "volume": 80,
     "shuffle": False,
     "repeat": False,
-    "last_playlist": [],
     "eq_values": [0] * 10,
-    "eq_preset": "Neutral"
+    "eq_preset": "Neutral",
+    "gapless": True,      # nächsten Titel vorladen und ohne Pause anschließen
+    "crossfade_ms": 0,    # > 0: Titel überblenden statt hart anschließen
+    "timeshift": True,    # Webradio mitschneiden: Pause, Zurückspulen, Speichern
+    "stream_caching_ms": STREAM_CACHING_MS,
+    "station_caching_ms": {},  # Sendername -> eigener Netzwerkpuffer (ms)
+    "watch_folders": True,     # Bibliotheksordner beobachten: neue/gelöschte/verschobene Dateien übernehmen
 }
 
 DWMWA_USE_IMMERSIVE_DARK_MODE = 20  # für neuere Windows-Versionen
@@ -113,25 +561,110 @@ SVG_REPEAT = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640"><p
 SVG_DELETE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640"><path fill="#FFFFFF" d="M232.7 69.9L224 96L128 96C110.3 96 96 110.3 96 128C96 145.7 110.3 160 128 160L512 160C529.7 160 544 145.7 544 128C544 110.3 529.7 96 512 96L416 96L407.3 69.9C402.9 56.8 390.7 48 376.9 48L263.1 48C249.3 48 237.1 56.8 232.7 69.9zM512 208L128 208L149.1 531.1C150.7 556.4 171.7 576 197 576L443 576C468.3 576 489.3 556.4 490.9 531.1L512 208z"/></svg>"""
 SVG_VOLUME = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640"><path fill="#FFFFFF" d="M533.6 96.5C523.3 88.1 508.2 89.7 499.8 100C491.4 110.3 493 125.4 503.3 133.8C557.5 177.8 592 244.8 592 320C592 395.2 557.5 462.2 503.3 506.3C493 514.7 491.5 529.8 499.8 540.1C508.1 550.4 523.3 551.9 533.6 543.6C598.5 490.7 640 410.2 640 320C640 229.8 598.5 149.2 533.6 96.5zM473.1 171C462.8 162.6 447.7 164.2 439.3 174.5C430.9 184.8 432.5 199.9 442.8 208.3C475.3 234.7 496 274.9 496 320C496 365.1 475.3 405.3 442.8 431.8C432.5 440.2 431 455.3 439.3 465.6C447.6 475.9 462.8 477.4 473.1 469.1C516.3 433.9 544 380.2 544 320.1C544 260 516.3 206.3 473.1 171.1zM412.6 245.5C402.3 237.1 387.2 238.7 378.8 249C370.4 259.3 372 274.4 382.3 282.8C393.1 291.6 400 305 400 320C400 335 393.1 348.4 382.3 357.3C372 365.7 370.5 380.8 378.8 391.1C387.1 401.4 402.3 402.9 412.6 394.6C434.1 376.9 448 350.1 448 320C448 289.9 434.1 263.1 412.6 245.5zM80 416L128 416L262.1 535.2C268.5 540.9 276.7 544 285.2 544C304.4 544 320 528.4 320 509.2L320 130.8C320 111.6 304.4 96 285.2 96C276.7 96 268.5 99.1 262.1 104.8L128 224L80 224C53.5 224 32 245.5 32 272L32 368C32 394.5 53.5 416 80 416z"/></svg>"""
 SVG_REMOVEALL = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640"><path fill="#FFFFFF" d="M232.7 69.9L224 96L128 96C110.3 96 96 110.3 96 128C96 145.7 110.3 160 128 160L512 160C529.7 160 544 145.7 544 128C544 110.3 529.7 96 512 96L416 96L407.3 69.9C402.9 56.8 390.7 48 376.9 48L263.1 48C249.3 48 237.1 56.8 232.7 69.9zM512 208L128 208L149.1 531.1C150.7 556.4 171.7 576 197 576L443 576C468.3 576 489.3 556.4 490.9 531.1L512 208z"/></svg>"""
+SVG_RECORD = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640"><path fill="#FFFFFF" d="M320 576C461.4 576 576 461.4 576 320C576 178.6 461.4 64 320 64C178.6 64 64 178.6 64 320C64 461.4 178.6 576 320 576zM320 208C381.9 208 432 258.1 432 320C432 381.9 381.9 432 320 432C258.1 432 208 381.9 208 320C208 258.1 258.1 208 320 208z"/></svg>"""
 SVG_STOPALL = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640"><path fill="#FFFFFF" d="M320 576C461.4 576 576 461.4 576 320C576 178.6 461.4 64 320 64C178.6 64 64 178.6 64 320C64 461.4 178.6 576 320 576zM256 224L384 224C401.7 224 416 238.3 416 256L416 384C416 401.7 401.7 416 384 416L256 416C238.3 416 224 401.7 224 384L224 256C224 238.3 238.3 224 256 224z"/></svg>"""
 SVG_UPDATEBTN = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640"><path fill="#63E6BE" d="M384 64C366.3 64 352 78.3 352 96C352 113.7 366.3 128 384 128L466.7 128L265.3 329.4C252.8 341.9 252.8 362.2 265.3 374.7C277.8 387.2 298.1 387.2 310.6 374.7L512 173.3L512 256C512 273.7 526.3 288 544 288C561.7 288 576 273.7 576 256L576 96C576 78.3 561.7 64 544 64L384 64zM144 160C99.8 160 64 195.8 64 240L64 496C64 540.2 99.8 576 144 576L400 576C444.2 576 480 540.2 480 496L480 416C480 398.3 465.7 384 448 384C430.3 384 416 398.3 416 416L416 496C416 504.8 408.8 512 400 512L144 512C135.2 512 128 504.8 128 496L128 240C128 231.2 135.2 224 144 224L224 224C241.7 224 256 209.7 256 192C256 174.3 241.7 160 224 160L144 160z"/></svg>"""
 
 
-def svg_to_icon(svg_str: str, size: int = 64, color: str = "#FFFFFF") -> QIcon:
-    """Render embedded SVG string to a QIcon of given size. color currently assumed baked in SVG."""
-    # Use QSvgRenderer to render into QPixmap
-    renderer = QSvgRenderer(bytearray(svg_str, encoding="utf-8"))
-    pix = QPixmap(size, size)
-    pix.fill(Qt.transparent)
-    painter = QPainter(pix)
-    renderer.render(painter)
-    painter.end()
-    return QIcon(pix)
+class IconCache:
+    """Vorgerenderte SVG-Icons, Schlüssel (svg, size, color, devicePixelRatio).
 
+    Jedes SVG wird nur einmal geparst und pro Größe/Farbe/DPR nur einmal
+    gerastert; Zustandswechsel (Play/Pause usw.) tauschen danach nur noch
+    fertige Pixmaps. color=None behält die Farben aus dem SVG, sonst wird
+    die Form in dieser Farbe eingefärbt."""
 
+    def __init__(self):
+        self._renderers = {}   # svg -> QSvgRenderer
+        self._pixmaps = {}     # (svg, size, color, dpr) -> QPixmap
+        self._icons = {}       # (svg, size, color, dpr) -> QIcon
 
-def make_default_cover(size=256, text="Cover"):
-    pix = QPixmap(size, size)
+    @staticmethod
+    def device_pixel_ratio():
+        app = QApplication.instance()
+        return app.devicePixelRatio() if app is not None else 1.0
+
+    def _renderer(self, svg):
+        renderer = self._renderers.get(svg)
+        if renderer is None:
+            from PySide6.QtSvg import QSvgRenderer
+            renderer = QSvgRenderer(bytearray(svg, encoding="utf-8"))
+            self._renderers[svg] = renderer
+        return renderer
+
+    def pixmap(self, svg, size=64, color=None, dpr=None):
+        dpr = dpr or self.device_pixel_ratio()
+        key = (svg, size, color, dpr)
+        pix = self._pixmaps.get(key)
+        if pix is None:
+            pix = QPixmap(round(size * dpr), round(size * dpr))
+            pix.fill(Qt.transparent)
+            painter = QPainter(pix)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._renderer(svg).render(painter)
+            if color is not None:
+                # Einfärben: nur dort malen, wo das Icon schon deckt
+                painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+                painter.fillRect(pix.rect(), QColor(color))
+            painter.end()
+            pix.setDevicePixelRatio(dpr)
+            self._pixmaps[key] = pix
+        return pix
+
+    def icon(self, svg, size=64, color=None, dpr=None):
+        dpr = dpr or self.device_pixel_ratio()
+        key = (svg, size, color, dpr)
+        icon = self._icons.get(key)
+        if icon is None:
+            icon = self._icons[key] = QIcon(self.pixmap(svg, size, color, dpr))
+        return icon
+
+    def warm_up(self, entries):
+        """Rendert (svg, size[, color]) im Voraus, z. B. während des Splash-Screens."""
+        for entry in entries:
+            self.icon(*entry)
+
+
+icons = IconCache()
+
+
+def svg_to_icon(svg_str: str, size: int = 64, color: str | None = None) -> QIcon:
+    """Icon aus eingebettetem SVG (gecacht); color färbt das Icon ein, None = Farben aus dem SVG."""
+    return icons.icon(svg_str, size, color)
+
+
+def svg_to_pixmap(svg_str: str, size: int = 64, color: str | None = None) -> QPixmap:
+    return icons.pixmap(svg_str, size, color)
+
+
+DEFAULT_COVER_COLOR = "#2563eb"
+_COVER_CACHE_MAX = 512
+_cover_cache = OrderedDict()   # (size, text, color, dpr) -> QPixmap
+
+
+@lru_cache(maxsize=2048)
+def placeholder_color(seed):
+    """Feste Farbe pro Sender/Album: gleicher seed -> gleiche Farbe, auch über Neustarts."""
+    if not seed:
+        return DEFAULT_COVER_COLOR
+    hue = int.from_bytes(hashlib.md5(seed.encode("utf-8")).digest()[:2], "big") % 360
+    return QColor.fromHsv(hue, 170, 200).name()
+
+
+def make_default_cover(size=256, text="Cover", seed=None):
+    """Platzhalter-Cover, einmal pro (size, text, Farbe, DPR) gemalt und danach geteilt.
+
+    seed (z. B. Sendername oder Album-Ordner) wählt eine eigene Farbe."""
+    color = placeholder_color(seed)
+    dpr = IconCache.device_pixel_ratio()
+    key = (size, text, color, dpr)
+    pix = _cover_cache.get(key)
+    if pix is not None:
+        _cover_cache.move_to_end(key)
+        return pix
+
+    pix = QPixmap(round(size * dpr), round(size * dpr))
+    pix.setDevicePixelRatio(dpr)
     pix.fill(Qt.transparent)
 
     p = QPainter(pix)
@@ -139,7 +672,7 @@ def make_default_cover(size=256, text="Cover"):
 
     # Hintergrundrechteck
     p.setPen(Qt.NoPen)
-    p.setBrush(QColor("#2563eb"))
+    p.setBrush(QColor(color))
     p.drawRoundedRect(10, 10, size - 20, size - 20, 8, 8)
 
     # Text
@@ -151,26 +684,2442 @@ def make_default_cover(size=256, text="Cover"):
     elided_text = fm.elidedText(text, Qt.ElideRight, size - 20)  # Text passt in Rechteck
 
     p.setPen(QColor("#ffffff"))
-    p.drawText(pix.rect(), Qt.AlignCenter, elided_text)
+    p.drawText(QRect(0, 0, size, size), Qt.AlignCenter, elided_text)
 
     p.end()
+    _cover_cache[key] = pix
+    if len(_cover_cache) > _COVER_CACHE_MAX:
+        _cover_cache.popitem(last=False)
     return pix
 
-def get_latest_version():
-    """Prüft das neueste Release auf GitHub."""
-    url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+def _load_json_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_file_atomic(path, data):
+    """Schreibt data (bytes) über eine temporäre Datei mit fsync und os.replace.
+
+    Nach einem Absturz liegt entweder die alte oder die neue Datei vor, nie eine halbe."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _save_json_cache(cache_path, data):
+    try:
+        write_file_atomic(cache_path, json.dumps(data).encode("utf-8"))
+    except OSError as e:
+        print("Cache speichern fehlgeschlagen:", cache_path, e)
+
+
+# ---------------- Einstellungen ----------------
+class SettingsStore(QObject):
+    """player_settings.json und die Playlist, gebündelt und atomar geschrieben.
+
+    schedule()/set() merken Änderungen nur vor; geschrieben wird erst nach
+    delay_ms Ruhe, ein gezogener Schieberegler kostet so einen Schreibvorgang
+    statt hunderte. Die Playlist steht getrennt in playlist.m3u8 (ein Pfad pro
+    Zeile): neue Titel am Ende werden nur angehängt, Entfernen oder Leeren
+    schreibt die Datei neu. Die kleinen Einstellungen bleiben so billig."""
+
+    PLAYLIST_HEADER = "#EXTM3U\n"
+
+    def __init__(self, path=CONFIG_PATH, playlist_path=PLAYLIST_PATH, defaults=None, delay_ms=500, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.playlist_path = playlist_path
+        self.data = dict(defaults or {})
+        self._dirty = False
+        self._legacy_playlist = None      # "last_playlist" aus alten Einstellungen
+        self._playlist_source = None      # liefert die aktuelle Playlist (Liste von Pfaden)
+        self._playlist_saved = 0          # so viele Einträge stehen schon in der Datei
+        self._playlist_rewrite = False
+        self._playlist_dirty = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    # ---- Einstellungen ----
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+        except FileNotFoundError:
+            return self.data
+        except (OSError, ValueError) as e:
+            print("ERROR loading settings:", e)
+            return self.data
+        if isinstance(loaded, dict):
+            # ältere Versionen hatten die Playlist mit in den Einstellungen
+            legacy = loaded.pop("last_playlist", None)
+            if legacy is not None:
+                self._legacy_playlist = list(legacy)
+                self._dirty = True
+            self.data.update(loaded)
+            print("DEBUG: Settings erfolgreich geladen:", len(loaded), "Einträge")
+        return self.data
+
+    def set(self, key, value):
+        if self.data.get(key) != value:
+            self.data[key] = value
+            self.schedule()
+
+    def update(self, values):
+        changed = False
+        for key, value in values.items():
+            if self.data.get(key) != value:
+                self.data[key] = value
+                changed = True
+        if changed:
+            self.schedule()
+
+    def schedule(self):
+        """Merkt eine Änderung vor; geschrieben wird nach kurzer Ruhe."""
+        self._dirty = True
+        self._timer.start()
+
+    # ---- Playlist ----
+    def load_playlist(self):
+        """Pfade der gespeicherten Playlist (oder der alten last_playlist)."""
+        if self._legacy_playlist is not None and not os.path.exists(self.playlist_path):
+            self._playlist_rewrite = self._playlist_dirty = True
+            return list(self._legacy_playlist)
+        try:
+            with open(self.playlist_path, "r", encoding="utf-8") as f:
+                paths = [line.rstrip("\n") for line in f if line.strip() and not line.startswith("#")]
+        except OSError:
+            return []
+        self._playlist_saved = len(paths)
+        return paths
+
+    def watch_playlist(self, model):
+        """Speichert die Playlist eines PlaylistModel bei jeder Änderung (gebündelt)."""
+        self._playlist_source = lambda: model.paths
+        model.rowsInserted.connect(self._on_playlist_inserted)
+        model.rowsRemoved.connect(self._on_playlist_rewritten)
+        model.modelReset.connect(self._on_playlist_rewritten)
+        model.renamed.connect(self._on_playlist_rewritten)
+
+    def _on_playlist_inserted(self, parent, first, last):
+        if first < self._playlist_saved:
+            self._playlist_rewrite = True     # nicht am Ende eingefügt
+        self._playlist_dirty = True
+        self._timer.start()
+
+    def _on_playlist_rewritten(self, *args):
+        self._playlist_rewrite = self._playlist_dirty = True
+        self._timer.start()
+
+    # ---- Schreiben ----
+    def flush(self):
+        """Schreibt anstehende Änderungen sofort (z. B. beim Beenden)."""
+        self._timer.stop()
+        if self._dirty:
+            self._dirty = False
+            try:
+                data = json.dumps(self.data, indent=2, ensure_ascii=False).encode("utf-8")
+                write_file_atomic(self.path, data)
+            except OSError as e:
+                print("Save settings failed:", e)
+        if self._playlist_dirty and self._playlist_source is not None:
+            self._playlist_dirty = False
+            try:
+                self._write_playlist(list(self._playlist_source()))
+            except OSError as e:
+                print("Playlist speichern fehlgeschlagen:", e)
+
+    def mark_playlist_saved(self):
+        """Die Datei entspricht schon der Playlist (z. B. direkt nach dem Wiederherstellen)."""
+        if self._playlist_source is not None and self._legacy_playlist is None:
+            self._playlist_saved = len(self._playlist_source())
+            self._playlist_rewrite = self._playlist_dirty = False
+
+    def _write_playlist(self, paths):
+        if self._playlist_rewrite or len(paths) < self._playlist_saved or not os.path.exists(self.playlist_path):
+            text = self.PLAYLIST_HEADER + "".join(p + "\n" for p in paths)
+            write_file_atomic(self.playlist_path, text.encode("utf-8"))
+            self._playlist_rewrite = False
+        elif len(paths) > self._playlist_saved:
+            with open(self.playlist_path, "a", encoding="utf-8") as f:
+                f.write("".join(p + "\n" for p in paths[self._playlist_saved:]))
+                f.flush()
+                os.fsync(f.fileno())
+        self._playlist_saved = len(paths)
+
+
+def get_latest_version(url=UPDATE_API_URL, cache_path=UPDATE_CACHE_PATH, ttl=UPDATE_CHECK_TTL):
+    """Prüft das neueste Release auf GitHub.
+
+    Das Ergebnis wird ttl Sekunden zwischengespeichert, danach wird mit
+    If-None-Match nachgefragt (304 = unverändert, zählt nicht gegen das API-Limit)."""
+    cached = _load_json_cache(cache_path) if cache_path else {}
+    if cached.get("url") != url:
+        cached = {}
+    if cached.get("tag_name") and time.time() - cached.get("checked_at", 0) < ttl:
+        return cached["tag_name"]
+
+    import requests  # erst hier, das spart beim Start ~100 ms
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
     try:
-        resp = requests.get(url, timeout=5)
-        if resp.status_code == 200:
+        resp = requests.get(url, headers=headers, timeout=5)
+        if resp.status_code == 304 and cached.get("tag_name"):
+            tag = cached["tag_name"]
+        elif resp.status_code == 200:
             data = resp.json()
-            return data.get("tag_name", APP_VERSION)  # z. B. "v0.1.46"
+            tag = data.get("tag_name", APP_VERSION)  # z. B. "v0.1.46"
+            cached["etag"] = resp.headers.get("ETag")
+        else:
+            return cached.get("tag_name", APP_VERSION)
+        cached.update({"url": url, "tag_name": tag, "checked_at": time.time()})
+        if cache_path:
+            _save_json_cache(cache_path, cached)
+        return tag
     except Exception as e:
         print("Update-Check fehlgeschlagen:", e)
-    return APP_VERSION  # fallback: aktuelle Version
+    return cached.get("tag_name", APP_VERSION)  # fallback: letzte bekannte / aktuelle Version
+
 
-def is_update_available():
-    latest = get_latest_version().lstrip("v")  # 'v0.1.46' → '0.1.46'
-    return FORCE_UPDATE_CHECK or version.parse(latest) > version.parse(APP_VERSION)
+def is_update_available(latest=None):
+    from packaging import version
+
+    if latest is None:
+        latest = get_latest_version()
+    latest = latest.lstrip("v")  # 'v0.1.46' → '0.1.46'
+    try:
+        return FORCE_UPDATE_CHECK or version.parse(latest) > version.parse(APP_VERSION)
+    except version.InvalidVersion:
+        return FORCE_UPDATE_CHECK
+
+
+class _UpdateCheckJob(QRunnable):
+    def __init__(self, checker):
+        super().__init__()
+        self.checker = checker
+
+    def run(self):
+        latest = get_latest_version(self.checker.url, self.checker.cache_path, self.checker.ttl)
+        self.checker.finished.emit(latest)
+
+
+class UpdateChecker(QObject):
+    """Führt den Update-Check im Hintergrund aus und meldet die neueste Version."""
+    finished = Signal(str)  # tag_name, z. B. "v0.1.8"
+
+    def __init__(self, url=UPDATE_API_URL, cache_path=UPDATE_CACHE_PATH, ttl=UPDATE_CHECK_TTL, parent=None):
+        super().__init__(parent)
+        self.url = url
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.latest = None  # Ergebnis, sobald der Check fertig ist
+        self.finished.connect(self._remember)
+
+    def _remember(self, latest):
+        self.latest = latest
+
+    def start(self):
+        QThreadPool.globalInstance().start(_UpdateCheckJob(self))
+
+
+# ---------------- Cover & Tags (auch aus Worker-Threads nutzbar) ----------------
+
+def _scaled(img: QImage, size: int) -> QImage:
+    return img.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _read_file_bytes(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+TRACK_METADATA_CACHE = 4096     # so viele geparste Dateien bleiben im Speicher
+ART_SCAN_SLACK = 256 * 1024     # so viel Tag-Bereich darf neben dem Bild noch liegen (Padding, MP4-Atome)
+SIDECAR_COVERS = ("cover.jpg", "folder.jpg", "front.jpg", "cover.png", "folder.png")
+
+# Tag-Namen je Format: ID3, MP4, Vorbis-Kommentar/APE, ASF
+_TAG_NAMES = {
+    "title": ("TIT2", "\xa9nam", "title", "Title"),
+    "artist": ("TPE1", "\xa9ART", "artist", "Artist", "Author"),
+    "album": ("TALB", "\xa9alb", "album", "Album", "WM/AlbumTitle"),
+}
+
+
+class TrackMetadata:
+    """Alles, was der Player über eine Datei wissen will, aus einem einzigen Parse.
+
+    Titel, Interpret, Album, Dauer (ms), ReplayGain (dB, None = nicht gesetzt) und die
+    Lage des Covers: art_path/art_offset/art_length zeigen auf die rohen Bilddaten, in
+    der Datei selbst oder in einem Bild daneben. Liegt das Bild nur kodiert vor (Ogg,
+    unsynchronisiertes ID3, data:-URL von VLC), ist art_offset -1 und cover() parst neu."""
+    __slots__ = ("path", "mtime_ns", "size", "title", "artist", "album", "duration_ms",
+                 "track_gain", "album_gain", "art_path", "art_offset", "art_length")
+
+    def __init__(self, path, mtime_ns=0, size=0):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.title = self.artist = self.album = ""
+        self.duration_ms = 0
+        self.track_gain = self.album_gain = None
+        self.art_path = None
+        self.art_offset = self.art_length = 0
+
+    def __repr__(self):
+        return f"TrackMetadata({self.path!r}, title={self.title!r}, artist={self.artist!r})"
+
+    @property
+    def display_title(self):
+        """'Titel — Interpret' aus den Tags, sonst der Dateiname."""
+        return f"{self.title} — {self.artist}" if self.title else os.path.basename(self.path)
+
+    def tags(self):
+        return {"title": self.title, "artist": self.artist, "album": self.album,
+                "duration_ms": self.duration_ms}
+
+    def cover(self, engine=None) -> bytes | None:
+        """Unveränderte Bilddaten des Covers oder None. Liest nur den Bildbereich."""
+        if self.art_path is None:
+            return None
+        if self.art_offset < 0:
+            data, _ = _locate_art(self.path, engine)
+            return data
+        try:
+            with open(self.art_path, "rb") as f:
+                f.seek(self.art_offset)
+                data = f.read(self.art_length)
+        except OSError:
+            return None
+        return data if len(data) == self.art_length else None
+
+    def _set_art(self, data, path=None, offset=None, head=0):
+        """Merkt sich, wo data in path (Standard: die Datei selbst) steht."""
+        self.art_path = path or self.path
+        self.art_length = len(data)
+        self.art_offset = _find_bytes(self.art_path, data, head) if offset is None else offset
+
+
+def _find_bytes(path, data, head=0):
+    """Position von data in der Datei oder -1 (z. B. wenn die Tags sie umkodieren).
+
+    Gesucht wird nur im Tag-Bereich: am Anfang (head Bytes, z. B. die ID3-Größe,
+    mindestens Bild plus ART_SCAN_SLACK) und ebenso weit vor dem Ende (MP4, APE).
+    Die Audiodaten dazwischen werden nicht gelesen."""
+    import mmap
+    span = len(data) + ART_SCAN_SLACK
+    needle = data[:256]
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            head = min(max(head, span), len(m))
+            regions = [(0, head)]
+            if len(m) > head:
+                regions.append((max(head, len(m) - span), len(m)))
+            for start, end in regions:
+                pos = m.find(needle, start, end)
+                while pos >= 0:
+                    if m[pos:pos + len(data)] == data:
+                        return pos
+                    pos = m.find(needle, pos + 1, end)
+    except (OSError, ValueError):
+        pass
+    return -1
+
+
+def _tag_text(tags, names):
+    for name in names:
+        try:
+            value = tags[name]
+        except Exception:
+            continue
+        if isinstance(value, list):
+            value = value[0] if value else None
+        value = getattr(value, "text", value)       # ID3-Frame
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if isinstance(value, bytes):                # MP4-Freeform
+            value = value.decode("utf-8", "replace")
+        if value:
+            return str(value)
+    return ""
+
+
+def _replay_gain(tags, which):
+    """ReplayGain in dB aus TXXX, Vorbis-Kommentar, APE oder MP4-Freeform."""
+    key = f"replaygain_{which}_gain"
+    text = ""
+    if isinstance(tags, ID3):
+        for frame in tags.getall("TXXX"):
+            if frame.desc.lower() == key and frame.text:
+                text = str(frame.text[0])
+                break
+    else:
+        text = _tag_text(tags, (key, key.upper(), "----:com.apple.iTunes:" + key))
+    try:
+        return float(text.lower().replace("db", "").strip()) if text else None
+    except ValueError:
+        return None
+
+
+def _embedded_art(mf):
+    tags = mf.tags
+    if isinstance(tags, ID3):
+        for frame in tags.getall("APIC"):
+            if frame.data:
+                return bytes(frame.data)
+    pics = getattr(mf, "pictures", None)            # FLAC
+    if pics:
+        return bytes(pics[0].data)
+    if tags is not None:
+        try:
+            covers = tags["covr"]                   # MP4
+        except Exception:
+            covers = None
+        if covers:
+            return bytes(covers[0])
+    return None
+
+
+def _vlc_art(url):
+    """Bilddaten zu einer ArtworkURL von VLC: (daten, pfad) - pfad None bei data:-URLs."""
+    if url.startswith("data:"):
+        try:
+            import base64
+            return base64.b64decode(url.split(",", 1)[1]), None
+        except Exception:
+            return None, None
+    path = url.replace("file://", "") if url.startswith("file://") else url
+    data = _read_file_bytes(path) if os.path.exists(path) else None
+    return data, path
+
+
+def _locate_art(path, engine=None):
+    """Cover neu suchen (eingebettet oder VLC-Artwork): (daten, pfad) oder (None, None)."""
+    try:
+        if MUTAGEN_AVAILABLE:
+            mf = MutagenFile(path)
+            data = _embedded_art(mf) if mf is not None else None
+            return data, path
+        if engine is not None:
+            (url,), _ = engine.read_meta(path, vlc.Meta.ArtworkURL)
+            if url:
+                return _vlc_art(url)
+    except Exception:
+        pass
+    return None, None
+
+
+def _sidecar_cover(path):
+    """Bild daneben: gleichnamiges .jpg/.png oder cover.jpg/folder.jpg im Ordner."""
+    base = os.path.splitext(path)[0]
+    folder = os.path.dirname(path)
+    candidates = [base + ext for ext in (".jpg", ".png", ".jpeg")]
+    candidates += [os.path.join(folder, name) for name in SIDECAR_COVERS]
+    for p in candidates:
+        if os.path.exists(p):
+            data = _read_file_bytes(p)
+            if data:
+                return data, p
+    return None, None
+
+
+@lru_cache(maxsize=TRACK_METADATA_CACHE)
+def _parse_track(path, mtime_ns, size, engine):
+    meta = TrackMetadata(path, mtime_ns, size)
+    art = None
+    if MUTAGEN_AVAILABLE:
+        try:
+            mf = MutagenFile(path)
+            if mf is not None:
+                if mf.tags:
+                    for key, names in _TAG_NAMES.items():
+                        setattr(meta, key, _tag_text(mf.tags, names))
+                    meta.track_gain = _replay_gain(mf.tags, "track")
+                    meta.album_gain = _replay_gain(mf.tags, "album")
+                length = getattr(getattr(mf, "info", None), "length", 0)
+                if length:
+                    meta.duration_ms = int(length * 1000)
+                art = _embedded_art(mf)
+                if art:
+                    # ID3 kennt seine Größe, das Bild liegt dann sicher davor
+                    meta._set_art(art, head=getattr(mf.tags, "size", 0) if isinstance(mf.tags, ID3) else 0)
+        except Exception:
+            pass
+    elif engine is not None:
+        try:
+            (t, a, al, url), duration = engine.read_meta(
+                path, vlc.Meta.Title, vlc.Meta.Artist, vlc.Meta.Album, vlc.Meta.ArtworkURL)
+            meta.title, meta.artist, meta.album = t or "", a or "", al or ""
+            meta.duration_ms = duration
+            if url:
+                art, art_path = _vlc_art(url)
+                if art:
+                    # data:-URLs stehen nicht als Bytes in der Datei
+                    meta._set_art(art, art_path, offset=-1 if art_path is None else 0)
+        except Exception:
+            pass
+    if not art:
+        art, art_path = _sidecar_cover(path)
+        if art:
+            meta._set_art(art, art_path, offset=0)
+    return meta
+
+
+def read_track_metadata(path, engine=None, stat=None) -> TrackMetadata:
+    """Parst die Datei einmal und merkt sich das Ergebnis pro (pfad, mtime, größe).
+
+    Playlist-Zeilen, Now-Playing-Anzeige und Bibliothek teilen sich diesen Cache;
+    stat = (mtime_ns, size) spart den stat()-Aufruf, wenn er schon gemacht wurde.
+    Die Engine wird nur ohne mutagen gebraucht (VLC-Parse)."""
+    if stat is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return TrackMetadata(path)
+        stat = (st.st_mtime_ns, st.st_size)
+    return _parse_track(path, stat[0], stat[1], None if MUTAGEN_AVAILABLE else engine)
+
+
+class ThumbnailCache:
+    """Persistenter Cover-Cache unter APPDATA_DIR/thumbs.
+
+    Vorskalierte Bilder (THUMB_SIZES) liegen inhaltsadressiert als <sha1>_<size>.jpg
+    auf der Platte, damit sich alle Titel eines Albums einen Eintrag teilen.
+    index.json ordnet "pfad|mtime|größe" dem Hash (oder "" = kein Cover) und dem
+    Titel zu, so dass bekannte Dateien gar nicht mehr geparst werden müssen.
+    Davor liegt ein kleiner LRU im Speicher. Treffer setzen die mtime der Datei
+    neu, verdrängt wird also die am längsten nicht gebrauchte. Thread-sicher."""
+
+    def __init__(self, directory=THUMB_DIR, max_bytes=THUMB_CACHE_MAX_BYTES, memory_items=512):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._index_path = os.path.join(directory, "index.json")
+        self._lock = threading.RLock()
+        self._index = None              # lazy, erst beim ersten Zugriff laden
+        self._memory = OrderedDict()    # (digest, size) -> QImage
+        self._disk_bytes = None
+        self._dirty = 0
+        self._touched = set()           # (digest, size), deren mtime schon erneuert ist
+
+    # ---- Index ----
+    def _ensure_loaded(self):
+        if self._index is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._index = OrderedDict()
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                self._index.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def preload(self):
+        with self._lock:
+            self._ensure_loaded()
+
+    @staticmethod
+    def file_key(path):
+        st = os.stat(path)
+        return f"{path}|{st.st_mtime_ns}|{st.st_size}"
+
+    def save(self):
+        with self._lock:
+            if self._index is None or not self._dirty:
+                return
+            # alte Einträge abschneiden, damit der Index nicht endlos wächst
+            while len(self._index) > 200_000:
+                self._index.popitem(last=False)
+            try:
+                write_file_atomic(self._index_path, json.dumps(self._index, ensure_ascii=False).encode("utf-8"))
+                self._dirty = 0
+            except OSError as e:
+                print("Thumbnail-Index speichern fehlgeschlagen:", e)
+
+    # ---- Bilder ----
+    def _thumb_path(self, digest, size):
+        return os.path.join(self.directory, f"{digest}_{size}.jpg")
+
+    def _remember(self, digest, size, img):
+        self._memory[(digest, size)] = img
+        self._memory.move_to_end((digest, size))
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _touch(self, digest, size):
+        """Erneuert die mtime (Basis der Verdrängung), einmal pro Sitzung und Bild."""
+        with self._lock:
+            if (digest, size) in self._touched:
+                return
+            self._touched.add((digest, size))
+        try:
+            os.utime(self._thumb_path(digest, size))
+        except OSError:
+            pass
+
+    def _load(self, digest, size):
+        stored = size if size in THUMB_SIZES else max(THUMB_SIZES)
+        with self._lock:
+            img = self._memory.get((digest, stored))
+            if img is not None:
+                self._memory.move_to_end((digest, stored))
+        if img is None:
+            img = QImage(self._thumb_path(digest, stored))
+            if img.isNull():
+                return None
+            with self._lock:
+                self._remember(digest, stored, img)
+        self._touch(digest, stored)
+        return img if stored == size else _scaled(img, size)
+
+    def _store_image(self, data):
+        digest = hashlib.sha1(data).hexdigest()
+        # gleiches Cover schon vorhanden (z. B. Album)? Die Verdrängung löscht einzelne
+        # Größen, also nur die fehlenden neu erzeugen
+        missing = [size for size in THUMB_SIZES if not os.path.exists(self._thumb_path(digest, size))]
+        if not missing:
+            return digest
+        img = QImage()
+        if not img.loadFromData(data):
+            return ""
+        written = 0
+        for size in missing:
+            thumb = _scaled(img, size)
+            target = self._thumb_path(digest, size)
+            # gleiches Cover kann parallel aus mehreren Titeln eines Albums kommen:
+            # jeder schreibt seine eigene Temp-Datei, nur die erste wird übernommen
+            tmp = f"{target}.{threading.get_ident()}.tmp"
+            if thumb.save(tmp, "JPG", 90):
+                with self._lock:
+                    if os.path.exists(target):
+                        os.remove(tmp)
+                    else:
+                        written += os.path.getsize(tmp)
+                        os.replace(tmp, target)
+                        self._touched.add((digest, size))
+            with self._lock:
+                self._remember(digest, size, thumb)
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += written
+        self._evict_if_needed()
+        return digest
+
+    def _evict_if_needed(self):
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(
+                    e.stat().st_size for e in os.scandir(self.directory) if e.name.endswith(".jpg"))
+            if self._disk_bytes <= self.max_bytes:
+                return
+            # am längsten nicht gebrauchte Thumbnails löschen, bis wir bei 90 % des Limits sind
+            entries = sorted(
+                (e for e in os.scandir(self.directory) if e.name.endswith(".jpg")),
+                key=lambda e: e.stat().st_mtime)
+            for e in entries:
+                if self._disk_bytes <= self.max_bytes * 0.9:
+                    break
+                try:
+                    size = e.stat().st_size
+                    os.remove(e.path)
+                    self._disk_bytes -= size
+                    digest, _, stored = e.name[:-4].rpartition("_")
+                    self._touched.discard((digest, int(stored)))
+                except OSError:
+                    pass
+
+    def fetch(self, path, size, engine=None):
+        """Liefert (QImage oder None, titel). Unbekannte Dateien werden einmal
+        geparst, danach reicht ein stat() und das kleine Thumbnail."""
+        try:
+            key = self.file_key(path)
+        except OSError:
+            return None, os.path.basename(path)
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._index.get(key)
+        if entry is not None:
+            digest, title = entry
+            if not digest:
+                return None, title
+            img = self._load(digest, size)
+            if img is not None:
+                return img, title
+            # Thumbnail wurde verdrängt -> neu erzeugen
+
+        meta = read_track_metadata(path, engine)
+        data = meta.cover(engine)
+        digest = self._store_image(data) if data else ""
+        title = meta.display_title
+        with self._lock:
+            self._index[key] = [digest, title]
+            self._dirty += 1
+            flush = self._dirty >= 200
+        if flush:
+            self.save()
+        return (self._load(digest, size) if digest else None), title
+
+
+class _MetadataJob(QRunnable):
+    def __init__(self, loader, path):
+        super().__init__()
+        self.loader = loader
+        self.path = path
+
+    def run(self):
+        image, title = QImage(), os.path.basename(self.path)
+        try:
+            img, title = self.loader.cache.fetch(self.path, self.loader.size, self.loader.engine)
+            if img is not None:
+                image = img
+        except Exception as e:
+            print("Metadaten-Job fehlgeschlagen:", self.path, e)
+        finally:
+            # Signal wird in den GUI-Thread gequeued
+            self.loader._job_done.emit(self.path, image, title)
+
+
+class MetadataLoader(QObject):
+    """Liest Cover und Titel für Playlist-Zeilen in einem begrenzten Thread-Pool.
+
+    Es laufen nie mehr als max_workers Jobs gleichzeitig, der Rest wartet in einer
+    Warteschlange und kann per cancel()/retain() wieder verworfen werden."""
+    loaded = Signal(str, QImage, str)  # path, cover (leer = kein Cover), titel
+    _job_done = Signal(str, QImage, str)
+
+    def __init__(self, cache, engine=None, size=52, max_workers=4, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.engine = engine
+        self.size = size
+        self.max_workers = max(1, max_workers)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(self.max_workers)
+        self._pending = OrderedDict()   # path -> None, Reihenfolge = Priorität
+        self._running = set()
+        self._cancelled = set()
+        self._job_done.connect(self._on_job_done)
+
+    def request(self, path, urgent=False):
+        if path in self._running:
+            self._cancelled.discard(path)
+            return
+        if path not in self._pending:
+            self._pending[path] = None
+        if urgent:
+            self._pending.move_to_end(path, last=False)
+        self._pump()
+
+    def cancel(self, path):
+        self._pending.pop(path, None)
+        if path in self._running:
+            self._cancelled.add(path)
+
+    def cancel_all(self):
+        self._pending.clear()
+        self._cancelled.update(self._running)
+
+    def retain(self, paths):
+        """Verwirft alle wartenden Jobs, die nicht in paths sind (z. B. weggescrollt)."""
+        keep = set(paths)
+        for p in [p for p in self._pending if p not in keep]:
+            del self._pending[p]
+
+    def _pump(self):
+        while self._pending and len(self._running) < self.max_workers:
+            path, _ = self._pending.popitem(last=False)
+            self._running.add(path)
+            self.pool.start(_MetadataJob(self, path))
+
+    def _on_job_done(self, path, image, title):
+        self._running.discard(path)
+        if path in self._cancelled:
+            self._cancelled.discard(path)
+        else:
+            self.loaded.emit(path, image, title)
+        self._pump()
+
+    def shutdown(self):
+        self.cancel_all()
+        self.pool.waitForDone(2000)
+
+
+# ---------------- Bibliothek ----------------
+class DirectoryScanner:
+    """Durchsucht Ordnerbäume mit os.scandir in mehreren Threads.
+
+    Jeder Ordner ist eine Aufgabe in einer gemeinsamen Warteschlange, gefundene
+    Unterordner kommen wieder hinein; so teilen sich die Worker auch einen einzigen
+    tiefen Baum. Die Treffer eines Ordners gehen sortiert an on_files, das aus den
+    Worker-Threads aufgerufen wird. Am meisten bringt das auf Netzlaufwerken, wo
+    jedes Verzeichnislisting vor allem Wartezeit ist."""
+
+    def __init__(self, workers=SCAN_WORKERS, with_stat=False, extensions=SUPPORTED_FORMATS):
+        self.workers = max(1, workers)
+        self.with_stat = with_stat      # (pfad, mtime_ns, größe, inode) statt nur pfad
+        self.extensions = extensions
+        self._cond = threading.Condition()
+        self._dirs = deque()
+        self._pending = 0               # Ordner in der Warteschlange oder in Arbeit
+        self._closed = False
+        self._cancelled = False
+        self.files = 0
+        self.dirs_done = 0
+        self.started = None
+
+    def add(self, roots):
+        """Weitere Ordner in einen laufenden Scan; False, wenn er schon ausläuft."""
+        with self._cond:
+            if self._closed or self._cancelled:
+                return False
+            for root in roots:
+                self._dirs.append(root)
+                self._pending += 1
+            self._cond.notify_all()
+            return True
+
+    def cancel(self):
+        with self._cond:
+            self._cancelled = True
+            self._dirs.clear()
+            self._cond.notify_all()
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def progress(self):
+        with self._cond:
+            elapsed = time.perf_counter() - self.started if self.started else 0.0
+            return {"files": self.files, "dirs_done": self.dirs_done, "dirs_pending": self._pending,
+                    "files_per_sec": self.files / elapsed if elapsed > 0 else 0.0,
+                    "seconds": elapsed, "cancelled": self._cancelled}
+
+    def run(self, roots, on_files):
+        """Scannt roots (blockierend) und liefert am Ende progress()."""
+        self.started = time.perf_counter()
+        self.add(roots)
+        threads = [threading.Thread(target=self._work, args=(on_files,), daemon=True)
+                   for _ in range(self.workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return self.progress()
+
+    def _work(self, on_files):
+        while True:
+            with self._cond:
+                while not self._dirs and self._pending and not self._cancelled:
+                    self._cond.wait()
+                if self._cancelled or not self._pending:
+                    self._closed = True
+                    self._cond.notify_all()
+                    return
+                folder = self._dirs.popleft()
+            subdirs, found = self._list(folder)
+            if found and not self._cancelled:
+                on_files(found)
+            with self._cond:
+                self._dirs.extend(subdirs)
+                self._pending += len(subdirs) - 1
+                self.dirs_done += 1
+                self.files += len(found)
+                self._cond.notify_all()
+
+    def _list(self, folder):
+        subdirs, found = [], []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(self.extensions):
+                            if self.with_stat:
+                                st = entry.stat()
+                                found.append((entry.path, st.st_mtime_ns, st.st_size, entry.inode()))
+                            else:
+                                found.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        subdirs.sort()
+        found.sort()
+        return subdirs, found
+
+
+class _FolderScanJob(QRunnable):
+    def __init__(self, owner, scanner, roots):
+        super().__init__()
+        self.owner = owner
+        self.scanner = scanner
+        self.roots = roots
+
+    def run(self):
+        stats = {}
+        try:
+            stats = self.scanner.run(self.roots, self.owner._collect)
+        except Exception as e:
+            print("Ordner-Scan fehlgeschlagen:", e)
+        finally:
+            self.owner._job_done.emit(stats)
+
+
+class FolderScanner(QObject):
+    """Importiert Ordner im Hintergrund und liefert die Treffer gebündelt im GUI-Thread:
+    alle FLUSH_MS ein Paket von höchstens BATCH_MAX Pfaden, ein Rückstau wird über
+    mehrere Durchläufe der Ereignisschleife verteilt. Ordner, die während eines Scans
+    dazukommen, laufen im selben Scan mit."""
+    batch_ready = Signal(list)      # Pfade, pro Ordner sortiert
+    progress = Signal(object)       # Zähler aus DirectoryScanner.progress
+    finished = Signal(object)       # dito, plus "roots"
+    _job_done = Signal(object)
+    FLUSH_MS = 100
+    BATCH_MAX = 2000
+
+    def __init__(self, workers=SCAN_WORKERS, parent=None):
+        super().__init__(parent)
+        self.workers = workers
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._scanner = None
+        self._result = None             # Zähler des fertigen Scans, bis der Puffer geleert ist
+        self._roots = []
+        self._queued = []               # Ordner für den nächsten Scan
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.FLUSH_MS)
+        self._timer.timeout.connect(self._flush)
+        self._job_done.connect(self._on_job_done)
+
+    @property
+    def active(self):
+        return self._scanner is not None
+
+    def scan(self, roots):
+        roots = [os.path.abspath(r) for r in roots]     # gleiche Schreibweise wie Bibliothek und FolderWatcher
+        if self._scanner is None:
+            self._start(roots)
+        elif self._scanner.add(roots):
+            self._roots.extend(roots)
+        else:
+            self._queued.extend(roots)
+
+    def _start(self, roots):
+        self._scanner = DirectoryScanner(self.workers)
+        self._roots = roots
+        self.pool.start(_FolderScanJob(self, self._scanner, roots))
+        self._timer.start()
+
+    def _collect(self, paths):
+        # Worker-Threads: nur puffern, abgeholt wird vom Timer im GUI-Thread
+        with self._lock:
+            self._buffer.extend(paths)
+
+    def _flush(self):
+        with self._lock:
+            paths = self._buffer[:self.BATCH_MAX]
+            del self._buffer[:self.BATCH_MAX]
+            backlog = bool(self._buffer)
+        if paths:
+            self.batch_ready.emit(paths)
+        if backlog:
+            QTimer.singleShot(0, self._flush)
+        elif self._result is not None:
+            self._finish()
+            return
+        if self._scanner is not None:
+            self.progress.emit(self._scanner.progress())
+
+    def cancel(self):
+        self._queued = []
+        if self._scanner is not None:
+            self._scanner.cancel()
+        with self._lock:
+            self._buffer = []
+
+    def _on_job_done(self, stats):
+        if stats.get("cancelled"):
+            with self._lock:
+                self._buffer = []
+        self._timer.stop()
+        self._result = stats    # finished erst, wenn der Puffer leer ist
+        self._flush()
+
+    def _finish(self):
+        stats, self._result = self._result, None
+        self._scanner = None
+        self.finished.emit(dict(stats, roots=self._roots))
+        queued, self._queued = self._queued, []
+        if queued:
+            self._start(queued)
+
+    def shutdown(self):
+        self.cancel()
+        self.pool.waitForDone(2000)
+
+
+def _match_moves(added, removed):
+    """Paart verschwundene und neue Dateien mit gleicher Inode, Größe und mtime
+    (verschoben/umbenannt). Die Paare werden aus beiden dicts entfernt und als
+    [(neu, alt)] geliefert."""
+    by_stat = {st: p for p, st in removed.items() if st[2]}
+    moves = []
+    for path, st in list(added.items()):
+        old = by_stat.pop(st, None)
+        if old is not None and old != path:
+            moves.append((path, old))
+            del added[path]
+            del removed[old]
+    return moves
+
+
+def _outermost(roots):
+    """Entfernt Ordner, die schon in einem anderen Ordner der Liste stecken."""
+    result = []
+    for root in sorted(set(roots), key=len):
+        if not any(root == r or root.startswith(r.rstrip(os.sep) + os.sep) for r in result):
+            result.append(root)
+    return result
+
+
+class MediaLibrary:
+    """Musikbibliothek in SQLite (library.db): Titel, Alben, Interpreten, Cover-Verweise.
+
+    Zu jeder Datei stehen mtime, Größe und Inode in der Tabelle. sync() vergleicht
+    nur diese stat()-Werte und liest Tags ausschließlich von neuen oder geänderten
+    Dateien; verschobene Dateien (gleiche Inode, Größe und mtime) werden umbenannt
+    statt neu geparst. Cover-Verweise sind der SHA-1 der Bilddaten, derselbe
+    Schlüssel, unter dem ThumbnailCache die Vorschaubilder ablegt.
+    Eine Verbindung für alle Threads hinter einem Lock; sqlite3 wird erst beim
+    ersten Zugriff importiert."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS artists (
+            id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS albums (
+            id INTEGER PRIMARY KEY, artist_id INTEGER REFERENCES artists(id), title TEXT NOT NULL,
+            UNIQUE (artist_id, title));
+        CREATE TABLE IF NOT EXISTS artwork (
+            id INTEGER PRIMARY KEY, digest TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS tracks (
+            path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, inode INTEGER NOT NULL,
+            title TEXT, artist_id INTEGER REFERENCES artists(id), album_id INTEGER REFERENCES albums(id),
+            artwork_id INTEGER REFERENCES artwork(id), duration_ms INTEGER);
+        CREATE INDEX IF NOT EXISTS tracks_album ON tracks(album_id);
+        CREATE TABLE IF NOT EXISTS roots (
+            path TEXT PRIMARY KEY, synced_at REAL);
+    """
+    BATCH = 500     # so viele Dateien pro Transaktion
+
+    def __init__(self, path=LIBRARY_PATH, engine=None):
+        self.path = path
+        self.engine = engine
+        self._lock = threading.RLock()
+        self._db = None
+        self._ids = {}      # ("artist", name) / ("album", artist_id, titel) / ("artwork", digest) -> id
+
+    def _conn(self):
+        if self._db is None:
+            import sqlite3
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(self.SCHEMA)
+            self._db = db
+        return self._db
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+                self._ids.clear()
+
+    # ---- Ordner ----
+    def roots(self):
+        with self._lock:
+            return [r for r, in self._conn().execute("SELECT path FROM roots")]
+
+    def _rows_under(self, db, root):
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        rows = db.execute("SELECT path, mtime_ns, size, inode FROM tracks WHERE path >= ? AND path < ?",
+                          (prefix, upper))
+        return {path: (mtime, size, inode) for path, mtime, size, inode in rows}
+
+    # ---- Abgleich ----
+    def sync(self, roots=None, cancelled=None):
+        """Gleicht die Ordner (Standard: alle bekannten) mit der Platte ab und merkt sie sich.
+
+        Nicht erreichbare Ordner bleiben unangetastet. Liefert Zähler: files, parsed,
+        renamed, removed, seconds und die abgeglichenen roots (abgebrochen: cancelled)."""
+        start = time.perf_counter()
+        roots = [r for r in _outermost(os.path.abspath(r) for r in (self.roots() if roots is None else roots))
+                 if self._reachable(r)]
+        chunks = []
+        scanner = DirectoryScanner(with_stat=True)
+
+        def collect(found):
+            chunks.append(found)
+            if cancelled is not None and cancelled():
+                scanner.cancel()
+
+        scanner.run(roots, collect)
+        seen = {path: (mtime, size, inode) for chunk in chunks for path, mtime, size, inode in chunk}
+        if scanner.cancelled or (cancelled is not None and cancelled()):
+            # unvollständiger Scan: fehlende Dateien wären sonst "gelöscht"
+            return {"files": len(seen), "parsed": 0, "renamed": 0, "removed": 0,
+                    "seconds": time.perf_counter() - start, "roots": roots, "cancelled": True}
+        with self._lock:
+            db = self._conn()
+            known = {}
+            for root in roots:
+                known.update(self._rows_under(db, root))
+
+        added = {p: st for p, st in seen.items() if known.get(p) != st}
+        gone = {p: st for p, st in known.items() if p not in seen}
+        renamed = _match_moves(added, gone)
+        parsed, complete = self.apply(added, gone, renamed, cancelled)
+        if complete:
+            with self._lock, db:
+                db.executemany("INSERT OR REPLACE INTO roots(path, synced_at) VALUES (?, ?)",
+                               ((r, time.time()) for r in roots))
+
+        return {"files": len(seen), "parsed": parsed, "renamed": len(renamed), "removed": len(gone),
+                "seconds": time.perf_counter() - start, "roots": roots}
+
+    @staticmethod
+    def _reachable(root):
+        """Nicht eingehängte, getrennte oder gesperrte Ordner auslassen: der Scanner
+        überspringt Lesefehler still, ihr Inhalt gälte sonst als gelöscht."""
+        try:
+            with os.scandir(root):
+                return True
+        except OSError as e:
+            print("Bibliothek: Ordner nicht erreichbar, übersprungen:", root, e)
+            return False
+
+    def apply(self, added, removed, renamed, cancelled=None):
+        """Übernimmt Änderungen: added {pfad: stat} wird (neu) gelesen, removed gelöscht,
+        renamed [(neu, alt)] nur umbenannt. Liefert (gelesen, vollständig)."""
+        with self._lock:
+            db = self._conn()
+            with db:
+                # eine verschobene Datei kann eine andere überschrieben haben
+                db.executemany("DELETE FROM tracks WHERE path = ?", ((new,) for new, _ in renamed))
+                db.executemany("UPDATE tracks SET path = ? WHERE path = ?", renamed)
+                db.executemany("DELETE FROM tracks WHERE path = ?", ((p,) for p in removed))
+                if removed:
+                    self._drop_orphans(db)
+
+        fresh = list(added)
+        parsed = 0
+        for i in range(0, len(fresh), self.BATCH):
+            if cancelled is not None and cancelled():
+                return parsed, False
+            batch = []
+            for p in fresh[i:i + self.BATCH]:
+                meta = read_track_metadata(p, self.engine, added[p][:2])
+                cover = meta.cover(self.engine)
+                batch.append((p, added[p], meta.tags(), hashlib.sha1(cover).hexdigest() if cover else ""))
+            with self._lock, db:
+                for path, st, tags, digest in batch:
+                    self._store(db, path, st, tags, digest)
+            parsed += len(batch)
+        return parsed, True
+
+    def _id(self, db, key, select, insert, params):
+        id_ = self._ids.get(key)
+        if id_ is None:
+            row = db.execute(select, params).fetchone()
+            id_ = row[0] if row else db.execute(insert, params).lastrowid
+            self._ids[key] = id_
+        return id_
+
+    def _store(self, db, path, st, tags, digest):
+        artist_id = album_id = artwork_id = None
+        if tags["artist"]:
+            artist_id = self._id(db, ("artist", tags["artist"]),
+                                 "SELECT id FROM artists WHERE name = ?",
+                                 "INSERT INTO artists(name) VALUES (?)", (tags["artist"],))
+        if tags["album"]:
+            album_id = self._id(db, ("album", artist_id, tags["album"]),
+                                "SELECT id FROM albums WHERE artist_id IS ? AND title = ?",
+                                "INSERT INTO albums(artist_id, title) VALUES (?, ?)", (artist_id, tags["album"]))
+        if digest:
+            artwork_id = self._id(db, ("artwork", digest),
+                                  "SELECT id FROM artwork WHERE digest = ?",
+                                  "INSERT INTO artwork(digest) VALUES (?)", (digest,))
+        db.execute("INSERT OR REPLACE INTO tracks(path, mtime_ns, size, inode, title, artist_id, album_id, "
+                   "artwork_id, duration_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                   (path, *st, tags["title"], artist_id, album_id, artwork_id, tags["duration_ms"]))
+
+    def _drop_orphans(self, db):
+        db.execute("DELETE FROM albums WHERE id NOT IN (SELECT album_id FROM tracks WHERE album_id IS NOT NULL)")
+        db.execute("DELETE FROM artists WHERE id NOT IN (SELECT artist_id FROM tracks WHERE artist_id IS NOT NULL) "
+                   "AND id NOT IN (SELECT artist_id FROM albums WHERE artist_id IS NOT NULL)")
+        db.execute("DELETE FROM artwork WHERE id NOT IN (SELECT artwork_id FROM tracks WHERE artwork_id IS NOT NULL)")
+        self._ids.clear()
+
+    # ---- Abfragen ----
+    def track(self, path):
+        """Gespeicherte Daten einer Datei (dict) oder None, wenn unbekannt."""
+        with self._lock:
+            row = self._conn().execute(
+                "SELECT t.title, ar.name, al.title, t.duration_ms, aw.digest, t.mtime_ns, t.size "
+                "FROM tracks t LEFT JOIN artists ar ON ar.id = t.artist_id "
+                "LEFT JOIN albums al ON al.id = t.album_id LEFT JOIN artwork aw ON aw.id = t.artwork_id "
+                "WHERE t.path = ?", (os.path.abspath(path),)).fetchone()
+        if row is None:
+            return None
+        keys = ("title", "artist", "album", "duration_ms", "artwork", "mtime_ns", "size")
+        return dict(zip(keys, row))
+
+    def texts(self, paths):
+        """Suchtext (Titel, Interpret, Album) je bekanntem Pfad."""
+        result = {}
+        paths = list(paths)
+        with self._lock:
+            db = self._conn()
+            for i in range(0, len(paths), self.BATCH):
+                chunk = paths[i:i + self.BATCH]
+                rows = db.execute(
+                    "SELECT t.path, t.title, ar.name, al.title FROM tracks t "
+                    "LEFT JOIN artists ar ON ar.id = t.artist_id LEFT JOIN albums al ON al.id = t.album_id "
+                    f"WHERE t.path IN ({','.join('?' * len(chunk))})", chunk)
+                for path, *fields in rows:
+                    text = " ".join(f for f in fields if f)
+                    if text:
+                        result[path] = text
+        return result
+
+    def counts(self):
+        with self._lock:
+            db = self._conn()
+            return {table: db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    for table in ("tracks", "albums", "artists", "artwork")}
+
+
+class _LibrarySyncJob(QRunnable):
+    def __init__(self, owner, roots, changes=None):
+        super().__init__()
+        self.owner = owner
+        self.roots = roots
+        self.changes = changes
+
+    def run(self):
+        stats = {}
+        library, cancelled = self.owner.library, self.owner._cancel.is_set
+        try:
+            if self.changes is None:
+                stats = library.sync(self.roots, cancelled=cancelled)
+            else:
+                ch = self.changes
+                library.apply({**ch["added"], **ch["modified"]}, ch["removed"], ch["renamed"], cancelled)
+        except Exception as e:
+            print("Bibliothek-Abgleich fehlgeschlagen:", e)
+        finally:
+            if self.changes is None:
+                self.owner._job_done.emit(stats)
+
+
+class _LibraryTextsJob(QRunnable):
+    def __init__(self, owner, paths):
+        super().__init__()
+        self.owner = owner
+        self.paths = paths
+
+    def run(self):
+        texts = {}
+        try:
+            texts = self.owner.library.texts(self.paths)
+        except Exception as e:
+            print("Bibliothek lesen fehlgeschlagen:", e)
+        finally:
+            self.owner.texts_ready.emit(texts)
+
+
+class LibrarySync(QObject):
+    """Gleicht die Bibliothek im Hintergrund ab, immer nur ein Lauf gleichzeitig.
+    Ordner, die während eines Laufs dazukommen, werden danach in einem Rutsch abgeglichen.
+    apply() übernimmt einzelne Änderungen (FolderWatcher) ohne Abgleich, in Reihenfolge."""
+    finished = Signal(object)   # Zähler aus MediaLibrary.sync
+    texts_ready = Signal(object)    # pfad -> Suchtext, Antwort auf fetch_texts()
+    _job_done = Signal(object)
+
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._cancel = threading.Event()
+        self._running = False
+        self._queued = []           # Ordner für den nächsten Lauf
+        self._queued_all = False    # danach alle bekannten Ordner abgleichen
+        self._job_done.connect(self._on_job_done)
+
+    def start(self, roots=None):
+        """Ohne roots werden alle bekannten Ordner abgeglichen."""
+        if self._running:
+            if roots is None:
+                self._queued_all = True
+            else:
+                self._queued.extend(roots)
+            return
+        self._running = True
+        self.pool.start(_LibrarySyncJob(self, None if roots is None else list(roots)))
+
+    def apply(self, changes):
+        """changes wie FolderWatcher.changed; läuft im selben Thread hinter einem Abgleich."""
+        self.pool.start(_LibrarySyncJob(self, None, changes))
+
+    def fetch_texts(self, paths):
+        self.pool.start(_LibraryTextsJob(self, list(paths)))
+
+    def _on_job_done(self, stats):
+        self._running = False
+        if stats:
+            print("Bibliothek: {files} Dateien, {parsed} gelesen, {renamed} verschoben, "
+                  "{removed} entfernt ({seconds:.2f} s)".format(**stats))
+            self.finished.emit(stats)
+        queued_all, queued = self._queued_all, self._queued
+        self._queued_all, self._queued = False, []
+        if self._cancel.is_set():
+            return
+        if queued_all:
+            self.start()
+        elif queued:
+            self.start(queued)
+
+    def shutdown(self):
+        self._cancel.set()
+        self.pool.waitForDone(2000)
+        self.library.close()
+
+
+def _snapshot_dir(folder):
+    """(mtime_ns, {name: (mtime_ns, größe, inode)} der Audiodateien, [unterordner])
+    oder None, wenn der Ordner nicht (mehr) lesbar ist."""
+    try:
+        mtime = os.stat(folder).st_mtime_ns     # vor dem Listing: spätere Änderungen fallen beim nächsten Mal auf
+        files, subdirs = {}, []
+        with os.scandir(folder) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name.lower().endswith(SUPPORTED_FORMATS):
+                        st = entry.stat()
+                        files[entry.name] = (st.st_mtime_ns, st.st_size, entry.inode())
+                except OSError:
+                    pass
+    except OSError:
+        return None
+    return mtime, files, subdirs
+
+
+class _WatchScanJob(QRunnable):
+    def __init__(self, watcher, folders, known, mtimes=None, initial=False):
+        super().__init__()
+        self.watcher = watcher
+        self.folders = folders
+        self.known = known      # schon erfasste Ordner: neue Unterordner werden komplett gelesen
+        self.mtimes = mtimes    # Polling: nur Ordner mit anderer mtime neu lesen
+        self.initial = initial  # erster Schnappschuss eines Ordners, nichts melden
+
+    def run(self):
+        result = {}
+        try:
+            stack = list(self.folders)
+            while stack:
+                folder = stack.pop()
+                if self.mtimes is not None and folder in self.mtimes:
+                    try:
+                        if os.stat(folder).st_mtime_ns == self.mtimes[folder]:
+                            continue
+                    except OSError:
+                        pass
+                snap = _snapshot_dir(folder)
+                result[folder] = snap
+                if snap is not None:
+                    stack.extend(p for p in (os.path.join(folder, name) for name in snap[2])
+                                 if p not in self.known and p not in result)
+        except Exception as e:
+            print("Ordner-Überwachung fehlgeschlagen:", e)
+        finally:
+            self.watcher._scanned.emit(result, self.initial)
+
+
+class FolderWatcher(QObject):
+    """Beobachtet Bibliotheksordner und meldet neue, geänderte, gelöschte und
+    verschobene Audiodateien, ohne den ganzen Baum neu zu scannen.
+
+    Pro Ordner liegt ein Schnappschuss (mtime, Dateien mit stat, Unterordner) im
+    Speicher. QFileSystemWatcher (inotify bzw. ReadDirectoryChangesW) meldet, welcher
+    Ordner sich geändert hat; nur der wird nach kurzer Pause neu gelesen und mit dem
+    Schnappschuss verglichen. Ordner, die der Watcher nicht annimmt (Limit erreicht),
+    werden alle POLL_MS per mtime geprüft, alle paar Runden auch der Rest, weil
+    Netzlaufwerke fremde Änderungen oft gar nicht melden."""
+    changed = Signal(object)    # {"added": {pfad: stat}, "modified": {pfad: stat}, "removed": {pfad: stat}, "renamed": [(neu, alt)]}
+    _scanned = Signal(object, bool)
+    DEBOUNCE_MS = 300
+    POLL_MS = 10_000
+    FULL_POLL_EVERY = 6         # jede 6. Runde alle Ordner prüfen
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from PySide6.QtCore import QFileSystemWatcher
+        self.roots = []
+        self._snap = {}             # ordner -> (mtime_ns, dateien, unterordner)
+        self._unwatched = set()     # vom Watcher abgelehnt -> nur Polling
+        self._dirty = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)      # Ergebnisse kommen in Auftragsreihenfolge
+        self._scanned.connect(self._on_scanned)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._rescan_dirty)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(self.POLL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+        self._polls = 0
+
+    def watch(self, roots):
+        """Nimmt Ordner in die Beobachtung auf (bereits erfasste werden übersprungen)."""
+        fresh = [r for r in (os.path.abspath(r) for r in roots) if r not in self._snap]
+        if not fresh:
+            return
+        self.roots = _outermost(self.roots + fresh)
+        self.pool.start(_WatchScanJob(self, fresh, set(self._snap), initial=True))
+        self._poll_timer.start()
+
+    def root_of(self, path):
+        for root in self.roots:
+            if path.startswith(root.rstrip(os.sep) + os.sep):
+                return root
+        return None
+
+    def _on_directory_changed(self, folder):
+        self._dirty.add(folder)
+        self._debounce.start()
+
+    def _rescan_dirty(self):
+        folders, self._dirty = list(self._dirty), set()
+        self.pool.start(_WatchScanJob(self, folders, set(self._snap)))
+
+    def _poll(self):
+        self._polls += 1
+        full = self._polls % self.FULL_POLL_EVERY == 0
+        folders = list(self._snap) if full else list(self._unwatched)
+        if folders:
+            self.pool.start(_WatchScanJob(self, folders, set(self._snap),
+                                          {f: self._snap[f][0] for f in folders if f in self._snap}))
+
+    def _drop_tree(self, folder, removed):
+        """Vergisst folder samt Unterordnern und sammelt deren Dateien in removed."""
+        stack = [folder]
+        gone = []
+        while stack:
+            f = stack.pop()
+            snap = self._snap.pop(f, None)
+            if snap is None:
+                continue
+            gone.append(f)
+            removed.update((os.path.join(f, name), st) for name, st in snap[1].items())
+            stack.extend(os.path.join(f, name) for name in snap[2])
+        watched = [f for f in gone if f not in self._unwatched]
+        if watched:
+            self._watcher.removePaths(watched)
+        self._unwatched.difference_update(gone)
+
+    def _on_scanned(self, result, initial):
+        added, modified, removed = {}, {}, {}
+        new_dirs = []
+        for folder, snap in result.items():
+            old = self._snap.get(folder)
+            if snap is None:
+                self._drop_tree(folder, removed)
+                continue
+            _, files, subdirs = snap
+            if old is None:
+                new_dirs.append(folder)
+                old_files, old_subdirs = {}, ()
+            else:
+                _, old_files, old_subdirs = old
+            for name, st in files.items():
+                prev = old_files.get(name)
+                if prev is None:
+                    added[os.path.join(folder, name)] = st
+                elif prev != st:
+                    modified[os.path.join(folder, name)] = st
+            for name, st in old_files.items():
+                if name not in files:
+                    removed[os.path.join(folder, name)] = st
+            self._snap[folder] = snap
+            for name in old_subdirs:
+                if name not in subdirs:
+                    self._drop_tree(os.path.join(folder, name), removed)
+        if new_dirs:
+            failed = self._watcher.addPaths(new_dirs)
+            self._unwatched.update(failed)
+        if initial or not (added or modified or removed):
+            return      # erster Schnappschuss: die Bibliothek wurde gerade abgeglichen
+        renamed = _match_moves(added, removed)
+        self.changed.emit({"added": added, "modified": modified, "removed": removed, "renamed": renamed})
+
+    def shutdown(self):
+        self._poll_timer.stop()
+        self._debounce.stop()
+        self.pool.waitForDone(2000)
+
+
+# ---------------- Stream-Prüfung ----------------
+_STREAM_CODECS = {
+    "audio/mpeg": "MP3", "audio/mp3": "MP3",
+    "audio/aac": "AAC", "audio/x-aac": "AAC", "audio/aacp": "AAC+",
+    "audio/ogg": "Ogg", "application/ogg": "Ogg", "audio/opus": "Opus",
+    "audio/flac": "FLAC", "audio/x-flac": "FLAC",
+    "application/vnd.apple.mpegurl": "HLS", "audio/x-mpegurl": "M3U", "audio/x-scpls": "PLS",
+}
+
+
+def _parse_response_head(head):
+    """Statuszeile + Header; akzeptiert 'HTTP/1.x 200 OK' und Shoutcasts 'ICY 200 OK'."""
+    lines = head.decode("latin-1").split("\r\n")
+    parts = lines[0].split(None, 2)
+    if len(parts) < 2 or not (parts[0].startswith("HTTP/") or parts[0] == "ICY"):
+        raise ValueError(f"keine HTTP/ICY-Antwort: {lines[0][:60]!r}")
+    headers = {}
+    for line in lines[1:]:
+        key, sep, value = line.partition(":")
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+def _stream_info_from_headers(headers):
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    info = {
+        "content_type": content_type,
+        "codec": _STREAM_CODECS.get(content_type, content_type or None),
+        "bitrate": None,
+        "samplerate": None,
+        "name": headers.get("icy-name") or None,
+        "genre": headers.get("icy-genre") or None,
+        "metaint": None,
+    }
+    # ice-audio-info: bitrate=128;channels=2;samplerate=44100
+    for item in headers.get("ice-audio-info", "").split(";"):
+        key, _, value = item.partition("=")
+        key = key.strip().lower().replace("ice-", "")
+        if key in ("bitrate", "samplerate") and value.strip().isdigit():
+            info[key] = int(value)
+    br = headers.get("icy-br", "").split(",")[0].strip()
+    if br.isdigit():
+        info["bitrate"] = int(br)
+    sr = headers.get("icy-sr", "").strip()
+    if sr.isdigit():
+        info["samplerate"] = int(sr)
+    metaint = headers.get("icy-metaint", "").strip()
+    if metaint.isdigit():
+        info["metaint"] = int(metaint)
+    return info
+
+
+def open_stream(url, timeout=STREAM_PROBE_TIMEOUT, max_redirects=3):
+    """Öffnet einen Stream, folgt Weiterleitungen und liest den Antwortkopf.
+
+    Bewusst über einen rohen Socket statt http.client: Shoutcast-v1-Server
+    antworten mit 'ICY 200 OK', das http.client ablehnt. Gibt
+    (socket, status, headers, bereits gelesene Body-Bytes, finale URL, connect_ms)
+    zurück; den Socket schließt der Aufrufer. Wirft OSError/ValueError."""
+    import socket
+    import ssl
+    from urllib.parse import urlsplit, urljoin
+
+    for _ in range(max_redirects + 1):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"nicht unterstützte URL: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        hop = time.perf_counter()
+        sock = socket.create_connection((parts.hostname, port), timeout=timeout)
+        try:
+            if parts.scheme == "https":
+                sock = ssl.create_default_context().wrap_socket(sock, server_hostname=parts.hostname)
+            connect_ms = (time.perf_counter() - hop) * 1000
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+            sock.sendall((f"GET {path} HTTP/1.0\r\nHost: {host}\r\n"
+                          f"User-Agent: {APP_NAME}/{APP_VERSION}\r\nIcy-MetaData: 1\r\n"
+                          "Accept: */*\r\nConnection: close\r\n\r\n").encode("latin-1"))
+            buf = b""
+            while b"\r\n\r\n" not in buf:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    raise ValueError("Verbindung ohne Antwort geschlossen")
+                buf += chunk
+                if len(buf) > 65536:
+                    raise ValueError("Antwort-Header zu groß")
+            head, _, body = buf.partition(b"\r\n\r\n")
+            status, headers = _parse_response_head(head)
+        except BaseException:
+            sock.close()
+            raise
+        if status in (301, 302, 303, 307, 308) and headers.get("location"):
+            sock.close()
+            url = urljoin(url, headers["location"])
+            continue
+        return sock, status, headers, body, url, connect_ms
+    raise ValueError("zu viele Weiterleitungen")
+
+
+def probe_stream(url, timeout=STREAM_PROBE_TIMEOUT, max_redirects=3):
+    """Verbindet sich mit einem Stream und misst Verbindungsaufbau und erstes Audio-Byte.
+
+    connect_ms ist der TCP/TLS-Aufbau zum letzten Server, first_byte_ms die
+    Zeit vom Start bis zum ersten Audio-Byte (inklusive Weiterleitungen)."""
+    result = {"url": url, "final_url": url, "ok": False, "status": None,
+              "connect_ms": None, "first_byte_ms": None, "error": None, "checked": time.time()}
+    start = time.perf_counter()
+    try:
+        sock, status, headers, body, result["final_url"], result["connect_ms"] = \
+            open_stream(url, timeout, max_redirects)
+        try:
+            result["status"] = status
+            result.update(_stream_info_from_headers(headers))
+            if not 200 <= status < 300:
+                raise ValueError(f"HTTP {status}")
+            if not body:
+                body = sock.recv(1)
+            if not body:
+                raise ValueError("keine Audiodaten")
+            result["first_byte_ms"] = (time.perf_counter() - start) * 1000
+            result["ok"] = True
+        finally:
+            sock.close()
+    except (OSError, ValueError) as e:
+        result["error"] = str(e) or e.__class__.__name__
+    return result
+
+
+class _ProbeJob(QRunnable):
+    def __init__(self, prober, url):
+        super().__init__()
+        self.prober = prober
+        self.url = url
+
+    def run(self):
+        result = probe_stream(self.url, self.prober.timeout)
+        self.prober._job_done.emit(self.url, result)
+
+
+class StreamProber(QObject):
+    """Prüft Stream-URLs im Hintergrund und merkt sich die Ergebnisse (mit TTL).
+
+    Wie beim MetadataLoader laufen höchstens max_workers Prüfungen gleichzeitig,
+    der Rest wartet in einer Warteschlange. Die Ergebnisse landen in
+    stream_probe.json und gelten ttl Sekunden."""
+    probed = Signal(str, object)  # url, Ergebnis (dict, siehe probe_stream)
+    _job_done = Signal(str, object)
+
+    FAST_MS = 800   # bis hierhin gilt ein Stream als schnell
+
+    def __init__(self, cache_path=STREAM_PROBE_CACHE_PATH, ttl=STREAM_PROBE_TTL,
+                 timeout=STREAM_PROBE_TIMEOUT, max_workers=8, parent=None):
+        super().__init__(parent)
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(self.max_workers)
+        self._results = _load_json_cache(cache_path) if cache_path else {}
+        self._pending = OrderedDict()   # url -> None
+        self._running = set()
+        self._job_done.connect(self._on_job_done)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self.save)
+
+    def result(self, url):
+        """Letztes Ergebnis für url, solange es jünger als ttl ist, sonst None."""
+        result = self._results.get(url)
+        if result is not None and time.time() - result.get("checked", 0) < self.ttl:
+            return result
+        return None
+
+    def health(self, url):
+        """'fast', 'slow', 'dead' oder None (noch nicht geprüft)."""
+        result = self.result(url)
+        if result is None:
+            return None
+        if not result.get("ok"):
+            return "dead"
+        return "fast" if result["first_byte_ms"] <= self.FAST_MS else "slow"
+
+    def probe(self, urls, force=False):
+        for url in urls:
+            if not url or url in self._running or url in self._pending:
+                continue
+            if not force and self.result(url) is not None:
+                continue
+            self._pending[url] = None
+        self._pump()
+
+    def best_url(self, urls):
+        """Schnellste funktionierende URL (bekannte Ergebnisse), sonst die erste."""
+        ranked = [(r["first_byte_ms"], i) for i, r in enumerate(map(self.result, urls))
+                  if r is not None and r.get("ok")]
+        return urls[min(ranked)[1]] if ranked else urls[0]
+
+    def _pump(self):
+        while self._pending and len(self._running) < self.max_workers:
+            url, _ = self._pending.popitem(last=False)
+            self._running.add(url)
+            self.pool.start(_ProbeJob(self, url))
+
+    def _on_job_done(self, url, result):
+        self._running.discard(url)
+        self._results[url] = result
+        self._save_timer.start()
+        self.probed.emit(url, result)
+        self._pump()
+
+    def cancel_all(self):
+        self._pending.clear()
+
+    def save(self):
+        if not self.cache_path:
+            return
+        now = time.time()
+        fresh = {url: r for url, r in self._results.items() if now - r.get("checked", 0) < self.ttl}
+        self._results = fresh
+        _save_json_cache(self.cache_path, fresh)
+
+    def shutdown(self):
+        self.cancel_all()
+        self.pool.waitForDone(2000)
+        self.save()
+
+
+# ---------------- Stream-Metadaten (ICY) ----------------
+def parse_icy_metadata(block):
+    """Zerlegt einen ICY-Metadatenblock ("StreamTitle='...';StreamUrl='...';") in ein dict.
+
+    block darf bytes oder memoryview sein; dekodiert wird nur dieser kleine
+    Block, nie die Audiodaten. Werte dürfen selbst ';' oder "'" enthalten,
+    deshalb wird nach "';" getrennt statt nach ';'."""
+    text = bytes(block).rstrip(b"\0").decode("utf-8", "replace")
+    fields = {}
+    for part in text.split("';"):
+        key, sep, value = part.partition("='")
+        if sep:
+            fields[key.strip()] = value
+    return fields
+
+
+def split_stream_title(text):
+    """'Interpret - Titel' -> (interpret, titel); ohne Trenner ist alles Titel."""
+    text = " ".join((text or "").split())
+    artist, sep, title = text.partition(" - ")
+    if sep and artist and title:
+        return artist, title
+    return "", text
+
+
+class IcyMetadataParser:
+    """Trennt einen Shoutcast/Icecast-Datenstrom (icy-metaint) in Audio und Metadaten.
+
+    feed() nimmt beliebig zerstückelte Chunks und liefert die Audio-Anteile als
+    memoryview-Ausschnitte des übergebenen Puffers zurück (keine Kopie). Nur ein
+    Metadatenblock, der über eine Chunk-Grenze reicht, wird zusammengesetzt
+    (höchstens 16 * 255 Bytes). Neue Metadaten gehen an on_meta(dict)."""
+
+    def __init__(self, metaint, on_meta=None):
+        self.metaint = metaint
+        self.on_meta = on_meta
+        self._audio_left = metaint   # Audio-Bytes bis zum nächsten Längenbyte
+        self._meta_left = 0          # noch fehlende Bytes des aktuellen Metadatenblocks
+        self._meta = bytearray()
+        self.last = {}
+
+    def feed(self, data):
+        view = memoryview(data)
+        audio = []
+        pos, end = 0, len(view)
+        while pos < end:
+            if self._meta_left:
+                take = min(self._meta_left, end - pos)
+                self._meta += view[pos:pos + take]
+                self._meta_left -= take
+                pos += take
+                if not self._meta_left:
+                    self._emit(self._meta)
+                    self._meta = bytearray()
+            elif self._audio_left:
+                take = min(self._audio_left, end - pos)
+                audio.append(view[pos:pos + take])
+                self._audio_left -= take
+                pos += take
+            else:
+                length = view[pos] * 16
+                pos += 1
+                self._audio_left = self.metaint
+                if length and end - pos >= length:
+                    # häufigster Fall: Block liegt komplett im Chunk
+                    self._emit(view[pos:pos + length])
+                    pos += length
+                else:
+                    self._meta_left = length
+        return audio
+
+    def _emit(self, block):
+        fields = parse_icy_metadata(block)
+        if fields and fields != self.last:
+            self.last = fields
+            if self.on_meta is not None:
+                self.on_meta(fields)
+
+
+class StationHistory:
+    """Zuletzt gespielte Titel je Sender, pro Sender ein Ringpuffer fester Länge."""
+
+    def __init__(self, maxlen=20):
+        self.maxlen = maxlen
+        self._tracks = {}   # sender -> deque[(zeit, interpret, titel)]
+
+    def add(self, station, artist, title):
+        """Merkt sich einen Titel; gibt False zurück, wenn er schon der letzte war."""
+        tracks = self._tracks.get(station)
+        if tracks is None:
+            tracks = self._tracks[station] = deque(maxlen=self.maxlen)
+        if tracks and tracks[-1][1:] == (artist, title):
+            return False
+        tracks.append((time.time(), artist, title))
+        return True
+
+    def recent(self, station):
+        """Titel des Senders, der neueste zuerst."""
+        return list(reversed(self._tracks.get(station, ())))
+
+
+# ---------------- Time-Shift ----------------
+class TimeshiftBuffer:
+    """Ringpuffer auf der Platte: segments Dateien à segment_size Bytes, per mmap beschrieben.
+
+    Positionen sind absolute Byte-Offsets seit Aufnahmebeginn, gültig ist
+    [start, end). Ist der Puffer voll, werden die ältesten Daten überschrieben.
+    Ein Schreiber, beliebig viele Leser; read() wartet auf neue Daten."""
+
+    def __init__(self, segment_size=TIMESHIFT_SEGMENT_SIZE, segments=TIMESHIFT_SEGMENTS, directory=None):
+        import mmap
+        import tempfile
+        self.segment_size = segment_size
+        self.capacity = segment_size * segments
+        self.directory = tempfile.mkdtemp(prefix="beyondmusic_timeshift_", dir=directory)
+        self._files = []
+        self._maps = []
+        for i in range(segments):
+            f = open(os.path.join(self.directory, f"segment{i:02d}.bin"), "w+b")
+            f.truncate(segment_size)
+            self._files.append(f)
+            self._maps.append(mmap.mmap(f.fileno(), segment_size))
+        self.start = 0
+        self.end = 0
+        self.closed = False
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        return self.end - self.start
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            segment, offset = divmod(self.end % self.capacity, self.segment_size)
+            n = min(len(view), self.segment_size - offset)
+            with self._cond:
+                # den Bereich zuerst freigeben, dann überschreiben
+                self.start = max(self.start, self.end + n - self.capacity)
+            self._maps[segment][offset:offset + n] = view[:n]
+            view = view[n:]
+            with self._cond:
+                self.end += n
+                self._cond.notify_all()
+
+    def read(self, offset, size=65536, timeout=1.0):
+        """Liest ab offset höchstens size Bytes und gibt (offset, bytes) zurück.
+
+        Liegt offset schon außerhalb des Fensters, wird auf start vorgerückt
+        (der zurückgegebene offset zeigt das). Wartet bis timeout auf neue
+        Daten; b"" heißt: noch nichts da oder Puffer geschlossen."""
+        with self._cond:
+            if offset >= self.end and not self.closed:
+                self._cond.wait_for(lambda: self.end > offset or self.closed, timeout)
+            if self.closed:
+                return offset, b""
+            offset = max(offset, self.start)
+            segment, pos = divmod(offset % self.capacity, self.segment_size)
+            n = min(size, self.end - offset, self.segment_size - pos)
+        if n <= 0:
+            return offset, b""
+        data = self._maps[segment][pos:pos + n]
+        with self._cond:
+            if offset < self.start:
+                # während des Kopierens überschrieben: ab dem neuen Anfang lesen
+                return self.read(self.start, size, timeout)
+        return offset, data
+
+    def export(self, path, start=None):
+        """Schreibt [start, end) in eine Datei und gibt die Anzahl Bytes zurück."""
+        offset = self.start if start is None else max(start, self.start)
+        end = self.end
+        written = 0
+        with open(path, "wb") as f:
+            while offset < end:
+                offset, data = self.read(offset, min(1 << 20, end - offset), timeout=0)
+                if not data:
+                    break
+                f.write(data)
+                offset += len(data)
+                written += len(data)
+        return written
+
+    def close(self):
+        import shutil
+        with self._cond:
+            if self.closed:
+                return
+            self.closed = True
+            self._cond.notify_all()
+        for m in self._maps:
+            m.close()
+        for f in self._files:
+            f.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+_TIMESHIFT_EXTENSIONS = {"MP3": ".mp3", "AAC": ".aac", "AAC+": ".aac", "Ogg": ".ogg", "Opus": ".opus", "FLAC": ".flac"}
+
+
+def _timeshift_supported(url):
+    """Playlists und HLS kann der Mitschnitt nicht lesen, die spielt VLC direkt."""
+    from urllib.parse import urlsplit
+    parts = urlsplit(url)
+    return parts.scheme in ("http", "https") and not parts.path.lower().endswith(
+        (".m3u", ".m3u8", ".pls", ".asx", ".xspf"))
+
+
+class StreamRecorder(QObject):
+    """Time-Shift für einen Sender: liest den Stream selbst mit und reicht ihn an VLC weiter.
+
+    Ein Thread liest den Original-Stream, trennt ICY-Metadaten ab und schreibt
+    das Audio in einen TimeshiftBuffer. VLC spielt von einem lokalen
+    HTTP-Server (local_url) ab einer beliebigen Position im Puffer. Pause hält
+    nur VLC an, die Aufnahme läuft weiter; Fortsetzen und Zurückspulen kommen
+    ohne neue Verbindung zum Sender aus. Kann der Stream nicht mitgelesen
+    werden (Playlist, HLS, Fehler), leitet der lokale Server VLC einfach auf
+    die Original-URL um."""
+    title_changed = Signal(str)   # ICY StreamTitle (kommt aus dem Lese-Thread)
+    failed = Signal(str)          # Verbindung nach dem Start abgerissen (-> reconnect())
+    connected = Signal()          # (wieder) mit dem Sender verbunden
+
+    PREROLL_MS = 1000   # so viel Vorlauf bekommt VLC beim Start auf "live"
+
+    def __init__(self, url, segment_size=TIMESHIFT_SEGMENT_SIZE, segments=TIMESHIFT_SEGMENTS,
+                 timeout=STREAM_PROBE_TIMEOUT, parent=None):
+        super().__init__(parent)
+        self.url = url
+        self.timeout = timeout
+        self.buffer = TimeshiftBuffer(segment_size, segments)
+        self.info = {}
+        self.error = None
+        self.play_offset = 0          # zuletzt an VLC ausgelieferte Position
+        self._ready = threading.Event()
+        self._stopping = False
+        self._finished = False        # kein Neuverbinden mehr: Leser bekommen nach dem Rest das Ende
+        self._sock = None
+        self._server = None
+        self._started_at = None
+        self._reader_id = 0
+
+    # ---- Aufnahme ----
+    def start(self):
+        import socketserver
+
+        recorder = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                recorder._serve(self.request)
+
+        class Server(socketserver.ThreadingTCPServer):
+            daemon_threads = True
+            allow_reuse_address = True
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name="timeshift-server", daemon=True).start()
+        threading.Thread(target=self._record, name="timeshift-record", daemon=True).start()
+
+    def reconnect(self):
+        """Baut die Verbindung zum Sender neu auf; der Puffer bleibt, VLC merkt nur eine Pause."""
+        if not self._stopping and not self._finished:
+            threading.Thread(target=self._record, name="timeshift-record", daemon=True).start()
+
+    def finish(self):
+        """Kein weiterer Versuch: VLC spielt den Puffer zu Ende und bekommt dann das Ende."""
+        self._finished = True
+
+    def _fail(self, message):
+        self.error = message
+        if self._started_at is None:
+            self._ready.set()          # noch nie aufgenommen: VLC wird umgeleitet
+        elif not self._stopping:
+            self.failed.emit(message)
+
+    def _record(self):
+        try:
+            sock, status, headers, body, _, _ = open_stream(self.url, self.timeout)
+        except (OSError, ValueError) as e:
+            self._fail(str(e) or e.__class__.__name__)
+            return
+        info = _stream_info_from_headers(headers)
+        content_type = info["content_type"]
+        if not 200 <= status < 300 or not (content_type.startswith("audio/") or content_type == "application/ogg") \
+                or content_type in ("audio/x-mpegurl", "audio/x-scpls"):
+            sock.close()
+            self._fail(f"nicht aufnehmbar (HTTP {status}, {content_type or 'ohne Typ'})")
+            return
+        self._sock = sock
+        self.info = info
+        self.error = None
+        parser = None
+        if info["metaint"]:
+            parser = IcyMetadataParser(info["metaint"], self._on_icy_meta)
+        sock.settimeout(self.timeout * 3)
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        self._ready.set()
+        self.connected.emit()
+        chunk = body
+        try:
+            while not self._stopping:
+                if chunk:
+                    for view in (parser.feed(chunk) if parser else (chunk,)):
+                        self.buffer.write(view)
+                chunk = sock.recv(16384)
+                if not chunk:
+                    raise ValueError("Stream beendet")
+        except (OSError, ValueError) as e:
+            if not self._stopping:
+                self._fail(str(e) or e.__class__.__name__)
+        finally:
+            sock.close()
+
+    def _on_icy_meta(self, fields):
+        title = fields.get("StreamTitle", "").strip()
+        if title:
+            self.title_changed.emit(title)
+
+    # ---- Auslieferung an VLC ----
+    def local_url(self, offset=None):
+        """URL für VLC; offset=None heißt live (mit kurzem Vorlauf)."""
+        port = self._server.server_address[1]
+        return f"http://127.0.0.1:{port}/stream" + ("" if offset is None else f"?from={int(offset)}")
+
+    def _serve(self, conn):
+        from urllib.parse import urlsplit, parse_qs
+        request = b""
+        while b"\r\n\r\n" not in request and len(request) < 65536:
+            chunk = conn.recv(4096)
+            if not chunk:
+                return
+            request += chunk
+        line = request.split(b"\r\n", 1)[0].split()
+        query = parse_qs(urlsplit(line[1].decode("latin-1") if len(line) > 1 else "/").query)
+        self._ready.wait(self.timeout)
+        try:
+            if self._started_at is None:
+                conn.sendall((f"HTTP/1.0 302 Found\r\nLocation: {self.url}\r\n\r\n").encode("latin-1"))
+                return
+            content_type = self.info["content_type"]
+            conn.sendall((f"HTTP/1.0 200 OK\r\nContent-Type: {content_type}\r\n"
+                          "Cache-Control: no-cache\r\n\r\n").encode("latin-1"))
+            if "from" in query:
+                offset = int(query["from"][0])
+            else:
+                offset = max(self.buffer.start, self.buffer.end - self.ms_to_bytes(self.PREROLL_MS))
+            self._reader_id += 1
+            reader = self._reader_id
+            while not self._stopping:
+                offset, data = self.buffer.read(offset)
+                if data:
+                    conn.sendall(data)
+                    offset += len(data)
+                    if reader == self._reader_id:
+                        self.play_offset = offset
+                elif self.buffer.closed or (self._finished and offset >= self.buffer.end):
+                    break   # aufgegeben: VLC spielt den Rest und bekommt dann das Ende
+        except (OSError, ValueError):
+            pass   # VLC hat die Verbindung geschlossen (Stopp, Sprung) oder der Puffer ist zu
+
+    # ---- Position ----
+    def byte_rate(self):
+        """Bytes pro Sekunde: aus icy-br, sonst aus der bisher gemessenen Datenrate."""
+        if self.info.get("bitrate"):
+            return self.info["bitrate"] * 125
+        if self._started_at is not None and self.buffer.end:
+            elapsed = time.monotonic() - self._started_at
+            if elapsed > 1:
+                return self.buffer.end / elapsed
+        return 16000   # 128 kbit/s
+
+    def ms_to_bytes(self, ms):
+        return int(ms * self.byte_rate() / 1000)
+
+    def window_ms(self):
+        """Länge des zurückspulbaren Fensters."""
+        return len(self.buffer) * 1000 / self.byte_rate()
+
+    def behind_ms(self):
+        """Wie weit die Wiedergabe hinter live liegt (ohne VLCs eigenen Puffer)."""
+        return max(0, self.buffer.end - max(self.play_offset, self.buffer.start)) * 1000 / self.byte_rate()
+
+    def offset_behind(self, ms):
+        """Puffer-Offset ms vor live (auf das Fenster begrenzt)."""
+        return max(self.buffer.start, self.buffer.end - self.ms_to_bytes(ms))
+
+    @property
+    def active(self):
+        """True, sobald tatsächlich mitgeschnitten wird (kein Umleiten auf die Original-URL)."""
+        return self._started_at is not None and not self._stopping
+
+    def suggested_extension(self):
+        return _TIMESHIFT_EXTENSIONS.get(self.info.get("codec"), ".mp3")
+
+    def export(self, path):
+        return self.buffer.export(path)
+
+    def stop(self):
+        self._stopping = True
+        self._ready.set()
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self.buffer.close()
+
+
+# ---------------- Stream-Sitzung ----------------
+class StreamSession(QObject):
+    """Hält einen Sender am Laufen und misst, wie gut das klappt.
+
+    Bricht der Stream ab (Fehler, Ende, kein Fortschritt mehr), wird mit
+    exponentiell wachsender Wartezeit neu verbunden, statt die Wiedergabe zu
+    beenden. Mit Time-Shift verbindet sich nur der Mitschnitt neu, VLC spielt
+    solange aus dem Puffer. Messwerte stehen in metrics."""
+    status_changed = Signal(str)      # Hinweis für die Anzeige, "" = alles in Ordnung
+    metrics_changed = Signal(object)  # dict (siehe metrics)
+    gave_up = Signal(str)             # Grund; danach passiert nichts mehr
+
+    BACKOFF_BASE_MS = 1000
+    BACKOFF_MAX_MS = 30000
+    MAX_ATTEMPTS = 8
+    STABLE_MS = 30000     # so lange ohne Abbruch -> Versuchszähler zurücksetzen
+    STALL_MS = 10000      # so lange ohne Fortschritt -> neu verbinden (ohne Time-Shift)
+
+    def __init__(self, engine, name, url, caching_ms=STREAM_CACHING_MS, recorder=None, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.name = name
+        self.url = url
+        self.recorder = recorder
+        # der Mitschnitt liegt lokal, da reicht VLC ein kleiner Puffer
+        self.caching_ms = TIMESHIFT_CACHING_MS if recorder is not None else caching_ms
+        self.metrics = {
+            "station": name, "url": url, "caching_ms": self.caching_ms,
+            "timeshift": recorder is not None, "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "reconnects": 0, "underruns": 0, "stalls": 0, "errors": 0,
+            "first_audio_ms": None, "last_first_audio_ms": None, "uptime_s": 0,
+        }
+        self._started_at = time.monotonic()
+        self._attempt = 0
+        self._closed = False
+        self._last_position = -1
+        self._last_progress = time.monotonic()
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._reconnect)
+        self._stable_timer = QTimer(self)
+        self._stable_timer.setSingleShot(True)
+        self._stable_timer.setInterval(self.STABLE_MS)
+        self._stable_timer.timeout.connect(self._on_stable)
+        self._watchdog = QTimer(self)
+        self._watchdog.setInterval(1000)
+        self._watchdog.timeout.connect(self._check_progress)
+        events = engine.events
+        events.first_audio.connect(self._on_first_audio, Qt.QueuedConnection)
+        events.buffering_changed.connect(self._on_buffering_changed, Qt.QueuedConnection)
+        if recorder is not None:
+            recorder.failed.connect(self._on_recorder_failed, Qt.QueuedConnection)
+            recorder.connected.connect(self._on_recorder_connected, Qt.QueuedConnection)
+
+    # ---- Wiedergabe ----
+    def play(self, target=None):
+        """Startet (oder springt) die Wiedergabe; target ist z. B. eine Time-Shift-Position."""
+        if target is None:
+            target = self.recorder.local_url() if self.recorder is not None else self.url
+        self._last_progress = time.monotonic()
+        self.engine.play_url(target, self.caching_ms)
+        if self.recorder is None:
+            self._watchdog.start()
+
+    def handle_failure(self, reason):
+        """Engine meldet Ende/Fehler. True = Neuverbinden ist geplant.
+
+        Bei False hat die Sitzung aufgegeben, der Aufrufer beendet die Wiedergabe
+        wie bei einer Datei (gave_up wird dann nicht gesendet)."""
+        if self._closed:
+            return False
+        if reason == "error":
+            self.metrics["errors"] += 1
+        return self._schedule(reason, notify=False)
+
+    def _schedule(self, reason, notify=True):
+        self._stable_timer.stop()
+        if self._attempt >= self.MAX_ATTEMPTS:
+            self._give_up(reason, notify)
+            return False
+        delay = min(self.BACKOFF_MAX_MS, self.BACKOFF_BASE_MS * 2 ** self._attempt)
+        delay = int(delay * random.uniform(0.8, 1.2))   # nicht alle Clients gleichzeitig
+        self._attempt += 1
+        self._watchdog.stop()
+        self._retry_timer.start(delay)
+        self.status_changed.emit(f"Verbindung unterbrochen – neuer Versuch in {delay / 1000:.0f} s "
+                                 f"({self._attempt}/{self.MAX_ATTEMPTS})")
+        return True
+
+    def _reconnect(self):
+        if self._closed:
+            return
+        self.metrics["reconnects"] += 1
+        self._emit_metrics()
+        self.status_changed.emit("Verbinde neu …")
+        if self.recorder is not None and self.recorder.error is not None:
+            self.recorder.reconnect()
+        else:
+            self.play()
+
+    def _give_up(self, reason, notify=True):
+        self._closed = True
+        self._watchdog.stop()
+        if self.recorder is not None:
+            self.recorder.finish()
+        self._emit_metrics()
+        if notify:
+            self.gave_up.emit(reason)
+
+    # ---- Ereignisse ----
+    def _on_first_audio(self, ms):
+        if self._closed:
+            return
+        if self.metrics["first_audio_ms"] is None:
+            self.metrics["first_audio_ms"] = round(ms)
+        self.metrics["last_first_audio_ms"] = round(ms)
+        self._stable_timer.start()
+        self.status_changed.emit("")
+        self._emit_metrics()
+
+    def _on_buffering_changed(self, stalled):
+        if self._closed:
+            return
+        if stalled:
+            self.metrics["underruns"] += 1
+            self._emit_metrics()
+            self.status_changed.emit("Puffern …")
+        else:
+            self.status_changed.emit("")
+
+    def _on_recorder_failed(self, message):
+        if not self._closed:
+            print(f"Stream '{self.name}' abgerissen:", message)
+            self._schedule(message)
+
+    def _on_recorder_connected(self):
+        if not self._closed and self._attempt:
+            self.status_changed.emit("")
+            self._stable_timer.start()
+
+    def _on_stable(self):
+        self._attempt = 0
+        if self.recorder is not None and self.recorder.error is None:
+            self.status_changed.emit("")
+
+    def _check_progress(self):
+        """Ohne Time-Shift: läuft die Position nicht weiter, gilt der Stream als hängend."""
+        if self.engine.state_name not in ("opening", "playing"):
+            self._last_progress = time.monotonic()    # pausiert oder gestoppt: kein Hänger
+            return
+        if self.engine.position != self._last_position:
+            self._last_position = self.engine.position
+            self._last_progress = time.monotonic()
+        elif (time.monotonic() - self._last_progress) * 1000 >= self.STALL_MS:
+            self.metrics["stalls"] += 1
+            self.engine.stop()
+            self._schedule("stall")
+
+    # ---- Messwerte ----
+    def _emit_metrics(self):
+        self.metrics["uptime_s"] = round(time.monotonic() - self._started_at)
+        self.metrics_changed.emit(dict(self.metrics))
+
+    def close(self):
+        """Beendet die Sitzung (ohne die Wiedergabe anzufassen) und gibt die Messwerte zurück."""
+        self._closed = True
+        for timer in (self._retry_timer, self._stable_timer, self._watchdog):
+            timer.stop()
+        events = self.engine.events
+        events.first_audio.disconnect(self._on_first_audio)
+        events.buffering_changed.disconnect(self._on_buffering_changed)
+        self.metrics["uptime_s"] = round(time.monotonic() - self._started_at)
+        return dict(self.metrics)
+
+
+def record_stream_metrics(metrics, path=STREAM_METRICS_PATH, keep=100):
+    """Hängt die Messwerte einer Stream-Sitzung an stream_metrics.json an (letzte keep)."""
+    sessions = load_stream_metrics(path)
+    sessions.append(metrics)
+    try:
+        write_file_atomic(path, json.dumps(sessions[-keep:], indent=2, ensure_ascii=False).encode("utf-8"))
+    except OSError as e:
+        print("Stream-Messwerte speichern fehlgeschlagen:", e)
+
+
+def load_stream_metrics(path=STREAM_METRICS_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            sessions = json.load(f)
+        return sessions if isinstance(sessions, list) else []
+    except (OSError, ValueError):
+        return []
+
+
+def format_stream_metrics(metrics):
+    """Kurzfassung für Tooltip und Info-Tab."""
+    if not metrics:
+        return "Kein Stream"
+    first = metrics.get("first_audio_ms")
+    return (f"{metrics['station']} · Puffer {metrics['caching_ms']} ms"
+            f"{' · Time-Shift' if metrics.get('timeshift') else ''}\n"
+            f"Erstes Audio: {'–' if first is None else f'{first} ms'} · "
+            f"Neu verbunden: {metrics['reconnects']} · Aussetzer: {metrics['underruns']} · "
+            f"Hänger: {metrics['stalls']} · Fehler: {metrics['errors']}")
+
+
+def record_startup_profile(phases, total_ms, path=STARTUP_PROFILE_PATH, keep=50):
+    """Hängt die Dauer der Startphasen an startup_profile.json an (letzte keep Starts)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            runs = json.load(f)
+        if not isinstance(runs, list):
+            runs = []
+    except (OSError, ValueError):
+        runs = []
+    phases = OrderedDict(phases)
+    phases_total = sum(phases.values())
+    runs.append({
+        "version": APP_VERSION,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "phases_ms": {k: round(v, 1) for k, v in phases.items()},
+        "other_ms": round(total_ms - phases_total, 1),  # Splash, Eventloop, Zeichnen
+        "total_ms": round(total_ms, 1),
+    })
+    try:
+        write_file_atomic(path, json.dumps(runs[-keep:], indent=2, ensure_ascii=False).encode("utf-8"))
+    except OSError as e:
+        print("Startprofil speichern fehlgeschlagen:", e)
+
+
+IMPORT_PROFILE_PATH = os.path.join(APPDATA_DIR, "import_profile.json")
+
+
+def write_import_report(top=25, path=IMPORT_PROFILE_PATH):
+    """Misst die Importzeiten von app.py mit 'python -X importtime' und vergleicht
+    sie mit dem zuletzt gespeicherten Bericht einer anderen Version."""
+    import subprocess
+
+    if getattr(sys, "frozen", False):
+        print("Import-Bericht ist nur mit dem Python-Quellcode möglich.")
+        return 1
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=app_dir, capture_output=True, text=True)
+
+    # Zeilen: "import time:  self [us] | cumulative | imported package", Kinder stehen
+    # eingerückt VOR ihrem Eltern-Modul. Gezählt werden die direkten Importe von app.
+    cumulative = {}
+    children = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        label = parts[2][1:]
+        name = label.strip()
+        depth = (len(label) - len(label.lstrip(" "))) // 2
+        if depth == 0:
+            if name == "app":
+                cumulative, total_us = children, int(parts[1])
+            children = {}
+        elif depth == 1:
+            children[name] = int(parts[1])
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            reports = json.load(f)
+    except (OSError, ValueError):
+        reports = {}
+    previous = next((reports[v] for v in reversed(list(reports)) if v != APP_VERSION), None)
+
+    print(f"Importzeit app.py (v{APP_VERSION}): {total_us / 1000:.1f} ms")
+    for name, us in sorted(cumulative.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        line = f"  {name:<40} {us / 1000:8.1f} ms"
+        if previous is not None:
+            old_us = previous["modules_us"].get(name)
+            line += "     (neu)" if old_us is None else f" {(us - old_us) / 1000:+8.1f} ms"
+        print(line)
+    if previous is not None:
+        print(f"Vorher (v{previous['version']}): {previous['total_us'] / 1000:.1f} ms")
+
+    reports[APP_VERSION] = {"version": APP_VERSION, "total_us": total_us, "modules_us": cumulative}
+    write_file_atomic(path, json.dumps(reports, indent=2).encode("utf-8"))
+    print("Bericht gespeichert unter:", path)
+    return proc.returncode
 
 
 # ---------------- SplashScreen (Starting Screen) ----------------
@@ -217,44 +3166,37 @@ class SplashScreen(QWidget):
         painter = QPainter(self.bg_pix)
         painter.setRenderHint(QPainter.Antialiasing)
         path = QPainterPath()
-        path.addRoundedRect(0, 0, self.width(), self.height(), 25, 25)
-        painter.fillPath(path, QColor("#111827"))
-        painter.end()
-
-         # --- SOUND ABSPIELEN ---
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
-
-        root_dir = get_root_path()
-        soundStart_path = os.path.join(root_dir, "assets", "start.mp3")
-        sound_path = Path(soundStart_path).resolve()  # kleine MP3/WAV Datei ins Projekt legen
-        self.player.setSource(QUrl.fromLocalFile(str(sound_path)))
-        self.audio_output.setVolume(0.8)
-        #self.player.play()
-
-        # Statusmeldungen
-        self.status_map = {
-            10: "Prüfe auf Updates",
-            30: "Initialisiere Module",
-            50: "Verbinde mit Servern",
-            65: "Synchronisiere Einstellungen",
-            75: "Cache wird geleert",
-            85: "Starte Audio Engine",
-            95: "Lade Benutzeroberfläche",
-        }
+        path.addRoundedRect(0, 0, self.width(), self.height(), 25, 25)
+        painter.fillPath(path, QColor("#111827"))
+        painter.end()
 
-        # Punkte Animation (Fake Checks)
+        # Sound wird erst beim Ausblenden geladen (QtMultimedia ist teuer)
+        self.player = None
+        self.audio_output = None
+
+        # Startschritte: (Fortschritt, Statusmeldung, Funktion) - echte Arbeit statt Fake-Timer
+        self.stages = [
+            (10, "Prüfe auf Updates", self._stage_update_check),
+            (30, "Starte Audio Engine", self._stage_audio_engine),
+            (55, "Lade Benutzeroberfläche", self._stage_main_window),
+            (80, "Synchronisiere Playlist", self._stage_restore_playlist),
+            (95, "Lade Cover-Cache", self._stage_cover_cache),
+        ]
+        self.status_map = {progress: text for progress, text, _ in self.stages}
+        self.timings = OrderedDict()
+        self.timings["Module importieren"] = (time.perf_counter() - _START_TIME) * 1000
+        self.update_checker = None
+        self.main_window = None
+        self._stage_index = 0
+
+        # Punkte Animation
         self.dots = ""
         self.dot_timer = QTimer()
         self.dot_timer.timeout.connect(self.update_dots)
         self.dot_timer.start(500)
 
-        # Fortschritt
-        self.counter = 0
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_progress)
-        self.timer.start(100)
+        # erster Schritt, sobald die Eventloop läuft (Splash ist dann schon sichtbar)
+        QTimer.singleShot(0, self.run_next_stage)
 
         # Animationsobjekt behalten
         self.fade_anim = None
@@ -263,134 +3205,1225 @@ class SplashScreen(QWidget):
         self.dots += "."
         if len(self.dots) > 3:
             self.dots = ""
-        self.status.setText(self.status.text().split("…")[0] + self.dots)
+        self.status.setText(self.status.text().split("…")[0].rstrip(".") + self.dots)
+
+    def run_next_stage(self):
+        if self._stage_index >= len(self.stages):
+            self.finish_startup()
+            return
+        progress, text, func = self.stages[self._stage_index]
+        self.status.setText(text + self.dots)
+        self.progress.setValue(progress)
+        self.repaint()  # sofort zeichnen, der Schritt blockiert evtl. kurz
+
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            print(f"Start fehlgeschlagen ({text}): {e}")
+            QMessageBox.critical(self, "Beyond Music", f"Start fehlgeschlagen ({text}):\n{e}")
+            QApplication.exit(1)
+            return
+        self.timings[text] = (time.perf_counter() - start) * 1000
+        self._stage_index += 1
+        QTimer.singleShot(0, self.run_next_stage)
 
-    def update_progress(self):
-        self.counter += 2
-        self.progress.setValue(self.counter)
+    # ---- Startschritte ----
+    def _stage_update_check(self):
+        self.update_checker = UpdateChecker()
+        self.update_checker.start()
 
-        for k in sorted(self.status_map.keys()):
-            if self.counter >= k:
-                self.status.setText(self.status_map[k] + self.dots)
+    def _stage_audio_engine(self):
+        init_engine()
 
-        if self.counter >= 101:
-            self.timer.stop()
-            self.dot_timer.stop()
-            self.fade_out()
+    def _stage_main_window(self):
+        self.main_window = OverseerPlayer(engine, update_checker=self.update_checker)
+
+    def _stage_restore_playlist(self):
+        self.main_window.restore_playlist()
+
+    def _stage_cover_cache(self):
+        self.main_window.thumbs.preload()
+        # Icons für die Zustandswechsel schon vor dem ersten Klick rendern
+        icons.warm_up([(SVG_PAUSE, 24), (SVG_PLAY, 24), (SVG_PAUSE, 64), (SVG_PLAY, 64)])
+
+    def finish_startup(self):
+        self.dot_timer.stop()
+        self.progress.setValue(100)
+        self.main_window.show()
+        total = (time.perf_counter() - _START_TIME) * 1000
+        record_startup_profile(self.timings, total)
+        print("Startzeit: " + ", ".join(f"{k} {v:.0f} ms" for k, v in self.timings.items()) + f" | gesamt {total:.0f} ms")
+        self.fade_out()
 
     def fade_out(self):
         self.fade_anim = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_anim.setDuration(1000)
+        self.fade_anim.setDuration(300)
         self.fade_anim.setStartValue(1.0)
         self.fade_anim.setEndValue(0.0)
-        self.fade_anim.finished.connect(lambda: self.finish_splash(vlc_player))
-        self.player.play()
+        self.fade_anim.finished.connect(self.close)
+        self.play_jingle()
         self.fade_anim.start()
 
-    def finish_splash(self, vlc_player):
-        self.main_window = OverseerPlayer(vlc_player)  # vlc_player übergeben
-        self.main_window.show()
-        self.close()
+    def play_jingle(self):
+        # --- SOUND ABSPIELEN ---
+        try:
+            from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+        except ImportError as e:
+            print("Start-Sound nicht verfügbar:", e)
+            return
+        self.player = QMediaPlayer()
+        self.audio_output = QAudioOutput()
+        self.player.setAudioOutput(self.audio_output)
+
+        root_dir = get_root_path()
+        soundStart_path = os.path.join(root_dir, "assets", "start.mp3")
+        sound_path = Path(soundStart_path).resolve()  # kleine MP3/WAV Datei ins Projekt legen
+        self.player.setSource(QUrl.fromLocalFile(str(sound_path)))
+        self.audio_output.setVolume(0.8)
+        self.player.play()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.drawPixmap(0, 0, self.bg_pix)
 
-# ---------------- Playlist Item Widget ----------------
-class PlaylistItemWidget(QWidget):
-    play_requested = Signal()
-    delete_requested = Signal()
+# ---------------- Playlist ----------------
+class Playlist:
+    """Geordnete Pfadliste mit Index pfad -> zeile und stabilen Eintrags-IDs.
+
+    Dedupe (in), index() und die Zuordnung ID <-> Zeile sind O(1). Nach dem
+    Entfernen werden die Zeilennummern ab der Lücke erst beim nächsten Lookup
+    (einmal, gesammelt) neu vergeben. Die Ordner der Pfade liegen zusätzlich
+    sortiert vor, damit has_folder() per Präfixsuche antwortet."""
+
+    def __init__(self, paths=()):
+        self._paths = []
+        self._ids = []
+        self._row_of = {}       # path -> row
+        self._row_of_id = {}    # id -> row
+        self._stale_from = None # ab dieser Zeile sind die Indizes veraltet
+        self._dirs = {}         # ordner -> anzahl pfade darin
+        self._sorted_dirs = []  # dieselben Ordner, sortiert
+        self._id_counter = itertools.count(1)
+        self.extend(paths)
+
+    def _reindex(self):
+        start = self._stale_from
+        if start is None:
+            return
+        end = len(self._paths)
+        self._row_of.update(zip(self._paths[start:], range(start, end)))
+        self._row_of_id.update(zip(self._ids[start:], range(start, end)))
+        self._stale_from = None
 
-    def __init__(self, title: str, cover_pix: QPixmap | None = None, parent=None):
-        super().__init__(parent)
-        self._is_playing = False
-        self.setFixedHeight(64)
-        self.setAttribute(Qt.WA_StyledBackground, True)
+    def __len__(self):
+        return len(self._paths)
 
-        self.layout = QHBoxLayout(self)
-        self.layout.setContentsMargins(8, 6, 8, 6)
-        self.layout.setSpacing(8)
+    def __iter__(self):
+        return iter(self._paths)
 
-        # cover
-        self.cover_label = QLabel()
-        self.cover_label.setFixedSize(52, 52)
-        if cover_pix:
-            self.cover_label.setPixmap(cover_pix.scaled(52, 52, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    def __getitem__(self, row):
+        return self._paths[row]
+
+    def __contains__(self, path):
+        return path in self._row_of
+
+    def __bool__(self):
+        return bool(self._paths)
+
+    def index(self, path):
+        """Wie list.index(), aber O(1)."""
+        self._reindex()
+        try:
+            return self._row_of[path]
+        except KeyError:
+            raise ValueError(f"{path!r} is not in playlist") from None
+
+    def row_of(self, path, default=-1):
+        self._reindex()
+        return self._row_of.get(path, default)
+
+    def id_at(self, row):
+        return self._ids[row]
+
+    def has_folder(self, folder):
+        """Liegt mindestens ein Pfad in folder oder einem Unterordner davon?"""
+        folder = folder.rstrip(os.sep)
+        if folder in self._dirs:
+            return True
+        prefix = folder + os.sep
+        i = bisect_left(self._sorted_dirs, prefix)
+        return i < len(self._sorted_dirs) and self._sorted_dirs[i].startswith(prefix)
+
+    def _count_dir(self, path, delta):
+        folder = os.path.dirname(path)
+        count = self._dirs.get(folder, 0) + delta
+        if count > 0:
+            if folder not in self._dirs:
+                insort(self._sorted_dirs, folder)
+            self._dirs[folder] = count
         else:
-            self.cover_label.setPixmap(make_default_cover(52))
-        self.layout.addWidget(self.cover_label)
+            del self._dirs[folder]
+            del self._sorted_dirs[bisect_left(self._sorted_dirs, folder)]
 
-        # title text
-        self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("font-size: 13px; color: #dfefff;")
-        self.title_label.setWordWrap(False)
-        self.layout.addWidget(self.title_label, stretch=1)
-
-        # play button (hidden until hover or active)
-        self.btn_play = QPushButton()
-        self.btn_play.setIcon(svg_to_icon(SVG_PLAY, size=18))
-        self.btn_play.setFixedSize(36, 36)
-        self.btn_play.setVisible(False)
-        self.btn_play.setCursor(Qt.PointingHandCursor)
-        self.btn_play.setStyleSheet(self._button_style(inactive=True))
-        self.btn_play.clicked.connect(self.play_requested.emit)
-        self.layout.addWidget(self.btn_play)
-
-        # delete button (hidden until hover)
-        self.btn_delete = QPushButton()
-        self.btn_delete.setIcon(svg_to_icon(SVG_DELETE, size=16))
-        self.btn_delete.setFixedSize(36, 36)
-        self.btn_delete.setVisible(False)
-        self.btn_delete.setCursor(Qt.PointingHandCursor)
-        self.btn_delete.setStyleSheet(self._button_style(inactive=True))
-        self.btn_delete.clicked.connect(self.delete_requested.emit)
-        self.layout.addWidget(self.btn_delete)
-
-        # initial background
-        self.setStyleSheet("background-color: rgba(255,255,255,0.02); border-radius:8px;")
+    def row_of_id(self, entry_id, default=-1):
+        self._reindex()
+        return self._row_of_id.get(entry_id, default)
 
-    def enterEvent(self, event):
-        # show controls on hover
-        self.btn_play.setVisible(True)
-        self.btn_delete.setVisible(True)
-        # hover blending over base state
-        if self._is_playing:
-            self.setStyleSheet("background-color: rgba(34,197,94,0.25); border-radius:8px;")
+    def new_paths(self, paths):
+        """Filtert Duplikate (auch innerhalb von paths) heraus, ohne etwas einzufügen."""
+        seen = set()
+        fresh = []
+        for p in paths:
+            if p not in self._row_of and p not in seen:
+                seen.add(p)
+                fresh.append(p)
+        return fresh
+
+    def append(self, path):
+        if path in self._row_of:
+            return False
+        self._reindex()
+        row = len(self._paths)
+        entry_id = next(self._id_counter)
+        self._paths.append(path)
+        self._ids.append(entry_id)
+        self._row_of[path] = row
+        self._row_of_id[entry_id] = row
+        self._count_dir(path, 1)
+        return True
+
+    def extend(self, paths):
+        added = self.new_paths(paths)
+        for p in added:
+            self.append(p)
+        return added
+
+    def replace(self, row, path):
+        """Setzt einen anderen Pfad in die Zeile (Datei verschoben), die Eintrags-ID bleibt."""
+        if path in self._row_of:
+            raise ValueError(f"{path!r} is already in playlist")
+        self._reindex()
+        old = self._paths[row]
+        del self._row_of[old]
+        self._paths[row] = path
+        self._row_of[path] = row
+        self._count_dir(old, -1)
+        self._count_dir(path, 1)
+        return old
+
+    def pop(self, row):
+        if row < 0:
+            row += len(self._paths)
+        path = self._paths.pop(row)
+        entry_id = self._ids.pop(row)
+        del self._row_of[path]
+        del self._row_of_id[entry_id]
+        self._count_dir(path, -1)
+        # nachfolgende Zeilen rücken nach vorne, Neuvergabe erst beim nächsten Lookup
+        if row < len(self._paths):
+            self._stale_from = row if self._stale_from is None else min(self._stale_from, row)
+        return path
+
+    def clear(self):
+        self._paths.clear()
+        self._ids.clear()
+        self._row_of.clear()
+        self._row_of_id.clear()
+        self._dirs.clear()
+        self._sorted_dirs.clear()
+        self._stale_from = None
+
+    def copy(self):
+        return list(self._paths)
+
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _tokens(text):
+    """Gefaltete Wörter eines Textes ('01 - Über_Alles' -> ['01', 'uber', 'alles'])."""
+    return _WORD_RE.findall(_fold(text))
+
+
+def _entry_text(path):
+    """Suchtext aus dem Pfad: Dateiname ohne Endung und die beiden Ordner darüber
+    (meist Album und Interpret)."""
+    parts = path.replace("\\", "/").rsplit("/", 3)
+    parts[-1] = parts[-1].rpartition(".")[0] or parts[-1]
+    return " ".join(parts[1:])
+
+
+class TrackIndex:
+    """Suchindex der Playlist: Wörter aus Dateiname, Ordnern und Tags, Präfixsuche.
+
+    Wie beim StationCatalog kommt jedes Wort einmal ins Vokabular; die Postings
+    (array "I", 4 Byte je Eintrag) zeigen auf die stabilen Eintrags-IDs der
+    Playlist. Präfixe bis PREFIX Zeichen zeigen auf Wörter, längere Begriffe
+    filtern diesen Bucket mit startswith. Für Präfixe bis SHORT Zeichen ("k",
+    "ka") träfe das tausende Wörter, sie haben deshalb eigene Postings direkt
+    auf die Einträge.
+
+    Postings sind aufsteigend und ohne Doppelte, solange nur angehängt wird;
+    kommen Wörter für ältere Einträge nach (Tags), wird das Posting erst bei der
+    nächsten Suche einmal sortiert. Entfernte Einträge werden nur in einer
+    Bitmap als tot markiert und beim nächsten compact() aus den Postings geräumt.
+    Je Eintrag merkt sich der Index seine Wort-IDs, damit replace() (Umbenennen,
+    neue Tags) genau die Wörter austragen kann, die nicht mehr vorkommen."""
+
+    PREFIX = 3
+    SHORT = 2
+
+    def __init__(self):
+        self._word_ids = {}         # wort -> Wort-ID
+        self._words = []            # Wort-ID -> wort
+        self._postings = []         # Wort-ID -> Eintrags-IDs
+        self._prefixes = defaultdict(partial(array, "I"))   # präfix -> Wort-IDs
+        self._short = defaultdict(partial(array, "I"))      # kurzer Präfix -> Eintrags-IDs
+        self._unsorted = set()      # Wort-IDs bzw. kurze Präfixe mit nachgetragenen Einträgen
+        self._alive = bytearray()   # Eintrags-ID -> 1 = in der Playlist
+        self._entry_words = []      # Eintrags-ID -> Wort-IDs (array "I") oder None
+        self._count = 0
+        self._dead = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, entry_id, text):
+        """Indiziert text für den Eintrag (neu oder zusätzlich, z. B. Tags)."""
+        self._add_tokens(entry_id, set(_tokens(text)))
+
+    def _add_tokens(self, entry_id, tokens):
+        alive = self._alive
+        if entry_id >= len(alive):
+            alive.extend(bytes(entry_id + 1 - len(alive)))
+        if not alive[entry_id]:
+            alive[entry_id] = 1
+            self._count += 1
+        entry_words = self._entry_words
+        if entry_id >= len(entry_words):
+            entry_words.extend([None] * (entry_id + 1 - len(entry_words)))
+        own = entry_words[entry_id]
+        if own is None:
+            own = entry_words[entry_id] = array("I")
+        fresh = []
+        get, postings, unsorted = self._word_ids.get, self._postings, self._unsorted
+        known = set(own) if own else ()
+        for word in tokens:
+            word_id = get(word)
+            if word_id is None:
+                word_id = self._add_word(word)
+            elif word_id in known:
+                continue
+            fresh.append(word)
+            own.append(word_id)
+            posting = postings[word_id]
+            if posting and posting[-1] > entry_id:
+                unsorted.add(word_id)
+            posting.append(entry_id)
+        prefixes = {w[:1] for w in fresh} | {w[:2] for w in fresh}
+        if len(own) > len(fresh):
+            words = self._words
+            prefixes -= {p for w in own[:len(own) - len(fresh)] for p in (words[w][:1], words[w][:2])}
+        for prefix in prefixes:
+            posting = self._short[prefix]
+            if posting and posting[-1] > entry_id:
+                unsorted.add(prefix)
+            posting.append(entry_id)
+
+    def replace(self, entry_id, text):
+        """Setzt den kompletten Suchtext eines Eintrags neu: Wörter, die in text nicht
+        mehr vorkommen, verlieren den Eintrag, neue kommen dazu."""
+        new = set(_tokens(text))
+        own = self._entry_words[entry_id] if entry_id < len(self._entry_words) else None
+        if own:
+            words = self._words
+            old = {words[w] for w in own}
+            gone = old - new
+            if gone:
+                keep = array("I", (w for w in own if words[w] not in gone))
+                kept_short = {p for w in keep for p in (words[w][:1], words[w][:2])}
+                for word in gone:
+                    self._discard(self._word_ids[word], entry_id)
+                    for prefix in (word[:1], word[:2]):
+                        if prefix not in kept_short:
+                            kept_short.add(prefix)      # nur einmal austragen
+                            self._discard(prefix, entry_id)
+                self._entry_words[entry_id] = keep
+            new -= old
+            if not new:
+                return
+        self._add_tokens(entry_id, new)
+
+    def _discard(self, key, entry_id):
+        posting = self._posting(key)
+        i = bisect_left(posting, entry_id)
+        if i < len(posting) and posting[i] == entry_id:
+            del posting[i]
+
+    def _add_word(self, word):
+        word_id = len(self._words)
+        self._word_ids[word] = word_id
+        self._words.append(word)
+        self._postings.append(array("I"))
+        for n in range(1, min(len(word), self.PREFIX) + 1):
+            self._prefixes[word[:n]].append(word_id)
+        return word_id
+
+    def remove(self, entry_id):
+        if entry_id < len(self._alive) and self._alive[entry_id]:
+            self._alive[entry_id] = 0
+            self._entry_words[entry_id] = None
+            self._count -= 1
+            self._dead += 1
+            if self._dead > self._count + 1000:
+                self.compact()
+
+    def clear(self):
+        self.__init__()
+
+    def compact(self):
+        """Räumt tote Einträge und Doppelte aus den Postings."""
+        alive = self._alive
+        def clean(posting):
+            return array("I", sorted({i for i in posting if alive[i]}))
+        self._postings = [clean(posting) for posting in self._postings]
+        for prefix, posting in self._short.items():
+            self._short[prefix] = clean(posting)
+        self._unsorted.clear()
+        self._dead = 0
+
+    def _posting(self, key):
+        """Posting eines Worts (Wort-ID) oder kurzen Präfixes (str), sortiert."""
+        table = self._short if isinstance(key, str) else self._postings
+        posting = table[key]
+        if key in self._unsorted:
+            posting = table[key] = array("I", sorted(set(posting)))
+            self._unsorted.discard(key)
+        return posting
+
+    def _sources(self, term):
+        """Postings, deren Vereinigung die Treffer eines Begriffs ist."""
+        if len(term) <= self.SHORT:
+            return [self._posting(term)] if term in self._short else []
+        if len(term) <= self.PREFIX:
+            word_ids = self._prefixes.get(term, ())
         else:
-            self.setStyleSheet("background-color: rgba(255,255,255,0.04); border-radius:8px;")
-        super().enterEvent(event)
+            words = self._words
+            word_ids = [w for w in self._prefixes.get(term[:self.PREFIX], ()) if words[w].startswith(term)]
+        return [self._posting(w) for w in word_ids]
+
+    def search(self, query):
+        """Aufsteigende Eintrags-IDs, deren Wörter mit allen Begriffen beginnen;
+        None bei leerer Suche."""
+        terms = set(_tokens(query))
+        if not terms:
+            return None
+        # mit dem kleinsten Begriff anfangen, die großen nur noch dagegen prüfen
+        sources = sorted((self._sources(t) for t in terms), key=lambda s: sum(map(len, s)))
+        first = sources[0]
+        if not first:
+            return []
+        alive = self._alive
+        if len(sources) == 1 and len(first) == 1:
+            ids = first[0]      # schon sortiert und eindeutig
+            if self._dead:
+                return array("I", itertools.compress(ids, map(alive.__getitem__, ids)))
+            return array("I", ids)
+        ids = set().union(*first)
+        for source in sources[1:]:
+            if len(source) == 1:
+                ids.intersection_update(source[0])
+            else:
+                ids &= set().union(*source)
+            if not ids:
+                return []
+        if self._dead:
+            return sorted(i for i in ids if alive[i])
+        return sorted(ids)
+
+    def memory_bytes(self):
+        """Ungefährer Speicherbedarf der Index-Arrays (ohne die Wort-Strings)."""
+        arrays = itertools.chain(self._postings, self._prefixes.values(), self._short.values(),
+                                 filter(None, self._entry_words))
+        return sum(len(a) * a.itemsize for a in arrays) + len(self._alive)
+
+
+# ---------------- Senderverzeichnis ----------------
+def _fold(text):
+    """Kleinschreibung ohne Akzente, damit 'Köln' auch mit 'koln' gefunden wird."""
+    text = text.casefold()
+    if text.isascii():
+        return text
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def _truthy(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "ja")
+    return bool(value)
+
+
+class StationCatalog:
+    """Senderverzeichnis für große Listen (zehntausende Einträge aus JSON/CSV).
+
+    Die Daten liegen spaltenweise (ein Sender = eine ID). Gesucht wird über
+    die Wörter aus Name, Genre und Land: jedes Wort kommt einmal ins
+    Vokabular, der Trigramm-Index (Teilstring-Suche wie bisher) und der
+    Präfix-Index für Begriffe unter drei Zeichen ("^r", "^ra") zeigen auf
+    Wörter statt auf Sender. Genres und Länder wiederholen sich ständig,
+    dadurch bleibt der Index klein und schnell gebaut. type und featured
+    sind Facetten. search() liefert die besten K IDs."""
 
-    def leaveEvent(self, event):
-        # hide hover controls (but keep play visible if playing)
-        self.btn_delete.setVisible(False)
-        if self._is_playing:
-            self.btn_play.setVisible(True)
-            self.setStyleSheet("background-color: rgba(34,197,94,0.15); border-radius:8px;")
+    def __init__(self):
+        self.names = []
+        self.urls = []
+        self.genres = []
+        self.countries = []
+        self.types = []
+        self.featured = bytearray()
+        self.votes = array("L")
+        self._id_of = {}          # name -> id
+        self._folded_names = []   # gefalteter Name je ID (für das Ranking)
+        self._popular = None      # IDs nach Votes sortiert (ohne Suchbegriff)
+        self._word_ids = {}       # wort -> Wort-ID
+        self._words = []          # Wort-ID -> wort
+        self._word_postings = []  # Wort-ID -> aufsteigende Sender-IDs
+        self._grams = defaultdict(partial(array, "L"))  # Trigramm bzw. "^"+Präfix -> Wort-IDs
+        self._by_type = {}        # type -> set(ids)
+        self._featured_ids = set()
+        self._mirrors = {}        # id -> weitere URLs desselben Senders
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._id_of
+
+    def id_of(self, name, default=None):
+        return self._id_of.get(name, default)
+
+    def url_of(self, name):
+        station_id = self._id_of.get(name)
+        return None if station_id is None else self.urls[station_id]
+
+    def urls_of(self, name):
+        """Haupt-URL und alle Spiegel eines Senders (leer, wenn unbekannt)."""
+        station_id = self._id_of.get(name)
+        if station_id is None:
+            return []
+        return [self.urls[station_id], *self._mirrors.get(station_id, ())]
+
+    # ---- Aufbau ----
+    def add(self, name, url, genre="", country="", type="web", featured=False, votes=0):
+        """Fügt einen Sender hinzu; doppelte Namen werden übersprungen (None).
+
+        Bringt der doppelte Eintrag eine andere URL mit, wird sie als Spiegel gemerkt."""
+        if name in self._id_of:
+            station_id = self._id_of[name]
+            if url != self.urls[station_id]:
+                mirrors = self._mirrors.setdefault(station_id, [])
+                if url not in mirrors:
+                    mirrors.append(url)
+            return None
+        station_id = len(self.names)
+        genre, country, type = sys.intern(genre), sys.intern(country), sys.intern(type)
+        self.names.append(name)
+        self.urls.append(url)
+        self.genres.append(genre)
+        self.countries.append(country)
+        self.types.append(type)
+        self.featured.append(1 if featured else 0)
+        self.votes.append(max(0, int(votes)))
+        self._id_of[name] = station_id
+
+        folded_name = _fold(name)
+        text = " ".join((folded_name, _fold(genre.replace(",", " ")), _fold(country)))
+        self._folded_names.append(folded_name)
+        word_ids = self._word_ids
+        for word in set(text.split()):
+            word_id = word_ids.get(word)
+            if word_id is None:
+                word_id = self._add_word(word)
+            self._word_postings[word_id].append(station_id)
+        self._popular = None
+
+        self._by_type.setdefault(type, set()).add(station_id)
+        if featured:
+            self._featured_ids.add(station_id)
+        return station_id
+
+    def _add_word(self, word):
+        word_id = len(self._words)
+        self._word_ids[word] = word_id
+        self._words.append(word)
+        self._word_postings.append(array("L"))
+        grams = self._grams
+        for key in {"^" + word[:1], "^" + word[:2], *(word[i:i + 3] for i in range(len(word) - 2))}:
+            grams[key].append(word_id)
+        return word_id
+
+    def add_rows(self, rows):
+        """Übernimmt Zeilen aus einem Dump (eigenes Format oder radio-browser-Felder)."""
+        added = 0
+        for row in rows:
+            name = (row.get("name") or "").strip()
+            url = row.get("url_resolved") or row.get("url")
+            if not name or not url:
+                continue
+            try:
+                votes = int(row.get("votes") or row.get("clickcount") or 0)
+            except (TypeError, ValueError):
+                votes = 0
+            station_id = self.add(
+                name, url.strip(),
+                genre=(row.get("genre") or row.get("tags") or "").strip(),
+                country=(row.get("country") or row.get("countrycode") or "").strip(),
+                type=(row.get("type") or "web").strip().lower(),
+                featured=_truthy(row.get("featured")),
+                votes=votes,
+            )
+            if station_id is not None:
+                added += 1
+        self._popular_order()   # Sortierung gleich beim Laden statt bei der ersten Suche
+        return added
+
+    def add_dict(self, streams):
+        """Übernimmt das Format von OverseerPlayer.streams (name -> {url, type, featured})."""
+        return self.add_rows({"name": name, **data} for name, data in streams.items())
+
+    def load_json(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return self.add_dict(data)
+        return self.add_rows(data)
+
+    def load_csv(self, path):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return self.add_rows(csv.DictReader(f))
+
+    # ---- Suche ----
+    def _ids_for_term(self, term):
+        if len(term) < 3:
+            word_ids = self._grams.get("^" + term, ())
         else:
-            self.btn_play.setVisible(False)
-            self.setStyleSheet("background-color: rgba(255,255,255,0.02); border-radius:8px;")
-        super().leaveEvent(event)
+            postings = []
+            for i in range(len(term) - 2):
+                posting = self._grams.get(term[i:i + 3])
+                if posting is None:
+                    return set()
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+            words = self._words
+            word_ids = [w for w in candidates if term in words[w]]   # Trigramme können falsch-positiv sein
+        ids = set()
+        for word_id in word_ids:
+            ids.update(self._word_postings[word_id])
+        return ids
+
+    def _filter(self, query, type, featured):
+        ids = None
+        if type is not None:
+            ids = set(self._by_type.get(type, ()))
+        if featured:
+            ids = set(self._featured_ids) if ids is None else ids & self._featured_ids
+        terms = sorted(set(_fold(query).split()), key=len, reverse=True)
+        for term in terms:
+            hits = self._ids_for_term(term)
+            ids = hits if ids is None else ids & hits
+            if not ids:
+                break
+        return ids, terms
+
+    def _popular_order(self):
+        """Alle IDs nach Votes (absteigend), bei Gleichstand in Originalreihenfolge."""
+        if self._popular is None:
+            votes = self.votes
+            self._popular = sorted(range(len(self.names)), key=lambda i: (-votes[i], i))
+        return self._popular
+
+    def search(self, query="", type=None, featured=None, limit=None):
+        """IDs der besten Treffer: Namensanfang vor Namenstreffer vor Genre/Land, dann Votes."""
+        ids, terms = self._filter(query, type, featured)
+        popular = self._popular_order()
+        if not terms:
+            # ohne Suchbegriff: nach Votes, sonst Originalreihenfolge
+            if ids is None:
+                return popular[:limit]
+            result = []
+            for i in popular:
+                if i in ids:
+                    result.append(i)
+                    if limit is not None and len(result) >= limit:
+                        break
+            return result
+
+        folded = _fold(query).strip()
+        names, votes = self._folded_names, self.votes
+
+        def score(i):
+            name = names[i]
+            return (4 if name.startswith(folded) else 0) + sum(1 for t in terms if t in name)
+
+        if limit is None or len(ids) <= 4 * limit:
+            return sorted(ids, key=lambda i: (-score(i), -votes[i], i))[:limit]
+
+        # Viele Treffer: in Votes-Reihenfolge durchgehen und nach Score einsortieren,
+        # abbrechen sobald der beste mögliche Score voll ist
+        best = 4 + len(terms)
+        buckets = {}
+        for i in popular:
+            if i in ids:
+                s = score(i)
+                bucket = buckets.setdefault(s, [])
+                if len(bucket) < limit:
+                    bucket.append(i)
+                    if s == best and len(bucket) == limit:
+                        break
+        result = []
+        for s in sorted(buckets, reverse=True):
+            result.extend(buckets[s])
+        return result[:limit]
+
+    def facet_counts(self, query="", type=None, featured=None):
+        """Trefferzahlen je type und für featured, z. B. für Filter-Buttons."""
+        ids, _ = self._filter(query, type, featured)
+        if ids is None:
+            ids = range(len(self.names))
+        counts = {"type": {}, "featured": 0}
+        types = self.types
+        for i in ids:
+            counts["type"][types[i]] = counts["type"].get(types[i], 0) + 1
+            counts["featured"] += self.featured[i]
+        return counts
+
+
+def load_station_dumps(catalog, paths=None):
+    """Lädt vorhandene Sender-Dumps (stations.json / stations.csv im Konfigurationsordner)."""
+    for path in paths or (STATIONS_JSON_PATH, STATIONS_CSV_PATH):
+        if not os.path.exists(path):
+            continue
+        start = time.perf_counter()
+        try:
+            if path.lower().endswith(".csv"):
+                added = catalog.load_csv(path)
+            else:
+                added = catalog.load_json(path)
+        except (OSError, ValueError, csv.Error) as e:
+            print("Senderliste konnte nicht geladen werden:", path, e)
+            continue
+        print(f"Senderliste geladen: {added} Sender aus {path} "
+              f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+class _StationDumpJob(QRunnable):
+    def __init__(self, loader):
+        super().__init__()
+        self.loader = loader
+
+    def run(self):
+        catalog = StationCatalog()
+        catalog.add_dict(self.loader.builtin)
+        load_station_dumps(catalog, self.loader.paths)
+        self.loader.finished.emit(catalog)
+
+
+class StationDumpLoader(QObject):
+    """Baut das Senderverzeichnis samt Dumps im Hintergrund und meldet den fertigen Katalog."""
+    finished = Signal(object)  # StationCatalog
+
+    def __init__(self, builtin, paths=None, parent=None):
+        super().__init__(parent)
+        self.builtin = dict(builtin)
+        self.paths = paths or [p for p in (STATIONS_JSON_PATH, STATIONS_CSV_PATH) if os.path.exists(p)]
+
+    def start(self):
+        if not self.paths:
+            return False
+        QThreadPool.globalInstance().start(_StationDumpJob(self))
+        return True
 
-    def set_playing(self, playing: bool):
-        self._is_playing = playing
+
+# ---------------- Playlist Model / Delegate ----------------
+PathRole = Qt.UserRole
+PlayingRole = Qt.UserRole + 1
+HealthRole = Qt.UserRole + 2     # 'fast' / 'slow' / 'dead' / None (StreamProber.health)
+
+
+class PlaylistModel(QAbstractListModel):
+    """Playlist-Daten für die QListView: Pfad, Titel, Cover und Wiedergabestatus.
+
+    Cover liegen nur für die sichtbaren Zeilen plus Puffer im Speicher (retain_covers,
+    höchstens COVER_ROWS); fragt die View eine freigegebene Zeile wieder an, meldet
+    cover_needed sie zum Nachladen (der ThumbnailCache hat sie dann meist noch im Speicher)."""
+    renamed = Signal(str, str)  # alter Pfad, neuer Pfad
+    cover_needed = Signal(str)
+
+    COVER_ROWS = 300            # 52px-Pixmaps, gut ein paar Bildschirme
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paths = Playlist()
+        self.search_index = TrackIndex()
+        self._titles = {}       # path -> titel aus den Tags
+        self._texts = {}        # path -> zusätzlicher Suchtext (Bibliothek)
+        self._covers = OrderedDict()    # path -> QPixmap (52px), LRU
+        self._released = set()  # paths, deren Cover freigegeben wurde
+        self._playing_row = -1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.paths):
+            return None
+        path = self.paths[index.row()]
+        if role == Qt.DisplayRole:
+            return self._titles.get(path) or os.path.basename(path)
+        if role == Qt.DecorationRole:
+            cover = self._covers.get(path)
+            if cover is not None:
+                self._covers.move_to_end(path)
+            elif path in self._released:
+                self._released.discard(path)
+                self.cover_needed.emit(path)
+            return cover
+        if role == PathRole:
+            return path
+        if role == PlayingRole:
+            return index.row() == self._playing_row
+        return None
+
+    def append(self, path):
+        return bool(self.extend([path]))
+
+    def extend(self, paths):
+        """Fügt neue Pfade in einem Rutsch an, Duplikate werden übersprungen."""
+        fresh = self.paths.new_paths(paths)
+        if not fresh:
+            return []
+        first = len(self.paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(fresh) - 1)
+        self.paths.extend(fresh)
+        index, id_at = self.search_index, self.paths.id_at
+        for row, path in enumerate(fresh, first):
+            index.add(id_at(row), _entry_text(path))
+        self.endInsertRows()
+        return fresh
+
+    def remove(self, row):
+        self.search_index.remove(self.paths.id_at(row))
+        self.beginRemoveRows(QModelIndex(), row, row)
+        path = self.paths.pop(row)
+        self.endRemoveRows()
+        self._titles.pop(path, None)
+        self._texts.pop(path, None)
+        self._covers.pop(path, None)
+        self._released.discard(path)
+        if self._playing_row == row:
+            self._playing_row = -1
+        elif self._playing_row > row:
+            self._playing_row -= 1
+        return path
+
+    def rename(self, old, new):
+        """Datei wurde verschoben: Zeile, Titel und Cover bleiben, nur der Pfad ändert sich."""
+        row = self.paths.row_of(old)
+        if row < 0 or new in self.paths:
+            return False
+        self.paths.replace(row, new)
+        title = self._titles.pop(old, None)
+        if title is not None:
+            self._titles[new] = os.path.basename(new) if title == os.path.basename(old) else title
+        if old in self._texts:
+            self._texts[new] = self._texts.pop(old)
+        self.search_index.replace(self.paths.id_at(row), self._search_text(new))
+        if old in self._covers:
+            self._covers[new] = self._covers.pop(old)
+        if old in self._released:
+            self._released.discard(old)
+            self._released.add(new)
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole, PathRole])
+        self.renamed.emit(old, new)
+        return True
+
+    def clear(self):
+        self.beginResetModel()
+        self.paths.clear()
+        self.search_index.clear()
+        self._titles.clear()
+        self._texts.clear()
+        self._covers.clear()
+        self._released.clear()
+        self._playing_row = -1
+        self.endResetModel()
+
+    def set_metadata(self, path, cover: QPixmap | None, title: str):
+        if cover is not None:
+            self._covers[path] = cover
+            self._covers.move_to_end(path)
+            self._released.discard(path)
+            while len(self._covers) > self.COVER_ROWS:
+                self._released.add(self._covers.popitem(last=False)[0])
+        self._titles[path] = title
+        row = self.paths.row_of(path)
+        if row < 0:
+            return
+        self.search_index.replace(self.paths.id_at(row), self._search_text(path))
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.DecorationRole])
+
+    def retain_covers(self, paths):
+        """Gibt die Cover aller Zeilen außerhalb von paths (sichtbar + Puffer) frei."""
+        keep = set(paths)
+        for path in [p for p in self._covers if p not in keep]:
+            del self._covers[path]
+            self._released.add(path)
+
+    def add_search_text(self, texts):
+        """Zusätzlicher Suchtext je Pfad (z. B. Tags aus der Bibliothek), ersetzt den vorigen."""
+        row_of, id_at, index = self.paths.row_of, self.paths.id_at, self.search_index
+        for path, text in texts.items():
+            row = row_of(path)
+            if row >= 0:
+                self._texts[path] = text
+                index.replace(id_at(row), self._search_text(path))
+
+    def _search_text(self, path):
+        """Alles, wonach eine Zeile gefunden wird: Pfad, Titel aus den Tags, Bibliothekstext."""
+        return " ".join(filter(None, (_entry_text(path), self._titles.get(path), self._texts.get(path))))
+
+    def search(self, query):
+        """Eintrags-IDs der Treffer in Playlist-Reihenfolge, None bei leerer Suche."""
+        return self.search_index.search(query)
+
+    def set_playing_row(self, row):
+        """Nur die alte und die neue Zeile werden neu gezeichnet."""
+        old, self._playing_row = self._playing_row, row
+        for r in {old, row}:
+            if 0 <= r < len(self.paths):
+                idx = self.index(r)
+                self.dataChanged.emit(idx, idx, [PlayingRole])
+
+
+class PlaylistFilterModel(QAbstractListModel):
+    """Suchergebnis als eigene Sicht auf ein PlaylistModel. ids hält die Eintrags-IDs
+    der Treffer (aufsteigend = Playlist-Reihenfolge); Zeilen werden erst aufgelöst,
+    wenn die View sie zeichnet. Daten und Rollen kommen unverändert vom Original."""
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.ids = array("I")
+        source.dataChanged.connect(self._on_source_changed)
+
+    def set_ids(self, ids):
+        self.beginResetModel()
+        self.ids = ids
+        self.endResetModel()
+
+    def source_row(self, row):
+        if 0 <= row < len(self.ids):
+            return self.source.paths.row_of_id(self.ids[row])
+        return -1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = self.source_row(index.row()) if index.isValid() else -1
+        if row < 0:
+            return None
+        return self.source.data(self.source.index(row), role)
+
+    def _on_source_changed(self, top_left, bottom_right, roles=()):
+        paths, ids = self.source.paths, self.ids
+        first, last = top_left.row(), bottom_right.row()
+        if last >= len(paths) or not ids:
+            return
+        lo = bisect_left(ids, paths.id_at(first))
+        hi = bisect_right(ids, paths.id_at(last))
+        if lo < hi:
+            self.dataChanged.emit(self.index(lo), self.index(hi - 1), roles)
+
+
+class PlaylistDelegate(QStyledItemDelegate):
+    """Zeichnet Cover, Titel und die Hover-Buttons einer Playlist-Zeile.
+    Es gibt keine Widgets pro Zeile, gemalt werden nur die sichtbaren."""
+    play_requested = Signal(int)
+    delete_requested = Signal(int)
+
+    ROW_HEIGHT = 64
+    BUTTON = 36
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon_play = svg_to_pixmap(SVG_PLAY, 18)
+        self._icon_pause = svg_to_pixmap(SVG_PAUSE, 18)
+        self._icon_delete = svg_to_pixmap(SVG_DELETE, 16)
+        self._title_font = QFont("Segoe UI")
+        self._title_font.setPixelSize(13)
+        self._hover = (-1, None)    # (row, "play"/"delete"/None)
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)   # Breite kommt vom Viewport
+
+    def _button_rects(self, rect):
+        y = rect.top() + (rect.height() - self.BUTTON) // 2
+        delete = QRect(rect.right() - 8 - self.BUTTON, y, self.BUTTON, self.BUTTON)
+        play = QRect(delete.left() - 8 - self.BUTTON, y, self.BUTTON, self.BUTTON)
+        return play, delete
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = option.rect
+        playing = bool(index.data(PlayingRole))
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        # background
         if playing:
-            self.btn_play.setVisible(True)
-            self.btn_play.setIcon(svg_to_icon(SVG_PAUSE, size=18))
-            self.btn_play.setStyleSheet(self._button_style(active=True))
-            self.setStyleSheet("background-color: rgba(34,197,94,0.15); border-radius:8px;")
+            bg = QColor(34, 197, 94, 64 if hovered else 38)
+        elif option.state & QStyle.State_Selected:
+            bg = QColor(88, 166, 255, 51)
         else:
-            self.btn_play.setIcon(svg_to_icon(SVG_PLAY, size=18))
-            self.btn_play.setStyleSheet(self._button_style(inactive=True))
-            self.btn_play.setVisible(False)
-            self.setStyleSheet("background-color: rgba(255,255,255,0.02); border-radius:8px;")
+            bg = QColor(255, 255, 255, 10 if hovered else 5)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(rect, 8, 8)
 
-    @staticmethod
-    def _button_style(active=False, inactive=False):
-        if active:
-            return "QPushButton{background:#22c55e;color:white;border-radius:8px;}QPushButton:hover{background:#16a34a}"
-        else:
-            return "QPushButton{background:transparent;color:#cfe8ff;border-radius:8px;}QPushButton:hover{background:rgba(255,255,255,0.06)}"
+        # cover
+        cover = index.data(Qt.DecorationRole)
+        if cover is None:
+            # Farbe pro Album-Ordner, damit Alben ohne Cover unterscheidbar bleiben
+            # (während Reset/Filterwechsel kann eine Zeile kurz keinen Pfad haben)
+            cover = make_default_cover(52, seed=os.path.dirname(index.data(PathRole) or ""))
+        cover_rect = QRect(rect.left() + 8, rect.top() + 6, 52, 52)
+        scaled = cover.size().scaled(52, 52, Qt.KeepAspectRatio)
+        target = QRect(0, 0, scaled.width(), scaled.height())
+        target.moveCenter(cover_rect.center())
+        painter.drawPixmap(target, cover)
+
+        # buttons (nur bei Hover bzw. Play auch beim Abspielen)
+        play_rect, delete_rect = self._button_rects(rect)
+        hover_row, hover_btn = self._hover
+        if hovered or playing:
+            if playing:
+                painter.setBrush(QColor("#16a34a") if hover_btn == "play" and hover_row == index.row() else QColor("#22c55e"))
+                painter.drawRoundedRect(play_rect, 8, 8)
+            elif hover_btn == "play" and hover_row == index.row():
+                painter.setBrush(QColor(255, 255, 255, 15))
+                painter.drawRoundedRect(play_rect, 8, 8)
+            icon = self._icon_pause if playing else self._icon_play
+            painter.drawPixmap(play_rect.center().x() - 9, play_rect.center().y() - 9, icon)
+        if hovered:
+            if hover_btn == "delete" and hover_row == index.row():
+                painter.setBrush(QColor(255, 255, 255, 15))
+                painter.drawRoundedRect(delete_rect, 8, 8)
+            painter.drawPixmap(delete_rect.center().x() - 8, delete_rect.center().y() - 8, self._icon_delete)
+
+        # title text
+        text_rect = QRect(cover_rect.right() + 8, rect.top(), play_rect.left() - cover_rect.right() - 16, rect.height())
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#dfefff"))
+        fm = QFontMetrics(self._title_font)
+        title = fm.elidedText(index.data(Qt.DisplayRole) or "", Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, title)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseMove, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        play_rect, delete_rect = self._button_rects(option.rect)
+        pos = event.position().toPoint()
+        btn = "play" if play_rect.contains(pos) else "delete" if delete_rect.contains(pos) else None
+        if event.type() == QEvent.MouseMove:
+            if self._hover != (index.row(), btn):
+                self._hover = (index.row(), btn)
+                view = self.parent()
+                if view is not None:
+                    view.viewport().update()
+            return False
+        if event.button() == Qt.LeftButton and btn is not None:
+            if btn == "play":
+                self.play_requested.emit(index.row())
+            else:
+                self.delete_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+# ---------------- Webradio Model / Delegate ----------------
+class StationModel(QAbstractListModel):
+    """Trefferliste des Senderverzeichnisses: pro Zeile nur eine Sender-ID."""
+
+    def __init__(self, catalog, prober=None, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.prober = prober
+        self._ids = []
+        self._row_of = None          # Sender-ID -> Zeile, erst bei Bedarf
+        self._playing = None         # Name des laufenden Senders
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self.catalog.names[self._ids[index.row()]]
+        if role == Qt.DisplayRole:
+            return name
+        if role == PlayingRole:
+            return name == self._playing
+        if role == HealthRole:
+            return self.prober.health(self.url_at(index.row())) if self.prober else None
+        if role == Qt.ToolTipRole:
+            station_id = self._ids[index.row()]
+            details = [d for d in (self.catalog.genres[station_id], self.catalog.countries[station_id]) if d]
+            lines = [name] if not details else [name, " · ".join(details)]
+            probe = self.prober.result(self.url_at(index.row())) if self.prober else None
+            if probe is not None and probe.get("ok"):
+                stream = [d for d in (probe.get("codec"), probe.get("bitrate") and f"{probe['bitrate']} kbit/s") if d]
+                stream.append(f"{probe['first_byte_ms']:.0f} ms")
+                lines.append(" · ".join(stream))
+            elif probe is not None:
+                lines.append(f"nicht erreichbar ({probe.get('error')})")
+            return "\n".join(lines)
+        return None
 
+    def url_at(self, row):
+        return self.catalog.urls[self._ids[row]]
+
+    def urls_in(self, first, last):
+        """URLs der Zeilen first..last (z. B. der sichtbare Bereich)."""
+        urls = self.catalog.urls
+        return [urls[i] for i in self._ids[max(0, first):last + 1]]
+
+    def refresh_health(self):
+        if self._ids:
+            self.dataChanged.emit(self.index(0), self.index(len(self._ids) - 1), [HealthRole, Qt.ToolTipRole])
+
+    def name_at(self, row):
+        return self.catalog.names[self._ids[row]]
+
+    def set_results(self, catalog, ids):
+        self.beginResetModel()
+        self.catalog = catalog
+        self._ids = ids
+        self._row_of = None
+        self.endResetModel()
+
+    def _row_for(self, name):
+        station_id = self.catalog.id_of(name) if name else None
+        if station_id is None:
+            return -1
+        if self._row_of is None:
+            self._row_of = {sid: row for row, sid in enumerate(self._ids)}
+        return self._row_of.get(station_id, -1)
+
+    def set_playing(self, name):
+        if name == self._playing:
+            return
+        rows = (self._row_for(self._playing), self._row_for(name))
+        self._playing = name
+        for row in rows:
+            if row >= 0:
+                idx = self.index(row)
+                self.dataChanged.emit(idx, idx, [PlayingRole])
+
+
+class StationDelegate(QStyledItemDelegate):
+    """Malt eine Sender-Kachel (Cover, Name, Play/Pause). Keine Widgets pro Sender."""
+    toggle_requested = Signal(int)
+
+    TILE = QSize(200, 175)
+    BUTTON = 40
+    HEALTH_COLORS = {"fast": QColor("#22c55e"), "slow": QColor("#eab308"), "dead": QColor("#ef4444")}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon_play = svg_to_pixmap(SVG_PLAY, 36)
+        self._icon_pause = svg_to_pixmap(SVG_PAUSE, 36)
+        self._title_font = QFont("Segoe UI")
+        self._title_font.setWeight(QFont.DemiBold)
+        # wie früher: Schriftgröße proportional zur Breite, 10-20 px
+        self._title_font.setPixelSize(max(10, min(20, (self.TILE.width() - 12) // 10)))
+        self._hover = (-1, False)    # (row, über dem Button?)
+
+    def sizeHint(self, option, index):
+        return self.TILE
+
+    def _button_rect(self, rect):
+        return QRect(rect.left() + (rect.width() - self.BUTTON) // 2,
+                     rect.bottom() - 16 - self.BUTTON, self.BUTTON, self.BUTTON)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = option.rect.adjusted(1, 1, -1, -1)
+        playing = bool(index.data(PlayingRole))
+        name = index.data(Qt.DisplayRole) or ""
+
+        # Kachel
+        if playing:
+            painter.setPen(QPen(QColor("#0f8000"), 4))
+            painter.setBrush(QColor(0, 128, 0, 6))
+            painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 8, 8)
+        else:
+            painter.setPen(QPen(QColor("#3b82f6"), 1))
+            painter.setBrush(QColor("#161b22"))
+            painter.drawRoundedRect(rect, 8, 8)
+
+        # Cover
+        painter.drawPixmap(rect.left() + (rect.width() - 48) // 2, rect.top() + 16,
+                           make_default_cover(48, name[:1], seed=name))
+
+        # Erreichbarkeit (grün schnell, gelb langsam, rot tot)
+        health = self.HEALTH_COLORS.get(index.data(HealthRole))
+        if health is not None:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(health)
+            painter.drawEllipse(rect.right() - 18, rect.top() + 8, 10, 10)
+
+        # Name
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#dfefff"))
+        text_rect = QRect(rect.left() + 6, rect.top() + 68, rect.width() - 12, 40)
+        title = QFontMetrics(self._title_font).elidedText(name, Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignCenter, title)
+
+        # Play/Pause-Button
+        button = self._button_rect(rect)
+        hover_row, hover_btn = self._hover
+        painter.setPen(QPen(QColor("#3b82f6"), 1))
+        painter.setBrush(QColor("#1e40af") if hover_btn and hover_row == index.row() else Qt.NoBrush)
+        painter.drawRoundedRect(button, 6, 6)
+        icon = self._icon_pause if playing else self._icon_play
+        painter.drawPixmap(button.center().x() - 17, button.center().y() - 17, icon)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseMove, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        on_button = self._button_rect(option.rect.adjusted(1, 1, -1, -1)).contains(event.position().toPoint())
+        if event.type() == QEvent.MouseMove:
+            if self._hover != (index.row(), on_button):
+                self._hover = (index.row(), on_button)
+                view = self.parent()
+                if view is not None:
+                    view.viewport().update()
+            return False
+        if event.button() == Qt.LeftButton and on_button:
+            self.toggle_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class InfoCard(QFrame):
@@ -422,6 +4455,10 @@ class InfoCard(QFrame):
         value_label.setObjectName("value")
         layout.addWidget(title_label)
         layout.addWidget(value_label)
+        self.value_label = value_label
+
+    def set_value(self, value):
+        self.value_label.setText(value)
 
     def enterEvent(self, event):
         self.setStyleSheet("""
@@ -464,6 +4501,8 @@ class InfoCard(QFrame):
         super().leaveEvent(event)
 
 class InfoTab(QWidget):
+    export_metrics_requested = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.build()
@@ -493,8 +4532,29 @@ class InfoTab(QWidget):
         w_layout.addWidget(InfoCard("Letztes Update", "2025-08-26"))
         w_layout.addWidget(InfoCard("Support", "https://beyonddevworks.github.io/BDW-Site/#contact"))
 
+        # Stream-Verbindung (Messwerte der laufenden Sitzung)
+        self.stream_card = InfoCard("Stream-Verbindung", "Kein Stream")
+        w_layout.addWidget(self.stream_card)
+        export_btn = QPushButton("Stream-Messwerte exportieren")
+        export_btn.setCursor(Qt.PointingHandCursor)
+        export_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #0a1a33;
+                color: #5dade2;
+                border: 1px solid #1f3b66;
+                border-radius: 6px;
+                padding: 6px 12px;
+            }
+            QPushButton:hover { background-color: #123057; }
+        """)
+        export_btn.clicked.connect(self.export_metrics_requested)
+        w_layout.addWidget(export_btn, alignment=Qt.AlignLeft)
+
         w_layout.addStretch()
 
+    def set_stream_metrics(self, text):
+        self.stream_card.set_value(text)
+
 class ClickableSlider(QSlider):
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -550,13 +4610,45 @@ class ClickableSlider(QSlider):
 
 
 
+def make_equalizer(values=None):
+    """Erzeugt den VLC-Equalizer mit Preamp und den gegebenen Band-Werten."""
+    eq = vlc.AudioEqualizer()
+    eq.set_preamp(12.0)  # +12 dB ~ ca. 200 %
+    for i, gain in enumerate(values or []):
+        eq.set_amp_at_index(float(gain), i)
+    return eq
+
+
 class EqualizerTab(QWidget):
-    def __init__(self, player: vlc.MediaPlayer, parent=None):
+    # Presets (Gain-Werte pro Band)
+    PRESETS = {
+        "Neutral":        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        "Rock":           [5, 3, 2, 0, -2, 0, 2, 4, 5, 5],
+        "Pop":            [-1, 2, 3, 4, 3, 2, 1, 0, -1, -2],
+        "Jazz":           [0, 2, 3, 2, 0, 2, 3, 2, 1, 0],
+        "Bass Boost":     [8, 6, 4, 2, 0, -2, -4, -6, -6, -6],
+        "Treble Boost":   [-4, -2, 0, 2, 4, 6, 8, 10, 10, 10],
+        "Vocal Boost":    [-2, -1, 2, 4, 5, 5, 3, 1, 0, -1],
+        "Classical":      [0, 0, 2, 3, 2, 0, 1, 2, 3, 3],
+        "Dance":          [5, 4, 2, 0, -2, 0, 3, 6, 7, 7],
+        "Electronic":     [6, 4, 3, 0, -2, 0, 4, 7, 8, 9],
+        "Hip-Hop":        [8, 6, 4, 2, 0, -1, 2, 4, 5, 6],
+        "Reggae":         [5, 4, 2, 0, -1, 0, 3, 5, 6, 6],
+        "Movie":          [3, 2, 1, 0, 0, 2, 3, 4, 5, 5],
+        "Gaming":         [6, 5, 3, 0, -1, 2, 4, 6, 7, 8],
+        "Podcast":        [-3, -2, 0, 3, 5, 5, 4, 2, 0, -1],
+        "Soft":           [-2, -1, 0, 0, 1, 1, 0, -1, -2, -3],
+        "Party":          [7, 5, 3, 0, -1, 1, 4, 6, 7, 8],
+        "Treble Cut":     [0, 0, -2, -4, -6, -6, -4, -2, 0, 0],
+        "Bass Cut":       [-6, -5, -3, 0, 1, 0, -2, -4, -5, -6],
+    }
+    changed = Signal()   # Band oder Preset geändert (zum Speichern)
+
+    def __init__(self, engine, eq=None, parent=None):
         super().__init__(parent)
-        self.player = player
-        self.eq = vlc.AudioEqualizer()
-        self.eq.set_preamp(12.0)  # +12 dB ~ ca. 200 %
-        self.player.set_equalizer(self.eq)
+        self.engine = engine
+        self.eq = eq if eq is not None else make_equalizer()
+        self.engine.set_equalizer(self.eq)
 
         main_layout = QVBoxLayout(self)
 
@@ -574,28 +4666,7 @@ class EqualizerTab(QWidget):
             (9, "16 kHz"),
         ]
 
-        # Presets (Gain-Werte pro Band)
-        self.presets = {
-            "Neutral":        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            "Rock":           [5, 3, 2, 0, -2, 0, 2, 4, 5, 5],
-            "Pop":            [-1, 2, 3, 4, 3, 2, 1, 0, -1, -2],
-            "Jazz":           [0, 2, 3, 2, 0, 2, 3, 2, 1, 0],
-            "Bass Boost":     [8, 6, 4, 2, 0, -2, -4, -6, -6, -6],
-            "Treble Boost":   [-4, -2, 0, 2, 4, 6, 8, 10, 10, 10],
-            "Vocal Boost":    [-2, -1, 2, 4, 5, 5, 3, 1, 0, -1],
-            "Classical":      [0, 0, 2, 3, 2, 0, 1, 2, 3, 3],
-            "Dance":          [5, 4, 2, 0, -2, 0, 3, 6, 7, 7],
-            "Electronic":     [6, 4, 3, 0, -2, 0, 4, 7, 8, 9],
-            "Hip-Hop":        [8, 6, 4, 2, 0, -1, 2, 4, 5, 6],
-            "Reggae":         [5, 4, 2, 0, -1, 0, 3, 5, 6, 6],
-            "Movie":          [3, 2, 1, 0, 0, 2, 3, 4, 5, 5],
-            "Gaming":         [6, 5, 3, 0, -1, 2, 4, 6, 7, 8],
-            "Podcast":        [-3, -2, 0, 3, 5, 5, 4, 2, 0, -1],
-            "Soft":           [-2, -1, 0, 0, 1, 1, 0, -1, -2, -3],
-            "Party":          [7, 5, 3, 0, -1, 1, 4, 6, 7, 8],
-            "Treble Cut":     [0, 0, -2, -4, -6, -6, -4, -2, 0, 0],
-            "Bass Cut":       [-6, -5, -3, 0, 1, 0, -2, -4, -5, -6],
-        }
+        self.presets = self.PRESETS
 
         # Preset-Auswahl
         self.preset_box = QComboBox()
@@ -678,11 +4749,10 @@ class EqualizerTab(QWidget):
     def set_band_gain(self, band_index, gain_value):
         """Setzt den Gain für ein bestimmtes Band"""
         self.eq.set_amp_at_index(float(gain_value), band_index)
-        self.player.set_equalizer(self.eq)
+        self.engine.set_equalizer(self.eq)
 
-        # Automatisch speichern
-        if hasattr(self.parent(), "save_settings"):
-            self.parent().save_settings()
+        # Automatisch speichern (gebündelt, siehe SettingsStore)
+        self.changed.emit()
 
     def apply_preset(self, preset_name):
         """Preset-Werte auf die Slider anwenden"""
@@ -693,11 +4763,10 @@ class EqualizerTab(QWidget):
             self.sliders[i].blockSignals(False)
             self.eq.set_amp_at_index(float(gain), i)
 
-        self.player.set_equalizer(self.eq)
+        self.engine.set_equalizer(self.eq)
 
-        # Automatisch speichern
-        if hasattr(self.parent(), "save_settings"):
-            self.parent().save_settings()
+        # Automatisch speichern (gebündelt, siehe SettingsStore)
+        self.changed.emit()
     
     def get_current_eq_values(self):
         """Gibt die aktuellen Slider-Werte als Liste zurück"""
@@ -710,7 +4779,7 @@ class EqualizerTab(QWidget):
             self.sliders[i].setValue(gain)
             self.sliders[i].blockSignals(False)
             self.eq.set_amp_at_index(float(gain), i)
-        self.player.set_equalizer(self.eq)
+        self.engine.set_equalizer(self.eq)
     
     def get_current_preset(self):
         """Gibt den aktuell ausgewählten Preset-Namen zurück"""
@@ -725,10 +4794,9 @@ class EqualizerTab(QWidget):
 
 # ---------------- Main Player ----------------
 class OverseerPlayer(QMainWindow):
-    def __init__(self, vlc_player):
+    def __init__(self, engine, update_checker=None):
         super().__init__()
-        self.player = vlc_player
-        self.vlc_instance = vlc.Instance('--gain=2.0')
+        self.engine = engine
         def get_root_path():
             # Wenn als EXE kompiliert
             if getattr(sys, 'frozen', False):
@@ -750,30 +4818,88 @@ class OverseerPlayer(QMainWindow):
         set_dark_titlebar(hwnd, True)
 
                 # ---------------- Medienstatus ----------------
-        self.playlist = []
+        self.playlist = Playlist()
         self.is_user_seeking = False
         self.current_index = -1           # aktuell gespieltes Playlist-Item
         self.current_media_type = None    # "playlist" oder "stream"
+        self._shuffle_next = None         # im Voraus ausgewürfelter Shuffle-Titel (zum Vorladen)
         self.is_playing = False
         self._old_volume = 100            # für Mute/Unmute
 
+        # Cover/Titel der Playlist-Zeilen werden im Hintergrund gelesen
+        self._meta_loaded = set()         # paths mit fertigen Metadaten
+        self.thumbs = ThumbnailCache()
+        self.meta_loader = MetadataLoader(self.thumbs, self.engine, size=52, max_workers=4, parent=self)
+        self.prober = StreamProber(parent=self)
+        # Bibliothek: importierte Ordner werden im Hintergrund abgeglichen
+        self.library = MediaLibrary(engine=self.engine)
+        self.library_sync = LibrarySync(self.library, parent=self)
+        self.library_sync.finished.connect(self._on_library_synced)
+        self.library_sync.texts_ready.connect(self._on_library_texts)
+        self.folder_watcher = FolderWatcher(parent=self)
+        self.folder_watcher.changed.connect(self._on_folder_changes)
+        # Ordner-Import läuft parallel im Hintergrund und füllt die Playlist paketweise
+        self.folder_scanner = FolderScanner(parent=self)
+        self.folder_scanner.batch_ready.connect(self._on_scan_batch)
+        self.folder_scanner.progress.connect(self._on_scan_progress)
+        self.folder_scanner.finished.connect(self._on_scan_finished)
+        self.meta_loader.loaded.connect(self._on_metadata_loaded)
+        self._meta_timer = QTimer(self)
+        self._meta_timer.setSingleShot(True)
+        self._meta_timer.setInterval(50)
+        self._meta_timer.timeout.connect(self._request_visible_metadata)
+
         # settings
-        self.settings = DEFAULT_SETTINGS.copy()
-        self.load_settings()
+        self.store = SettingsStore(defaults=DEFAULT_SETTINGS, parent=self)
+        self.settings = self.store.load()
 
 
         # UI build
         self._build_ui()
 
-        # timers
+        # Update-Check läuft im Hintergrund, der Button erscheint erst mit dem Ergebnis
+        if update_checker is None:
+            update_checker = UpdateChecker(parent=self)
+            update_checker.start()
+        self.update_checker = update_checker
+        self.update_checker.finished.connect(self._on_update_checked)
+        # Der Splash startet den Check schon vor dem Fenster: ein Ergebnis, das während des
+        # Aufbaus gemeldet wurde, liegt noch als Event in der Queue und erreicht nur
+        # _remember - daher nachsehen, sobald die Event-Loop wieder läuft
+        QTimer.singleShot(0, self._apply_pending_update)
+
+        # Wiedergabe-Ereignisse der Engine (aus dem VLC-Thread, queued in den GUI-Thread)
+        events = self.engine.events
+        events.state_changed.connect(self._on_engine_state, Qt.QueuedConnection)
+        events.length_changed.connect(self._on_length_changed, Qt.QueuedConnection)
+        events.end_reached.connect(self._on_track_ended, Qt.QueuedConnection)
+        events.error.connect(self._on_engine_error, Qt.QueuedConnection)
+        events.track_changed.connect(self._on_track_changed, Qt.QueuedConnection)
+        events.now_playing.connect(self._on_now_playing, Qt.QueuedConnection)
+        self.engine.gapless = bool(self.settings.get("gapless", True))
+        self.engine.crossfade_ms = int(self.settings.get("crossfade_ms", 0))
+
+        # Nächsten Titel vorladen, sobald sich Playlist oder Reihenfolge ändern
+        self._preload_timer = QTimer(self)
+        self._preload_timer.setSingleShot(True)
+        self._preload_timer.setInterval(100)
+        self._preload_timer.timeout.connect(self._preload_next)
+        for sig in (self.playlist_model.rowsInserted, self.playlist_model.rowsRemoved,
+                    self.playlist_model.modelReset, self.playlist_model.renamed):
+            sig.connect(self._preload_timer.start)
+        self.shuffle_btn.toggled.connect(self._on_order_changed)
+        self.repeat_btn.toggled.connect(self._on_order_changed)
+        self.shuffle_btn.toggled.connect(self.save_settings)
+        self.repeat_btn.toggled.connect(self.save_settings)
+
+        # Positionsanzeige: läuft nur, solange das Fenster sichtbar ist und etwas spielt
         self.timer = QTimer(self)
         self.timer.setInterval(500)
-        self.timer.timeout.connect(self._on_timer)
-        self.timer.start()
+        self.timer.timeout.connect(self._update_position)
 
         # apply settings
         self.volume_slider.setValue(self.settings.get("volume", 80))
-        self.player.audio_set_volume(self.volume_slider.value())
+        self.engine.set_volume(self.volume_slider.value())
         self.shuffle_btn.setChecked(self.settings.get("shuffle", False))
         self.repeat_btn.setChecked(self.settings.get("repeat", False))
 
@@ -783,8 +4909,6 @@ class OverseerPlayer(QMainWindow):
         root_layout.setContentsMargins(12, 12, 12, 12)
         self.setCentralWidget(root)
 
-        latest_version = get_latest_version().lstrip("v")
-
         # -----------------------------------------------------
         # Top Bar
         # -----------------------------------------------------
@@ -793,12 +4917,13 @@ class OverseerPlayer(QMainWindow):
         label.setStyleSheet("font-weight:700; font-size:18px; color:#60A5FA;")
         top_row.addWidget(label)
 
-        # Update-Button
-        btn_update = QPushButton(f"Update verfügbar! (aktuell: v{APP_VERSION} → neu: v{latest_version})")
+        # Update-Button (erst sichtbar, wenn der Hintergrund-Check ein Update meldet)
+        btn_update = QPushButton()
         btn_update.setIcon(svg_to_icon(SVG_UPDATEBTN, 20))
         btn_update.setToolTip("Neue Version verfügbar! Jetzt herunterladen")
-        btn_update.clicked.connect(lambda: webbrowser.open("https://beyonddevworks.github.io/BDW-Site/#home"))
-        btn_update.setVisible(is_update_available())  # nur anzeigen, wenn nötig
+        btn_update.clicked.connect(self._open_download_page)
+        btn_update.setVisible(False)
+        self.btn_update = btn_update
         btn_update.setStyleSheet("""
             QPushButton {
                 background-color: #1e293b;   /* dunkler Hintergrund */
@@ -837,151 +4962,38 @@ class OverseerPlayer(QMainWindow):
         root_layout.addLayout(top_row)
 
         # Tabs: Playlist / Webradio
+        # Webradio, Equalizer und Info werden erst beim ersten Öffnen aufgebaut
         self.tabs = QTabWidget()
         self.tab_playlist = QWidget()
         self.tab_webradio = QWidget()
-        self.tab_equalizer = EqualizerTab(self.player, parent=self)  # player ist dein vlc.MediaPlayer
-        self.tab_info = InfoTab()
+        self.tab_equalizer_container = QWidget()
+        self.tab_info_container = QWidget()
+        self.tab_equalizer = None
+        self.tab_info = None
         self.tabs.addTab(self.tab_playlist, "Playlist")
         self.tabs.addTab(self.tab_webradio, "Webradio")
-        self.tabs.addTab(self.tab_equalizer, "Equalizer")
-        self.tabs.addTab(self.tab_info, "Info")
+        self.tabs.addTab(self.tab_equalizer_container, "Equalizer")
+        self.tabs.addTab(self.tab_info_container, "Info")
         root_layout.addWidget(self.tabs, stretch=1)
+        self._lazy_tabs = {1: self._build_webradio_tab, 2: self._build_equalizer_tab, 3: self._build_info_tab}
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # ---------------- EQ ----------------
-        if "eq_values" in self.settings:
-            self.tab_equalizer.set_eq_values(self.settings["eq_values"])
-        if "eq_preset" in self.settings:
-            self.tab_equalizer.set_preset(self.settings["eq_preset"])
-
-        # Playlist tab layout
-        p_layout = QHBoxLayout(self.tab_playlist)
-        self.playlist_widget = QListWidget()
-        self.playlist_widget.setSpacing(6)
-        self.playlist_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        p_layout.addWidget(self.playlist_widget, stretch=3)
-
-                # restore playlist
-        last_playlist = self.settings.get("last_playlist", [])
-        print("DEBUG: last_playlist =", last_playlist)
-
-        valid = [p for p in last_playlist if os.path.exists(p) and p.lower().endswith(SUPPORTED_FORMATS)]
-        print("DEBUG: valid playlist =", valid)
-
-        if valid:
-            self.load_playlist(valid)
-            print("DEBUG: Playlist restored.")
+        # gespeicherter EQ wirkt sofort, auch ohne dass der Tab gebaut ist
+        preset = self.settings.get("eq_preset")
+        if preset in EqualizerTab.PRESETS:
+            self.equalizer_values = list(EqualizerTab.PRESETS[preset])
         else:
-            print("DEBUG: No valid playlist to restore.")
-
-        self.setAcceptDrops(True)
-
-        # right panel with cover/meta
-        right_panel = QVBoxLayout()
-        self.cover_label = QLabel()
-        self.cover_label.setFixedSize(260, 260)
-        self.cover_label.setPixmap(make_default_cover(260))
-        right_panel.addWidget(self.cover_label, alignment=Qt.AlignCenter)
-        self.meta_label = QLabel("Kein Titel geladen")
-        self.meta_label.setWordWrap(True)
-        right_panel.addWidget(self.meta_label, alignment=Qt.AlignTop)
-        right_panel.addStretch()
-        p_layout.addLayout(right_panel, stretch=1)
-
-        # ---------------- Webradio Tab ----------------
-        w_layout = QVBoxLayout(self.tab_webradio)
-        top_layout = QHBoxLayout()
-        w_layout.addLayout(top_layout)
-
-        # Suchfeld
-        self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Sender suchen...")
-        top_layout.addWidget(self.search_bar)
-
-        # In der w_layout-Sektion, füge dies nach der Suchleiste ein
-        # ----------------------------------------------------
-        
-        # UKW-Button zum neuen Layout hinzufügen
-        self.ukw_filter_btn = QPushButton("UKW")
-        self.ukw_filter_btn.setCheckable(True)
-        self.ukw_filter_btn.setFixedSize(60, 30) # Macht den Button klein und kompakt
-        self.ukw_filter_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border-radius: 8px;
-                padding: 6px 10px;
-                font-size: 14px;
-            }
-            QPushButton:checked {
-                background-color: #20F556;
-                border: 1px solid #0C591C;
-            }
-            QPushButton:hover {
-                background-color: #1e40af;
-                border: 1px solid #1c3272;
-            }
-            QPushButton:checked:hover {
-                background-color: #17612A;
-                border: 1px solid #0C591C;
-            }
-        """)
-        top_layout.addWidget(self.ukw_filter_btn)
-
-        # Featured-Button zum neuen Layout hinzufügen
-        self.featured_filter_btn = QPushButton("Featured")
-        self.featured_filter_btn.setCheckable(True)
-        self.featured_filter_btn.setFixedSize(90, 30) # Etwas breiter für den längeren Text
-        self.featured_filter_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border-radius: 8px;
-                padding: 6px 10px;
-                font-size: 14px;
-            }
-            QPushButton:checked {
-                background-color: #20F556;
-                border: 1px solid #0C591C;
-            }
-            QPushButton:hover {
-                background-color: #1e40af;
-                border: 1px solid #1c3272;
-            }
-            QPushButton:checked:hover {
-                background-color: #17612A;
-                border: 1px solid #0C591C;
-            }
-        """)
-        top_layout.addWidget(self.featured_filter_btn)
-
-        # Um sicherzustellen, dass die Suchleiste den meisten Platz einnimmt,
-        # kannst du einen Stretch-Faktor hinzufügen:
-        top_layout.setStretch(0, 1) # Index 0 ist die Suchleiste, Stretch-Faktor 1
-
-        # ScrollArea für Grid
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        w_layout.addWidget(scroll)
-        scroll.setStyleSheet("""
-                background: #161b22; 
-                border-radius: 8px; 
-                padding: 6px; 
-                border: 1px solid #1f2937; 
-                outline: none; /* Fokus-Rahmen aus */
-        """)
-
-        # Container-Widget für Grid
-        self.grid_container = QWidget()
-        scroll.setWidget(self.grid_container)
-        self.grid_layout = QGridLayout(self.grid_container)
-        self.grid_layout.setSpacing(10)
-        self.grid_layout.setContentsMargins(8, 8, 8, 8)
-        self.grid_container.setStyleSheet("""
-                border: none !important; /* Fokus-Rahmen aus */
-        """)
-
+            self.equalizer_values = list(self.settings.get("eq_values", [0] * 10))
+        self.equalizer = make_equalizer(self.equalizer_values)
+        self.engine.set_equalizer(self.equalizer)
+
+        # Webradio-Daten (das Grid selbst entsteht in _build_webradio_tab)
+        self.playing_stream = None  # Name des laufenden Senders (für die Markierung im Webradio-Tab)
+        self.station_history = StationHistory()  # zuletzt gespielte Titel je Sender (ICY)
+        self.timeshift = None       # StreamRecorder des laufenden Senders
+        self.stream_session = None  # StreamSession des laufenden Senders (Neuverbinden, Messwerte)
+        self.stream_metrics = None  # letzte Messwerte (für den Info-Tab)
         # Beispiel-Streams
         self.streams = {
             "TECHNOBASE.FM": {"url": "https://listener1.aachd.tb-group.fm/tb-hd.aac", "type": "web", "featured": True},
@@ -996,92 +5008,22 @@ class OverseerPlayer(QMainWindow):
             "Antenne Bayern": {"url": "https://stream.antenne.de/antenne/stream/aacp", "type": "ukw", "featured": False}, # Beispiel für einen UKW-Sender
             "Maximal Radio": {"url": "http://radiotrausnitz.cast.addradio.de/radiotrausnitz/live/mp3/high?ar-distributor=f0b7", "type": "ukw", "featured": False} # Beispiel für einen UKW-Sender
         }
-
-        self._original_streams = list(self.streams.keys())
-        self.stream_buttons = {}  # <--- hier wird das Dictionary angelegt
-        self.stream_boxes = {}  # Name -> Box Widget
-
-        def add_stream_box(name, row, col):
-            widget = QWidget()
-            widget.setMinimumSize(200, 175)
-            widget.setMaximumSize(200, 175)
-            widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            widget.setStyleSheet("""
-                background-color: #161b22;
-                border: 1px solid #3b82f6;
-                border-radius: 8px;
-            """)
-
-            layout = QVBoxLayout(widget)
-            layout.setContentsMargins(6, 6, 6, 6)
-            layout.setSpacing(4)
-
-            cover = QLabel()
-            cover.setPixmap(make_default_cover(48, name[0]))
-            cover.setFixedSize(48, 48)
-            cover.setAlignment(Qt.AlignCenter)
-            layout.addWidget(cover, alignment=Qt.AlignHCenter)
-            cover.setStyleSheet("""
-                background: transparent;
-                border: none !important; /* Fokus-Rahmen aus */
-            """)
-
-            label = QLabel(name)
-            label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("""
-                background: transparent;
-                color: #dfefff;
-                font-weight: 600;
-                font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif;
-                border: none !important; /* Fokus-Rahmen aus */
-            """)
-
-            def adjust_font():
-                w = label.width()
-                # passt die Schrift proportional an die Breite an
-                size = max(10, min(20, w // 10))  # min 10px, max 20px
-                label.setStyleSheet(f"""
-                    background: transparent;
-                    color: #dfefff;
-                    font-weight: 600;
-                    font-size: {size}px;
-                    font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif;
-                    border: none !important; /* Fokus-Rahmen aus */
-                """)
-
-            label.resizeEvent = lambda event: adjust_font()
-            layout.addWidget(label)
-
-            btn = QPushButton()
-            btn.setIcon(svg_to_icon(SVG_PLAY))
-            btn.setIconSize(QSize(36, 36))
-            btn.setFixedSize(40, 40)
-            # In der Funktion, die die Buttons erstellt:
-            btn.clicked.connect(lambda checked, n=name, u=self.streams[name]['url']: self.toggle_stream(checked, n, u))
-            layout.addWidget(btn, alignment=Qt.AlignHCenter)
-
-            layout.addSpacing(10) 
-
-            # Beim Abspielen ändern
-
-            self.grid_layout.addWidget(widget, row, col)
-            self.stream_boxes[name] = widget  # speichern für Search / Markierung
-                # speichern
-            self.stream_buttons[name] = btn
-
-        cols = 5  # Ein initialer Wert für die korrekte Anordnung beim ersten Mal
-        for index, name in enumerate(self._original_streams):
-            row = index // cols
-            col = index % cols
-            add_stream_box(name, row, col) # Die Methode add_stream_box füllt das stream_boxes-Dictionary.
-
-        self.search_bar.textChanged.connect(lambda: self.update_stream_grid())
-        self.ukw_filter_btn.clicked.connect(lambda: self.update_stream_grid())
-        self.featured_filter_btn.clicked.connect(lambda: self.update_stream_grid())
+        self.catalog = StationCatalog()
+        self.catalog.add_dict(self.streams)
 
 
-        # Suchfeld Styling
-        self.search_bar.setStyleSheet("""
+        # Playlist tab layout
+        p_layout = QHBoxLayout(self.tab_playlist)
+        self.playlist_model = PlaylistModel(self)
+        self.playlist = self.playlist_model.paths
+        self.playlist_model.cover_needed.connect(lambda path: self.meta_loader.request(path, urgent=True))
+        self.playlist_filter = PlaylistFilterModel(self.playlist_model, self)
+        self.store.watch_playlist(self.playlist_model)
+        list_column = QVBoxLayout()
+        self.playlist_search = QLineEdit()
+        self.playlist_search.setPlaceholderText("Playlist durchsuchen...")
+        self.playlist_search.setClearButtonEnabled(True)
+        self.playlist_search.setStyleSheet("""
             QLineEdit {
                 background-color: #0A1F44;
                 color: #4DA3FF;
@@ -1095,6 +5037,55 @@ class OverseerPlayer(QMainWindow):
                 background-color: #0F2A5F;
             }
         """)
+        # Index-Suche ist schnell genug für jeden Tastendruck
+        self.playlist_search.textChanged.connect(self._filter_playlist)
+        list_column.addWidget(self.playlist_search)
+        for sig in (self.playlist_model.rowsInserted, self.playlist_model.rowsRemoved,
+                    self.playlist_model.modelReset, self.playlist_model.renamed):
+            sig.connect(self._refilter_playlist)
+        self.playlist_view = QListView()
+        self.playlist_view.setModel(self.playlist_model)
+        self.playlist_view.setSpacing(6)
+        self.playlist_view.setUniformItemSizes(True)
+        self.playlist_view.setMouseTracking(True)
+        self.playlist_view.viewport().setAttribute(Qt.WA_Hover, True)
+        self.playlist_view.setEditTriggers(QListView.NoEditTriggers)
+        self.playlist_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.playlist_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.playlist_delegate = PlaylistDelegate(self.playlist_view)
+        self.playlist_delegate.play_requested.connect(lambda row: self.play_track(self._source_row(row)))
+        self.playlist_delegate.delete_requested.connect(lambda row: self._delete_by_index(self._source_row(row)))
+        self.playlist_view.setItemDelegate(self.playlist_delegate)
+        list_column.addWidget(self.playlist_view)
+        p_layout.addLayout(list_column, stretch=3)
+        self.playlist_view.verticalScrollBar().valueChanged.connect(lambda _: self._meta_timer.start())
+
+        self.setAcceptDrops(True)
+
+        # right panel with cover/meta
+        right_panel = QVBoxLayout()
+        self.cover_label = QLabel()
+        self.cover_label.setFixedSize(260, 260)
+        self.cover_label.setPixmap(make_default_cover(260))
+        right_panel.addWidget(self.cover_label, alignment=Qt.AlignCenter)
+        self.meta_label = QLabel("Kein Titel geladen")
+        self.meta_label.setWordWrap(True)
+        right_panel.addWidget(self.meta_label, alignment=Qt.AlignTop)
+        # Fortschritt beim Ordner-Import
+        self.scan_panel = QWidget()
+        scan_row = QHBoxLayout(self.scan_panel)
+        scan_row.setContentsMargins(0, 0, 0, 0)
+        self.scan_label = QLabel()
+        self.scan_label.setStyleSheet("color:#94a3b8; font-size:11px;")
+        scan_row.addWidget(self.scan_label, stretch=1)
+        scan_cancel = QPushButton("Abbrechen")
+        scan_cancel.setToolTip("Ordner-Import abbrechen")
+        scan_cancel.clicked.connect(self.folder_scanner.cancel)
+        scan_row.addWidget(scan_cancel)
+        self.scan_panel.setVisible(False)
+        right_panel.addWidget(self.scan_panel)
+        right_panel.addStretch()
+        p_layout.addLayout(right_panel, stretch=1)
 
         # timeline
         timeline_row = QHBoxLayout()
@@ -1232,17 +5223,27 @@ class OverseerPlayer(QMainWindow):
         self.repeat_btn.setStyleSheet(base_btn_style)
         controls.addWidget(self.repeat_btn)
 
+        # Mitschnitt speichern (nur bei Webradio mit Time-Shift)
+        self.record_btn = QPushButton()
+        self.record_btn.setIcon(svg_to_icon(SVG_RECORD, 18))
+        self.record_btn.setFixedSize(40, 40)
+        self.record_btn.setCursor(Qt.PointingHandCursor)
+        self.record_btn.setToolTip("Mitschnitt speichern")
+        self.record_btn.setStyleSheet(base_btn_style)
+        self.record_btn.setEnabled(False)
+        self.record_btn.clicked.connect(self.export_timeshift)
+        controls.addWidget(self.record_btn)
+
         bl.addLayout(controls)
 
         # volume right
         
         self._old_volume = self.settings["volume"]
-        self.settings = {"volume": self._old_volume}
 
         vol_layout = QHBoxLayout()
         vol_layout.addStretch()
         vol_icon = QPushButton()
-        vol_icon.setIcon(svg_to_icon(SVG_VOLUME, 18).pixmap(18, 18))
+        vol_icon.setIcon(svg_to_icon(SVG_VOLUME, 18))
         vol_icon.clicked.connect(self.vol_mute)
         vol_layout.addWidget(vol_icon)
         self.volume_slider = ClickableSlider(Qt.Horizontal)
@@ -1324,8 +5325,8 @@ class OverseerPlayer(QMainWindow):
                 border: 2px solid #60a5fa; 
             }
 
-            /* Playlist / QListWidget */
-            QListWidget { 
+            /* Playlist / QListView */
+            QListView { 
                 background: #161b22; 
                 border-radius: 8px; 
                 padding: 6px; 
@@ -1333,11 +5334,11 @@ class OverseerPlayer(QMainWindow):
                 color: #dfefff;
                 outline: none; /* Fokus-Rahmen aus */
             }
-            QListWidget::item { 
+            QListView::item { 
                 border-radius: 8px; 
                 background: transparent;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background: rgba(88,166,255,0.2);
                 color: white;
             }
@@ -1413,6 +5414,204 @@ class OverseerPlayer(QMainWindow):
         self.play_btn.setObjectName("playButton")
 
 
+    # ---------------- Lazy Tabs ----------------
+    def _on_tab_changed(self, index):
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is not None:
+            builder()
+
+    def _build_equalizer_tab(self):
+        self.tab_equalizer = EqualizerTab(self.engine, self.equalizer, parent=self)
+        self.tab_equalizer.set_eq_values(self.equalizer_values)
+        if self.settings.get("eq_preset") in EqualizerTab.PRESETS:
+            self.tab_equalizer.preset_box.blockSignals(True)
+            self.tab_equalizer.preset_box.setCurrentText(self.settings["eq_preset"])
+            self.tab_equalizer.preset_box.blockSignals(False)
+        self.tab_equalizer.changed.connect(self.save_settings)
+        QVBoxLayout(self.tab_equalizer_container).addWidget(self.tab_equalizer)
+
+    def _build_info_tab(self):
+        self.tab_info = InfoTab()
+        self.tab_info.set_stream_metrics(format_stream_metrics(self.stream_metrics))
+        self.tab_info.export_metrics_requested.connect(self.export_stream_metrics)
+        QVBoxLayout(self.tab_info_container).addWidget(self.tab_info)
+
+    def _build_webradio_tab(self):
+        w_layout = QVBoxLayout(self.tab_webradio)
+        top_layout = QHBoxLayout()
+        w_layout.addLayout(top_layout)
+
+        # Suchfeld
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Sender suchen...")
+        top_layout.addWidget(self.search_bar)
+
+        # In der w_layout-Sektion, füge dies nach der Suchleiste ein
+        # ----------------------------------------------------
+        
+        # UKW-Button zum neuen Layout hinzufügen
+        self.ukw_filter_btn = QPushButton("UKW")
+        self.ukw_filter_btn.setCheckable(True)
+        self.ukw_filter_btn.setFixedSize(60, 30) # Macht den Button klein und kompakt
+        self.ukw_filter_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #3b82f6;
+                color: white;
+                border-radius: 8px;
+                padding: 6px 10px;
+                font-size: 14px;
+            }
+            QPushButton:checked {
+                background-color: #20F556;
+                border: 1px solid #0C591C;
+            }
+            QPushButton:hover {
+                background-color: #1e40af;
+                border: 1px solid #1c3272;
+            }
+            QPushButton:checked:hover {
+                background-color: #17612A;
+                border: 1px solid #0C591C;
+            }
+        """)
+        top_layout.addWidget(self.ukw_filter_btn)
+
+        # Featured-Button zum neuen Layout hinzufügen
+        self.featured_filter_btn = QPushButton("Featured")
+        self.featured_filter_btn.setCheckable(True)
+        self.featured_filter_btn.setFixedSize(90, 30) # Etwas breiter für den längeren Text
+        self.featured_filter_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #3b82f6;
+                color: white;
+                border-radius: 8px;
+                padding: 6px 10px;
+                font-size: 14px;
+            }
+            QPushButton:checked {
+                background-color: #20F556;
+                border: 1px solid #0C591C;
+            }
+            QPushButton:hover {
+                background-color: #1e40af;
+                border: 1px solid #1c3272;
+            }
+            QPushButton:checked:hover {
+                background-color: #17612A;
+                border: 1px solid #0C591C;
+            }
+        """)
+        top_layout.addWidget(self.featured_filter_btn)
+
+        # Um sicherzustellen, dass die Suchleiste den meisten Platz einnimmt,
+        # kannst du einen Stretch-Faktor hinzufügen:
+        top_layout.setStretch(0, 1) # Index 0 ist die Suchleiste, Stretch-Faktor 1
+
+        # Sender-Kacheln: ein Model mit IDs, gemalt werden nur die sichtbaren Kacheln
+        self.station_model = StationModel(self.catalog, self.prober, self)
+        self.station_model.set_playing(self.playing_stream)
+        self.station_view = QListView()
+        self.station_view.setModel(self.station_model)
+        self.station_view.setViewMode(QListView.IconMode)
+        self.station_view.setFlow(QListView.LeftToRight)
+        self.station_view.setWrapping(True)
+        self.station_view.setResizeMode(QListView.Adjust)
+        self.station_view.setMovement(QListView.Static)
+        self.station_view.setUniformItemSizes(True)
+        self.station_view.setSpacing(5)
+        self.station_view.setSelectionMode(QListView.NoSelection)
+        self.station_view.setEditTriggers(QListView.NoEditTriggers)
+        self.station_view.setMouseTracking(True)
+        self.station_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.station_delegate = StationDelegate(self.station_view)
+        self.station_delegate.toggle_requested.connect(self._on_station_toggle)
+        self.station_view.setItemDelegate(self.station_delegate)
+        w_layout.addWidget(self.station_view)
+        # Sichtbare Sender werden im Hintergrund angepingt (Punkt oben rechts)
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setSingleShot(True)
+        self._probe_timer.setInterval(300)
+        self._probe_timer.timeout.connect(self._probe_visible_stations)
+        self.station_view.verticalScrollBar().valueChanged.connect(self._probe_timer.start)
+        self._health_timer = QTimer(self)
+        self._health_timer.setSingleShot(True)
+        self._health_timer.setInterval(250)
+        self._health_timer.timeout.connect(self.station_model.refresh_health)
+        self.prober.probed.connect(self._health_timer.start)
+        self.station_view.setStyleSheet("""
+            QListView {
+                background: #161b22;
+                border-radius: 8px;
+                padding: 6px;
+                border: 1px solid #1f2937;
+                outline: none; /* Fokus-Rahmen aus */
+            }
+        """)
+
+        # Große Senderlisten (stations.json / stations.csv) kommen im Hintergrund dazu
+        self.station_loader = StationDumpLoader(self.streams, parent=self)
+        self.station_loader.finished.connect(self._on_station_dumps_loaded)
+        self.station_loader.start()
+        self._stream_filter_key = None   # Filterzustand der angezeigten Treffer
+
+        # Tippen wird gebündelt, erst nach einer kurzen Pause wird gefiltert
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.update_stream_grid)
+        self.search_bar.textChanged.connect(self._search_timer.start)
+        self.ukw_filter_btn.clicked.connect(lambda: self.update_stream_grid())
+        self.featured_filter_btn.clicked.connect(lambda: self.update_stream_grid())
+        QTimer.singleShot(0, self.update_stream_grid)
+
+
+        # Suchfeld Styling
+        self.search_bar.setStyleSheet("""
+            QLineEdit {
+                background-color: #0A1F44;
+                color: #4DA3FF;
+                border: 2px solid #1E3A70;
+                border-radius: 8px;
+                padding: 6px 10px;
+                font-size: 14px;
+            }
+            QLineEdit:focus {
+                border: 2px solid #4DA3FF;
+                background-color: #0F2A5F;
+            }
+        """)
+
+
+    def restore_playlist(self):
+        """Stellt die Playlist der letzten Sitzung wieder her."""
+        last_playlist = self.store.load_playlist()
+        print("DEBUG: last_playlist =", len(last_playlist), "Einträge")
+
+        valid = [p for p in last_playlist if os.path.exists(p) and p.lower().endswith(SUPPORTED_FORMATS)]
+
+        if valid:
+            self.load_playlist(valid)
+            if len(valid) == len(last_playlist):
+                self.store.mark_playlist_saved()   # unverändert, nicht neu schreiben
+            print("DEBUG: Playlist restored.")
+        else:
+            print("DEBUG: No valid playlist to restore.")
+        # bekannte Ordner abgleichen, wenn der Start durch ist
+        QTimer.singleShot(LIBRARY_SYNC_DELAY_MS, self.library_sync.start)
+
+    def _open_download_page(self):
+        import webbrowser
+        webbrowser.open("https://beyonddevworks.github.io/BDW-Site/#home")
+
+    def _apply_pending_update(self):
+        if self.update_checker.latest is not None:
+            self._on_update_checked(self.update_checker.latest)
+
+    def _on_update_checked(self, latest):
+        if is_update_available(latest):
+            self.btn_update.setText(f"Update verfügbar! (aktuell: v{APP_VERSION} → neu: v{latest.lstrip('v')})")
+            self.btn_update.setVisible(True)
+
     # ---------------- Drag & Drop ----------------
     def dragEnterEvent(self, ev):
         if ev.mimeData().hasUrls():
@@ -1421,59 +5620,108 @@ class OverseerPlayer(QMainWindow):
     def dropEvent(self, ev):
         urls = ev.mimeData().urls()
         added = False
+        folders = []
         for u in urls:
             p = u.toLocalFile()
             if os.path.isdir(p):
-                for root, _, files in os.walk(p):
-                    for f in files:
-                        if f.lower().endswith(SUPPORTED_FORMATS):
-                            self._add_to_playlist(os.path.join(root, f))
-                            added = True
+                folders.append(p)
             else:
                 if p.lower().endswith(SUPPORTED_FORMATS):
                     self._add_to_playlist(p)
                     added = True
+        if folders:
+            self.folder_scanner.scan(folders)
         if added and not self.is_playing and self.current_index == -1 and self.playlist:
             self.play_track(0)
 
     # ---------------- Playlist management ----------------
     def _add_to_playlist(self, path):
-        if path in self.playlist:
+        # Zeile sofort mit Platzhalter anzeigen, Cover/Titel kommen vom MetadataLoader
+        if self.playlist_model.append(path):
+            self._meta_timer.start()
+
+    def _request_visible_metadata(self):
+        """Fordert Metadaten nur für sichtbare Zeilen (plus Puffer) an, der Rest wird verworfen."""
+        filtered = self.playlist_view.model() is self.playlist_filter
+        count = self.playlist_filter.rowCount() if filtered else len(self.playlist)
+        if count == 0:
             return
-        self.playlist.append(path)
-        cover = self._cover_pixmap(path, size=52)
-        widget = PlaylistItemWidget(os.path.basename(path), cover)
-        item = QListWidgetItem()
-        item.setSizeHint(widget.sizeHint())
-        item.setData(Qt.UserRole, path)
-        self.playlist_widget.addItem(item)
-        self.playlist_widget.setItemWidget(item, widget)
-
-        # connect signals
-        widget.play_requested.connect(lambda p=path: self._on_item_play(p))
-        widget.delete_requested.connect(lambda p=path: self._on_item_delete(p))
-
-    def _on_item_play(self, path):
-        try:
-            idx = self.playlist.index(path)
-            self.play_track(idx)
-        except ValueError:
-            pass
 
-    def _on_item_delete(self, path):
-        try:
-            idx = self.playlist.index(path)
-            self._delete_by_index(idx)
-        except ValueError:
-            pass
+        def paths(lo, hi):
+            if filtered:
+                return [self.playlist[self.playlist_filter.source_row(row)] for row in range(lo, hi)]
+            return self.playlist[lo:hi]
+
+        view = self.playlist_view
+        rect = view.viewport().rect()
+
+        def row_at(y, step):
+            # Ränder und Zwischenräume (setSpacing) gehören zu keiner Zeile
+            for dy in range(0, 2 * view.spacing() + 2):
+                row = view.indexAt(QPoint(rect.center().x(), y + step * dy)).row()
+                if row >= 0:
+                    return row
+            return -1
+
+        top = row_at(rect.top(), 1)
+        bottom = row_at(rect.bottom(), -1)
+        top = 0 if top < 0 else top
+        bottom = count - 1 if bottom < 0 else bottom
+        margin = max(10, bottom - top)
+        first, last = max(0, top - margin), min(count - 1, bottom + margin)
+        window = paths(first, last + 1)
+        self.meta_loader.retain(window)
+        self.playlist_model.retain_covers(window)
+        # sichtbare Zeilen zuerst, dann der Puffer drumherum
+        for path in reversed(paths(top, bottom + 1)):
+            if path not in self._meta_loaded:
+                self.meta_loader.request(path, urgent=True)
+        for path in window:
+            if path not in self._meta_loaded:
+                self.meta_loader.request(path)
+
+    def _on_metadata_loaded(self, path, image, title):
+        self._meta_loaded.add(path)
+        cover = None if image.isNull() else QPixmap.fromImage(image)
+        self.playlist_model.set_metadata(path, cover, title)
+
+    # ---------------- Playlist-Suche ----------------
+    def _source_row(self, row):
+        """Zeile der Ansicht -> Zeile der Playlist (bei aktiver Suche verschieden)."""
+        if self.playlist_view.model() is self.playlist_filter:
+            return self.playlist_filter.source_row(row)
+        return row
+
+    def _show_playlist_model(self, model):
+        if self.playlist_view.model() is model:
+            return
+        old = self.playlist_view.selectionModel()
+        self.playlist_view.setModel(model)
+        if old is not None:
+            old.deleteLater()
+
+    def _filter_playlist(self, *_):
+        """Filtert die Ansicht nach dem Suchfeld: alle Wörter müssen als Präfix vorkommen."""
+        ids = self.playlist_model.search(self.playlist_search.text())
+        if ids is None:
+            self._show_playlist_model(self.playlist_model)
+        else:
+            self.playlist_filter.set_ids(ids)
+            self._show_playlist_model(self.playlist_filter)
+        self._meta_timer.start()
+
+    def _refilter_playlist(self, *_):
+        if self.playlist_view.model() is self.playlist_filter:
+            self._filter_playlist()
 
     def _delete_by_index(self, idx):
         if idx < 0 or idx >= len(self.playlist):
             return
         was_current = (idx == self.current_index)
-        path = self.playlist.pop(idx)
-        item = self.playlist_widget.takeItem(idx)
-        del item
+        path = self.playlist_model.remove(idx)
+        self.meta_loader.cancel(path)
+        self._meta_loaded.discard(path)
+        self._meta_timer.start()
         if was_current:
             self.stop_audio()
             self.current_index = -1
@@ -1483,9 +5731,9 @@ class OverseerPlayer(QMainWindow):
         self._refresh_highlight()
 
     def remove_all(self):
+        self.folder_scanner.cancel()
         self.stop_audio()
-        self.playlist.clear()
-        self.playlist_widget.clear()
+        self._clear_playlist_rows()
         self.current_index = -1
         self.update_ui_for_stop()
 
@@ -1494,12 +5742,17 @@ class OverseerPlayer(QMainWindow):
         self.current_index = -1
         self.update_ui_for_stop()
 
+    def _clear_playlist_rows(self):
+        self.meta_loader.cancel_all()
+        self.playlist_model.clear()
+        self._meta_loaded.clear()
+
     def load_playlist(self, paths):
-        self.playlist = []
-        self.playlist_widget.clear()
-        for p in paths:
-            if os.path.exists(p) and p.lower().endswith(SUPPORTED_FORMATS):
-                self._add_to_playlist(p)
+        self._clear_playlist_rows()
+        valid = [p for p in paths if os.path.exists(p) and p.lower().endswith(SUPPORTED_FORMATS)]
+        # ein einziges beginInsertRows statt einer Zeile pro Datei
+        self.playlist_model.extend(valid)
+        self._meta_timer.start()
 
     # ---------------- Files dialogs ----------------
     def open_files(self):
@@ -1513,12 +5766,60 @@ class OverseerPlayer(QMainWindow):
     def open_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Ordner wählen")
         if folder:
-            for root, _, files in os.walk(folder):
-                for f in files:
-                    if f.lower().endswith(SUPPORTED_FORMATS):
-                        self._add_to_playlist(os.path.join(root, f))
-            if not self.is_playing and self.current_index == -1 and self.playlist:
-                self.play_track(0)
+            self.folder_scanner.scan([folder])
+
+    def _on_scan_batch(self, paths):
+        if self.playlist_model.extend(paths):
+            self._meta_timer.start()
+        if not self.is_playing and self.current_index == -1 and self.playlist:
+            self.play_track(0)
+
+    def _on_scan_progress(self, p):
+        self.scan_label.setText(f"Import: {p['files']} Dateien · {p['files_per_sec']:.0f}/s · "
+                                f"{p['dirs_pending']} Ordner offen")
+        self.scan_panel.setVisible(True)
+
+    def _on_scan_finished(self, stats):
+        self.scan_panel.setVisible(False)
+        if not stats.get("cancelled"):
+            self.library_sync.start(stats["roots"])
+
+    # ---------------- Beobachtete Ordner ----------------
+    def _on_library_synced(self, stats):
+        if self.settings.get("watch_folders", True):
+            self.folder_watcher.watch(stats["roots"])
+        # Tags aus der Bibliothek für die Suche, auch für Zeilen ohne geladene Metadaten
+        if self.playlist:
+            self.library_sync.fetch_texts(self.playlist)
+
+    def _on_library_texts(self, texts, start=0, step=2000):
+        # portionsweise, damit große Playlists die Oberfläche nicht anhalten
+        items = texts if isinstance(texts, list) else list(texts.items())
+        self.playlist_model.add_search_text(dict(items[start:start + step]))
+        if start + step < len(items):
+            QTimer.singleShot(0, lambda: self._on_library_texts(items, start + step))
+        else:
+            self._refilter_playlist()
+
+    def _on_folder_changes(self, changes):
+        """Änderungen aus beobachteten Ordnern in Bibliothek und Playlist übernehmen."""
+        self.library_sync.apply(changes)
+        for new, old in changes["renamed"]:
+            if self.playlist_model.rename(old, new) and old in self._meta_loaded:
+                self._meta_loaded.discard(old)
+                self._meta_loaded.add(new)
+        for path in changes["removed"]:
+            row = self.playlist.row_of(path)
+            if row >= 0:
+                self._delete_by_index(row)
+        for path in changes["modified"]:
+            self._meta_loaded.discard(path)     # Tags/Cover neu lesen
+        # neue Dateien nur, wenn ihr Ordner schon in der Playlist vertreten ist
+        roots = {self.folder_watcher.root_of(p) for p in changes["added"]} - {None}
+        shown = {r for r in roots if self.playlist.has_folder(r)}
+        fresh = sorted(p for p in changes["added"] if self.folder_watcher.root_of(p) in shown)
+        self.playlist_model.extend(fresh)
+        self._meta_timer.start()
 
     # ---------------- Playback ----------------
     def play_track(self, index):
@@ -1526,15 +5827,17 @@ class OverseerPlayer(QMainWindow):
             return
         path = self.playlist[index]
         self.current_index = index
-        media = self.vlc_instance.media_new(path)
-        self.player.set_media(media)
-        self.player.play()
+        self.current_media_type = "playlist"
+        self._end_stream()
+        self.engine.play_file(path)
         self.is_playing = True
         self._refresh_highlight()
         self._update_meta(path)
         self.play_btn.setChecked(True)
         self.play_btn.setIcon(svg_to_icon(SVG_PAUSE, 24))
         self.mark_stream_as_playing(None)  # Kein Stream markiert
+        self._shuffle_next = None
+        self._preload_next()
 
     def _on_play_button_toggled(self):
         if self.play_btn.isChecked():
@@ -1543,10 +5846,15 @@ class OverseerPlayer(QMainWindow):
                 self.play_track(0)
             else:
                 try:
-                    if self.current_media_type == "stream":
+                    if self.current_media_type == "stream" and self.timeshift is not None:
+                        # Time-Shift: dort weiterspielen, wo pausiert wurde
+                        self.engine.resume()
+                        self.is_playing = True
+                        self.play_btn.setIcon(svg_to_icon(SVG_PAUSE, 24))
+                    elif self.current_media_type == "stream":
                         # Stream immer neu starten
                         current_name = self.now_label.text().replace("Stream: ", "")
-                        current_url = self.streams.get(current_name)
+                        current_url = self.catalog.url_of(current_name)
                         if current_url:
                             # Stream starten
                             self.play_stream(current_url, current_name)
@@ -1556,7 +5864,7 @@ class OverseerPlayer(QMainWindow):
                             self.mark_playlist_as_playing(-1)
                     else:
                         # Playlist kann pausiert/resumed werden
-                        self.player.play()
+                        self.engine.resume()
                         self.is_playing = True
                         self.play_btn.setIcon(svg_to_icon(SVG_PAUSE, 24))
                         # Playlist markieren
@@ -1569,13 +5877,18 @@ class OverseerPlayer(QMainWindow):
             # Pause / Stop
             try:
                 if self.current_media_type == "playlist":
-                    self.player.pause()
+                    self.engine.pause()
                     self.is_playing = False
                     self.play_btn.setIcon(svg_to_icon(SVG_PLAY, 24))
                     # Playlist bleibt markiert
                     self.mark_playlist_as_playing(self.current_index)
                     # Stream-Markierung entfernen
                     self.mark_stream_as_playing(None)
+                elif self.timeshift is not None:
+                    # Time-Shift: nur VLC anhalten, der Mitschnitt läuft weiter
+                    self.engine.pause()
+                    self.is_playing = False
+                    self.play_btn.setIcon(svg_to_icon(SVG_PLAY, 24))
                 else:
                     # Stream stoppen + alle Markierungen entfernen
                     self.stop_audio()
@@ -1585,9 +5898,9 @@ class OverseerPlayer(QMainWindow):
         self._refresh_highlight()
 
     def pause_audio(self):
-        if self.current_media_type == "playlist":
+        if self.current_media_type == "playlist" or self.timeshift is not None:
             try:
-                self.player.pause()
+                self.engine.pause()
                 self.is_playing = False
                 self.play_btn.setChecked(False)
                 self.play_btn.setIcon(svg_to_icon(SVG_PLAY, 24))
@@ -1601,10 +5914,10 @@ class OverseerPlayer(QMainWindow):
     # Stoppt die aktuelle Wiedergabe (Playlist oder Stream)
     def stop_audio(self):
         try:
-            if self.player.is_playing():
-                self.player.stop()
+            self.engine.stop()
         except Exception:
             pass
+        self._end_stream()
         self.is_playing = False
         self.play_btn.setChecked(False)
         self.play_btn.setIcon(svg_to_icon(SVG_PLAY, 24))
@@ -1613,21 +5926,53 @@ class OverseerPlayer(QMainWindow):
         self.now_label.setText("")
         self.mark_stream_as_playing(None)
 
+    def _peek_next_index(self):
+        """Index, den play_next als Nächstes spielen würde (-1 = Ende der Playlist)."""
+        count = len(self.playlist)
+        if count == 0:
+            return -1
+        if self.shuffle_btn.isChecked():
+            # einmal auswürfeln und merken, damit genau dieser Titel vorgeladen wird
+            row = self.playlist.row_of(self._shuffle_next) if self._shuffle_next else -1
+            if row < 0:
+                row = random.randint(0, count - 1)
+                self._shuffle_next = self.playlist[row]
+            return row
+        nxt = self.current_index + 1
+        if nxt >= count:
+            nxt = 0 if self.repeat_btn.isChecked() else -1
+        return nxt
+
     def play_next(self):
         if not self.playlist:
             return
-        if self.shuffle_btn.isChecked():
-            nxt = random.randint(0, len(self.playlist) - 1)
-        else:
-            nxt = self.current_index + 1
-        if nxt >= len(self.playlist):
-            if self.repeat_btn.isChecked():
-                nxt = 0
-            else:
-                self.stop_audio()
-                return
+        nxt = self._peek_next_index()
+        if nxt < 0:
+            self.stop_audio()
+            return
         self.play_track(nxt)
 
+    def _preload_next(self):
+        """Hält den nächsten Titel im zweiten Player bereit (Gapless)."""
+        if self.current_index < 0:
+            self.engine.cancel_preload()
+            return
+        nxt = self._peek_next_index()
+        self.engine.preload(self.playlist[nxt] if nxt >= 0 else None)
+
+    def _on_order_changed(self, _checked=False):
+        self._shuffle_next = None
+        self._preload_timer.start()
+
+    def _on_track_changed(self, path):
+        # Engine hat am Titelende auf den vorgeladenen Titel umgeschaltet
+        self.current_index = self.playlist.row_of(path)
+        self._shuffle_next = None
+        self.is_playing = True
+        self._refresh_highlight()
+        self._update_meta(path)
+        self._preload_next()
+
     def play_previous(self):
         if not self.playlist:
             return
@@ -1644,23 +5989,23 @@ class OverseerPlayer(QMainWindow):
         self.play_track(prev)
 
     def set_volume(self, val):
-        self.player.audio_set_volume(val)
-        self.settings["volume"] = val
+        self.engine.set_volume(val)
+        self.store.set("volume", val)
 
     def vol_mute(self):
-        current_vol = self.player.audio_get_volume()
+        current_vol = self.engine.volume()
 
         if current_vol == 0:
             # zurück zur alten Lautstärke
-            self.player.audio_set_volume(self._old_volume)
+            self.engine.set_volume(self._old_volume)
             self.volume_slider.setValue(self._old_volume)
-            self.settings["volume"] = self._old_volume
+            self.store.set("volume", self._old_volume)
         else:
             # Lautstärke merken und stummschalten
             self._old_volume = current_vol
-            self.player.audio_set_volume(0)
+            self.engine.set_volume(0)
             self.volume_slider.setValue(0)
-            self.settings["volume"] = 0
+            self.store.set("volume", 0)
 
     # ---------------- Timeline & Timer ----------------
     def _timeline_pressed(self):
@@ -1668,36 +6013,99 @@ class OverseerPlayer(QMainWindow):
 
     def _timeline_released(self):
         self.is_user_seeking = False
-        if self.player.get_media():
-            length = self.player.get_length()
+        if self.timeshift is not None and self.timeshift.active:
+            # Time-Shift: Regler = Puffer-Fenster, ganz rechts ist live
+            behind = (1 - self.timeline.value() / 1000) * self.timeshift.window_ms()
+            self.stream_session.play(self.timeshift.local_url(self.timeshift.offset_behind(behind)))
+            self.is_playing = True
+            self.play_btn.setChecked(True)
+            self.play_btn.setIcon(svg_to_icon(SVG_PAUSE, 24))
+            return
+        if self.engine.has_media():
+            length = self.engine.length()
             pos = self.timeline.value()
             if length > 0:
                 seek = int((pos / 1000) * length)
                 try:
-                    self.player.set_time(seek)
+                    self.engine.seek(seek)
                 except Exception:
                     pass
+                self._update_position()
+
+    def _update_position(self):
+        """Zeigt die zuletzt per Ereignis gemeldete Position an (kein Aufruf in libVLC)."""
+        if self.timeshift is not None and self.timeshift.active:
+            window = self.timeshift.window_ms()
+            behind = min(self.timeshift.behind_ms(), window)
+            if not self.is_user_seeking and window > 0:
+                self.timeline.blockSignals(True)
+                self.timeline.setValue(int((1 - behind / window) * 1000))
+                self.timeline.blockSignals(False)
+            self.time_cur.setText(f"-{self._ms_to_time(behind)}" if behind >= 1000 else "LIVE")
+            self.time_tot.setText(self._ms_to_time(window))
+            return
+        length = self.engine.duration
+        cur = self.engine.position
+        if length > 0 and cur >= 0:
+            if not self.is_user_seeking:
+                self.timeline.blockSignals(True)
+                self.timeline.setValue(int((cur / length) * 1000))
+                self.timeline.blockSignals(False)
+            self.time_cur.setText(self._ms_to_time(cur))
+            self.time_tot.setText(self._ms_to_time(length))
+        else:
+            self.time_cur.setText("00:00")
+            self.time_tot.setText("00:00")
+
+    def _sync_position_timer(self):
+        active = (self.engine.state_name == "playing"
+                  and self.isVisible() and not self.isMinimized())
+        if active and not self.timer.isActive():
+            self._update_position()
+            self.timer.start()
+        elif not active and self.timer.isActive():
+            self.timer.stop()
+            self._update_position()
 
-    def _on_timer(self):
-        if self.player:
-            state = self.player.get_state()
-            if state == vlc.State.Ended:
-                self.play_next()
-                return
-            if state in (vlc.State.Playing, vlc.State.Paused):
-                length = self.player.get_length()
-                cur = self.player.get_time()
-                if length > 0 and cur >= 0:
-                    val = int((cur / length) * 1000)
-                    if not self.is_user_seeking:
-                        self.timeline.blockSignals(True)
-                        self.timeline.setValue(val)
-                        self.timeline.blockSignals(False)
-                    self.time_cur.setText(self._ms_to_time(cur))
-                    self.time_tot.setText(self._ms_to_time(length))
-                else:
-                    self.time_cur.setText("00:00")
-                    self.time_tot.setText("00:00")
+    def _on_engine_state(self, name):
+        self._sync_position_timer()
+
+    def _on_length_changed(self, length):
+        self.time_tot.setText(self._ms_to_time(length))
+
+    def _on_track_ended(self):
+        # veraltetes Ereignis? (inzwischen läuft schon etwas anderes)
+        if self.engine.state_name != "ended":
+            return
+        # ein Stream endet nicht einfach, er wird neu verbunden
+        if self.stream_session is not None and self.stream_session.handle_failure("ended"):
+            return
+        if self.current_index >= 0:
+            self.play_next()
+        else:
+            self.stop_audio()
+
+    def _on_engine_error(self):
+        if self.engine.state_name != "error":
+            return
+        if self.stream_session is not None and self.stream_session.handle_failure("error"):
+            return
+        print("Wiedergabefehler:", self.now_label.text() or self.current_index)
+        self.stop_audio()
+        self.meta_label.setText("Wiedergabefehler")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_position_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_position_timer()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._sync_position_timer()
 
     @staticmethod
     def _ms_to_time(ms):
@@ -1709,119 +6117,33 @@ class OverseerPlayer(QMainWindow):
 
     # ---------------- UI helpers ----------------
     def _refresh_highlight(self):
-        # iterate items, set playing style on the matching widget
-        for i in range(self.playlist_widget.count()):
-            item = self.playlist_widget.item(i)
-            widget = self.playlist_widget.itemWidget(item)
-            # ensure userRole path matches
-            if i < len(self.playlist):
-                item.setData(Qt.UserRole, self.playlist[i])
-            if widget:
-                widget.set_playing(i == self.current_index and self.is_playing)
+        self.playlist_model.set_playing_row(self.current_index if self.is_playing else -1)
 
     def _update_meta(self, path):
-        pix = self._cover_pixmap(path, size=260)
-        if pix:
-            self.cover_label.setPixmap(pix)
-            self.small_cover.setPixmap(pix.scaled(56, 56, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            self.cover_label.setPixmap(make_default_cover(260))
-            self.small_cover.setPixmap(make_default_cover(56))
-        title = os.path.basename(path)
-        if MUTAGEN_AVAILABLE:
-            try:
-                mf = MutagenFile(path, easy=True)
-                if mf and mf.tags:
-                    t = mf.tags.get("title", [None])[0]
-                    a = mf.tags.get("artist", [None])[0]
-                    if t:
-                        title = f"{t} — {a or ''}"
-            except Exception:
-                pass
+        img, title = self.thumbs.fetch(path, 260, self.engine)
+        if img is not None:
+            self.cover_label.setPixmap(QPixmap.fromImage(img))
+            small, _ = self.thumbs.fetch(path, 56)
+            small = small if small is not None else _scaled(img, 56)
+            self.small_cover.setPixmap(QPixmap.fromImage(small))
         else:
-            try:
-                m = self.vlc_instance.media_new(path)
-                m.parse()
-                t = m.get_meta(vlc.Meta.Title)
-                a = m.get_meta(vlc.Meta.Artist)
-                if t:
-                    title = f"{t} — {a or ''}"
-            except Exception:
-                pass
+            album = os.path.dirname(path)
+            self.cover_label.setPixmap(make_default_cover(260, seed=album))
+            self.small_cover.setPixmap(make_default_cover(56, seed=album))
         self.meta_label.setText(title)
+        self.meta_label.setToolTip("")
         self.now_label.setText(os.path.basename(path))
 
     def _cover_pixmap(self, path, size=128):
-        # try mutagen embedded
-        try:
-            if MUTAGEN_AVAILABLE:
-                mf = MutagenFile(path)
-                if mf is not None and hasattr(mf, "tags") and mf.tags:
-                    if path.lower().endswith(".mp3") and isinstance(mf.tags, ID3):
-                        for tag in mf.tags.values():
-                            if isinstance(tag, APIC):
-                                data = tag.data
-                                pix = QPixmap()
-                                if pix.loadFromData(data):
-                                    return pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    pics = getattr(mf, "pictures", None)
-                    if pics:
-                        data = pics[0].data
-                        pix = QPixmap()
-                        if pix.loadFromData(data):
-                            return pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        except Exception:
-            pass
-
-        # try vlc meta artwork
-        try:
-            m = self.vlc_instance.media_new(path)
-            try:
-                m.parse()
-            except Exception:
-                pass
-            art = m.get_meta(vlc.Meta.ArtworkURL)
-            if art:
-                if art.startswith("file://"):
-                    art_path = art.replace("file://", "")
-                    if os.path.exists(art_path):
-                        pix = QPixmap(art_path)
-                        if not pix.isNull():
-                            return pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                elif art.startswith("data:"):
-                    try:
-                        header, b64 = art.split(",", 1)
-                        import base64
-                        data = base64.b64decode(b64)
-                        pix = QPixmap()
-                        if pix.loadFromData(data):
-                            return pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    except Exception:
-                        pass
-                else:
-                    if os.path.exists(art):
-                        pix = QPixmap(art)
-                        if not pix.isNull():
-                            return pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        except Exception:
-            pass
-
-        # local cover image same name
-        base = os.path.splitext(path)[0]
-        for ext in (".jpg", ".png", ".jpeg"):
-            p = base + ext
-            if os.path.exists(p):
-                pix = QPixmap(p)
-                if not pix.isNull():
-                    return pix.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-        return None
+        img, _ = self.thumbs.fetch(path, size, self.engine)
+        return QPixmap.fromImage(img) if img is not None else None
 
     def update_ui_for_stop(self):
         self.cover_label.setPixmap(make_default_cover(260))
         self.small_cover.setPixmap(make_default_cover(56))
         self.now_label.setText("Keine Wiedergabe")
         self.meta_label.setText("Kein Titel geladen")
+        self.meta_label.setToolTip("")
         self.time_cur.setText("00:00")
         self.time_tot.setText("00:00")
         self.timeline.setValue(0)
@@ -1831,92 +6153,65 @@ class OverseerPlayer(QMainWindow):
         self._refresh_highlight()
 
     # ---------------- Webradio ----------------
-    def tte(self):
-        # Starte einen einmaligen Timer, der nach 50 Millisekunden die Methode aufruft
-        QTimer.singleShot(5000, self.update_stream_grid)
-
     def resizeEvent(self, event):
-        # Rufe die Methode auf, die das Layout neu berechnet
-        self.update_stream_grid()
+        # Webradio-Kacheln ordnet die QListView selbst neu an
+        if hasattr(self, "_meta_timer"):
+            self._meta_timer.start()
         super().resizeEvent(event)
 
+    def _on_station_dumps_loaded(self, catalog):
+        self.catalog = catalog
+        self._stream_filter_key = None
+        self.update_stream_grid()
+
     def update_stream_grid(self):
-        if not hasattr(self, 'grid_container'):
+        """Fragt das Senderverzeichnis neu ab, wenn sich Suche oder Filter geändert haben."""
+        if not hasattr(self, 'station_model'):
             return
-
-        # Lösche alle alten Widgets aus dem Layout, um sie neu anzuordnen
-        for i in reversed(range(self.grid_layout.count())):
-            item = self.grid_layout.itemAt(i)
-            if item:
-                widget = item.widget()
-                if widget:
-                    self.grid_layout.removeWidget(widget)
-                    widget.hide()
-
-        # Erstelle eine gefilterte Liste der Streams
-        visible_streams = []
-        search_text = self.search_bar.text().lower()
+        search_text = self.search_bar.text()
         is_ukw_filter_active = self.ukw_filter_btn.isChecked()
         is_featured_filter_active = self.featured_filter_btn.isChecked()
-
-        for name, data in self.streams.items():
-            if search_text not in name.lower():
-                continue
-            if is_ukw_filter_active and data.get('type') != 'ukw':
-                continue
-            if is_featured_filter_active and not data.get('featured'):
-                continue
-            visible_streams.append(name)
-
-        # Berechne die Anzahl der Spalten und Zeilen basierend auf der FENSTERGRÖßE
-        container_width = self.grid_container.width()
-        container_height = self.grid_container.height()
-
-        box_width = 200
-        box_height = 120
-        spacing = 5
-
-        min_width_for_5_cols = (box_width * 5) + (spacing * 4)
-
-        if container_width >= min_width_for_5_cols:
-            cols = 5
-        else:
-            cols = max(1, (container_width // (box_width + spacing)))
-
-        # Hier wird der Fehler behoben: Entferne diese doppelte Berechnung!
-        # cols = max(1, (container_width // (box_width + spacing)))
-
-        # Berechne die maximale Anzahl an Zeilen, die in den Container passen
-        rows = max(1, (container_height // (box_height + spacing)))
-                
-        # Begrenze die Anzahl der angezeigten Streams auf die maximale Anzahl, die hineinpasst
-        max_items = cols * rows
-        
-        # Füge die sichtbaren Boxen in das Grid ein
-        for index, name in enumerate(visible_streams):
-            if index >= max_items:
-                break
-            row = index // cols
-            col = index % cols
-            widget = self.stream_boxes[name]
-            self.grid_layout.addWidget(widget, row, col)
-            widget.show()
+        key = (self.catalog, search_text, is_ukw_filter_active, is_featured_filter_active)
+        if key == self._stream_filter_key:
+            return
+        self._stream_filter_key = key
+        ids = self.catalog.search(
+            search_text,
+            type="ukw" if is_ukw_filter_active else None,
+            featured=True if is_featured_filter_active else None,
+            # ohne Suchbegriff kostet die ganze Liste nichts, sonst die besten Treffer
+            limit=STATION_SEARCH_LIMIT if search_text.strip() else None,
+        )
+        self.station_model.set_results(self.catalog, ids)
+        self.station_view.scrollToTop()
+        self._probe_timer.start()
+
+    def _probe_visible_stations(self):
+        """Prüft nur die gerade sichtbaren Sender, nie das ganze Verzeichnis."""
+        view = self.station_view
+        first = view.indexAt(QPoint(8, 8)).row()
+        if first < 0:
+            return
+        viewport = view.viewport().rect()
+        last = view.indexAt(QPoint(viewport.width() - 8, viewport.height() - 8)).row()
+        if last < 0:
+            last = self.station_model.rowCount() - 1
+        self.prober.cancel_all()   # weggescrollte Sender nicht mehr prüfen
+        self.prober.probe(self.station_model.urls_in(first, last))
+
+    def _on_station_toggle(self, row):
+        name = self.station_model.name_at(row)
+        urls = self.catalog.urls_of(name)
+        # bei Spiegeln den schnellsten nehmen und alle für das nächste Mal neu messen
+        self.toggle_stream(True, name, self.prober.best_url(urls))
+        if len(urls) > 1:
+            self.prober.probe(urls)
 
     # Funktion um den aktiven Stream zu markieren
     def mark_stream_as_playing(self, name):
-        for stream_name, widget in self.stream_boxes.items():
-            if stream_name == name:
-                widget.setStyleSheet("""
-                    background-color: rgba(0, 128, 0, 0.025);
-                    border: 4px solid #0f8000;
-                    border-radius: 8px;
-                """)
-            else:
-                widget.setStyleSheet("""
-                    background-color: #161b22;
-                    border: 1px solid #3b82f6;
-                    border-radius: 8px;
-                """)
+        self.playing_stream = name
+        if hasattr(self, 'station_model'):
+            self.station_model.set_playing(name)
 
     # Beispiel im Stream-Start (oder wo immer du den Stream startest)
     # Optional: Klick erneut auf aktiven Stream stoppt ihn
@@ -1939,11 +6234,20 @@ class OverseerPlayer(QMainWindow):
     def play_stream(self, url, name=None):
         # Vorherige Wiedergabe stoppen
         self.stop_audio()
-        
-        # Stream neu laden
-        media = self.vlc_instance.media_new(url)
-        self.player.set_media(media)
-        self.player.play()
+        self.current_media_type = "stream"
+
+        # Stream neu laden (mit Time-Shift über den lokalen Mitschnitt)
+        if self.settings.get("timeshift", True) and _timeshift_supported(url):
+            self.timeshift = StreamRecorder(url, parent=self)
+            self.timeshift.title_changed.connect(self._on_now_playing, Qt.QueuedConnection)
+            self.timeshift.start()
+            self.record_btn.setEnabled(True)
+        self.stream_session = StreamSession(self.engine, name or url, url, self._stream_caching_ms(name),
+                                            recorder=self.timeshift, parent=self)
+        self.stream_session.status_changed.connect(self._on_stream_status)
+        self.stream_session.metrics_changed.connect(self._on_stream_metrics)
+        self.stream_session.gave_up.connect(self._on_stream_gave_up)
+        self.stream_session.play()
         self.update_button_playing(name)
         self.is_playing = True
         self.now_label.setText(f"Stream: {name}")
@@ -1957,90 +6261,147 @@ class OverseerPlayer(QMainWindow):
         else:
             self.now_label.setText(f"Stream: {url}")
         self.meta_label.setText("Webradio")
-        self.cover_label.setPixmap(make_default_cover(260, "Stream"))
-        self.small_cover.setPixmap(make_default_cover(56, "S"))
+        self.meta_label.setToolTip(self._history_tooltip(name))
+        self.cover_label.setPixmap(make_default_cover(260, "Stream", seed=name))
+        self.small_cover.setPixmap(make_default_cover(56, "S", seed=name))
         
         # Playlist-Index deaktivieren
         self.current_index = -1
         self.mark_stream_as_playing(name)
         self._refresh_highlight()
+        self.engine.cancel_preload()
     
-    def update_button_playing(self, name=None):
-        """
-        Aktualisiert alle Buttons: 
-        - der aktive Stream bekommt Pause-Icon
-        - alle anderen bekommen Play-Icon
-        """
-        for n, btn in self.stream_buttons.items():
-            if n == name:
-                btn.setIcon(svg_to_icon(SVG_PAUSE))
-            else:
-                btn.setIcon(svg_to_icon(SVG_PLAY))
+    def _end_stream(self):
+        """Beendet Stream-Sitzung und Mitschnitt (Messwerte landen in stream_metrics.json)."""
+        if self.stream_session is not None:
+            record_stream_metrics(self.stream_session.close())
+            self.stream_session.deleteLater()
+            self.stream_session = None
+        if self.timeshift is not None:
+            self.timeshift.stop()
+            self.timeshift.deleteLater()
+            self.timeshift = None
+        if hasattr(self, "record_btn"):
+            self.record_btn.setEnabled(False)
+
+    def _stream_caching_ms(self, name):
+        per_station = self.settings.get("station_caching_ms") or {}
+        return int(per_station.get(name, self.settings.get("stream_caching_ms", STREAM_CACHING_MS)))
+
+    def _on_stream_status(self, text):
+        if text:
+            self.meta_label.setText(text)
+            return
+        tracks = self.station_history.recent(self.playing_stream) if self.playing_stream else []
+        if tracks:
+            _, artist, title = tracks[0]
+            self.meta_label.setText(f"{artist} – {title}" if artist else title)
+        else:
+            self.meta_label.setText("Webradio")
 
-    # Aktualisiere die filter_by_ukw-Methode
-    def filter_by_ukw(self):
-        is_ukw_filter_active = self.ukw_filter_btn.isChecked()
-        if is_ukw_filter_active:
-            self.featured_filter_btn.setChecked(False) # Deaktiviere den anderen Filter
-        
-        # ... Rest der Logik wie zuvor
-        for name, box in self.stream_boxes.items():
-            stream_type = self.streams[name].get('type', 'web')
-            if not is_ukw_filter_active or stream_type == 'ukw':
-                box.show()
-            else:
-                box.hide()
+    def _on_stream_metrics(self, metrics):
+        self.stream_metrics = metrics
+        text = format_stream_metrics(metrics)
+        self.now_label.setToolTip(text)
+        if self.tab_info is not None:
+            self.tab_info.set_stream_metrics(text)
 
-    # Und aktualisiere die filter_by_featured-Methode
-    def filter_by_featured(self):
-        is_featured_filter_active = self.featured_filter_btn.isChecked()
-        if is_featured_filter_active:
-            self.ukw_filter_btn.setChecked(False) # Deaktiviere den anderen Filter
-        
-        # ... Rest der Logik wie zuvor
-        for name, box in self.stream_boxes.items():
-            is_featured = self.streams[name].get('featured', False)
-            if not is_featured_filter_active or is_featured:
-                box.show()
-            else:
-                box.hide()
+    def _on_stream_gave_up(self, reason):
+        print(f"Stream aufgegeben ({reason}):", self.playing_stream)
+        self.stop_audio()
+        self.meta_label.setText("Sender nicht erreichbar")
+
+    def export_stream_metrics(self):
+        """Speichert die Messwerte der letzten Stream-Sitzungen (und der laufenden) als JSON."""
+        path, _ = QFileDialog.getSaveFileName(self, "Stream-Messwerte exportieren",
+                                              "stream_metrics.json", "JSON (*.json)")
+        if not path:
+            return
+        sessions = load_stream_metrics()
+        if self.stream_session is not None:
+            self.stream_session._emit_metrics()
+            sessions.append(self.stream_metrics)
+        try:
+            write_file_atomic(path, json.dumps(sessions, indent=2, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            print("Stream-Messwerte exportieren fehlgeschlagen:", e)
+
+    def export_timeshift(self):
+        """Speichert den Inhalt des Time-Shift-Puffers als Audiodatei."""
+        recorder = self.timeshift
+        if recorder is None or not recorder.active:
+            return
+        name = self.playing_stream or "Webradio"
+        default = f"{name} {time.strftime('%Y-%m-%d %H-%M')}{recorder.suggested_extension()}"
+        path, _ = QFileDialog.getSaveFileName(self, "Mitschnitt speichern", default)
+        if not path:
+            return
+        try:
+            written = recorder.export(path)
+            print(f"Mitschnitt gespeichert: {path} ({written} Bytes)")
+        except OSError as e:
+            print("Mitschnitt speichern fehlgeschlagen:", e)
+
+    def _on_now_playing(self, text):
+        """Neuer ICY-Titel des laufenden Senders: Anzeige und Verlauf aktualisieren."""
+        name = self.playing_stream
+        if name is None:
+            return
+        artist, title = split_stream_title(text)
+        self.station_history.add(name, artist, title)
+        self.meta_label.setText(f"{artist} – {title}" if artist else title)
+        self.meta_label.setToolTip(self._history_tooltip(name))
+        initial = (artist or title)[:1].upper() or "S"
+        self.cover_label.setPixmap(make_default_cover(260, initial, seed=artist or name))
+        self.small_cover.setPixmap(make_default_cover(56, initial, seed=artist or name))
+
+    def _history_tooltip(self, name):
+        tracks = self.station_history.recent(name) if name else []
+        if not tracks:
+            return ""
+        lines = [f"{time.strftime('%H:%M', time.localtime(at))}  {f'{a} – {t}' if a else t}"
+                 for at, a, t in tracks]
+        return "Zuletzt gespielt:\n" + "\n".join(lines)
+
+    def update_button_playing(self, name=None):
+        """Play/Pause der Sender-Kacheln folgt der Markierung des laufenden Senders."""
+        self.mark_stream_as_playing(name)
 
-##
-        self.tte()
     # ---------------- Settings ----------------
-    def save_settings(self):
-        self.settings["volume"] = self.volume_slider.value()
-        self.settings["shuffle"] = self.shuffle_btn.isChecked()
-        self.settings["repeat"] = self.repeat_btn.isChecked()
-        self.settings["last_playlist"] = self.playlist.copy()
+    def save_settings(self, *_):
+        """Übernimmt den UI-Zustand in den SettingsStore; geschrieben wird gebündelt.
+
+        Die Playlist speichert der Store selbst (playlist.m3u8)."""
+        values = {
+            "volume": self.volume_slider.value(),
+            "shuffle": self.shuffle_btn.isChecked(),
+            "repeat": self.repeat_btn.isChecked(),
+        }
 
         # ---------------- EQ ----------------
-        eq_values = self.tab_equalizer.get_current_eq_values()
-        self.settings["eq_values"] = eq_values
-        self.settings["eq_preset"] = self.tab_equalizer.get_current_preset()
-        try:
-            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print("Save settings failed:", e)
-
-    def load_settings(self):
-        if os.path.exists(CONFIG_PATH):
-            try:
-                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
-                    print("DEBUG: Settings erfolgreich geladen:", loaded)
-                    self.settings.update(loaded)  # <- update, nicht ersetzen!
-            except Exception as e:
-                print("ERROR loading settings:", e)
+        if self.tab_equalizer is not None:
+            values["eq_values"] = self.tab_equalizer.get_current_eq_values()
+            values["eq_preset"] = self.tab_equalizer.get_current_preset()
+        self.store.update(values)
 
     # ---------------- Exit ----------------
     def closeEvent(self, event):
         self.save_settings()
+        self.store.flush()
+        self.meta_loader.shutdown()
+        self.prober.shutdown()
+        self.folder_scanner.shutdown()
+        self.folder_watcher.shutdown()
+        self.library_sync.shutdown()
+        self._end_stream()
+        self.thumbs.save()
+        self.engine.release()
         super().closeEvent(event)
 
 
 if __name__ == "__main__":
+    if "--import-report" in sys.argv:
+        sys.exit(write_import_report())
     app = QApplication(sys.argv)
     splash = SplashScreen()
     splash.show()
@@ -0,0 +1,940 @@
+# benchmarks.py
+# Kleine Mess-Skripte für die Performance von Beyond Music.
+#
+#   python benchmarks.py playlist [--count 100000]
+#   python benchmarks.py stations [--count 50000]
+#   python benchmarks.py gapless [--tracks 6] [--seconds 2] [--crossfade 0] [--dummy-audio]
+#   python benchmarks.py probe [--stations 40] [--workers 8]
+#   python benchmarks.py icy [--megabytes 64] [--chunk 4096]
+#   python benchmarks.py timeshift [--seconds 4] [--kbit 128]
+#   python benchmarks.py library [--files 100000]
+#   python benchmarks.py scan [--files 200000] [--workers 8] [--latency 0]
+#   python benchmarks.py search [--count 100000]
+import argparse
+import io
+import json
+import math
+import random
+import os
+import struct
+import tempfile
+import threading
+import time
+import types
+import wave
+
+import app
+from app import SUPPORTED_FORMATS, DirectoryScanner, FolderScanner, IcyMetadataParser, MediaLibrary, Playlist, PlaylistModel, StationCatalog, StreamRecorder, ThumbnailCache, open_stream, read_track_metadata
+
+
+def _timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def bench_playlist(count):
+    """Importiert count synthetische Pfade in Playlist und PlaylistModel."""
+    paths = [f"/music/artist{i % 500}/album{i % 50}/track{i:06d}.mp3" for i in range(count)]
+    print(f"Playlist-Benchmark mit {count} Pfaden")
+
+    playlist = Playlist()
+    _timed("Playlist.append (einzeln, mit Dedupe)", lambda: [playlist.append(p) for p in paths])
+    _timed("Duplikate erneut importieren", lambda: playlist.extend(paths))
+    _timed("index() für alle Pfade", lambda: [playlist.index(p) for p in paths])
+    _timed("pop() aus der Mitte (100x)", lambda: [playlist.pop(len(playlist) // 2) for _ in range(100)])
+
+    model = PlaylistModel()
+    _timed("PlaylistModel.extend (ein Insert)", lambda: model.extend(paths))
+    _timed("set_playing_row (10000 Wechsel)", lambda: [model.set_playing_row(i) for i in range(10000)])
+
+    # Zum Vergleich: die alte Variante mit 'path in list' (quadratisch)
+    n = min(count, 20000)
+    def naive():
+        plain = []
+        for p in paths[:n]:
+            if p not in plain:
+                plain.append(p)
+    _timed(f"list mit 'in'-Dedupe ({n} Pfade)", naive)
+
+
+def bench_stations(count):
+    """Lädt count synthetische Sender aus einem JSON-Dump und misst typische Suchen."""
+    rng = random.Random(1)
+    genres = ["rock", "pop", "techno", "house", "jazz", "klassik", "schlager", "hip-hop", "news", "trance"]
+    countries = ["Germany", "Austria", "Switzerland", "France", "Italy", "Spain", "Poland", "Netherlands"]
+    syllables = ["ra", "dio", "fm", "max", "beat", "wel", "le", "sun", "star", "city", "ant", "en", "ne"]
+    rows = [{
+        "name": f"{''.join(rng.choice(syllables) for _ in range(3)).title()} {i}",
+        "url": f"http://stream{i}.example.org/live",
+        "tags": ",".join(rng.sample(genres, 2)),
+        "country": rng.choice(countries),
+        "type": "ukw" if i % 7 == 0 else "web",
+        "featured": i % 50 == 0,
+        "votes": rng.randint(0, 5000),
+    } for i in range(count)]
+    path = os.path.join(tempfile.mkdtemp(prefix="beyondmusic_stations_"), "stations.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rows, f)
+    print(f"Senderverzeichnis mit {count} Sendern")
+
+    catalog = StationCatalog()
+    _timed("load_json (inkl. Index)", lambda: catalog.load_json(path))
+    queries = [("", {}), ("", {"type": "ukw"}), ("", {"featured": True}), ("r", {}), ("be", {}),
+               ("radio", {}), ("beat star", {}), ("techno", {"type": "ukw"}), ("germany rock", {}),
+               ("xyzxyz", {})]
+    for query, facets in queries:
+        label = f"search({query!r}{', ' + str(facets) if facets else ''}) top 50"
+        hits = _timed(label, lambda: catalog.search(query, limit=50, **facets))
+        if not hits and query != "xyzxyz":
+            print("   (keine Treffer)")
+    _timed("facet_counts('rock')", lambda: catalog.facet_counts("rock"))
+
+    # Zum Vergleich: die alte lineare Suche über alle Namen
+    names = catalog.names
+    _timed("linear 'radio' in name.lower()", lambda: [n for n in names if "radio" in n.lower()])
+
+
+def _write_tone(path, seconds, freq, rate=44100):
+    frames = int(seconds * rate)
+    samples = (int(12000 * math.sin(2 * math.pi * freq * i / rate)) for i in range(frames))
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"".join(struct.pack("<h", s) for s in samples))
+
+
+def _run_transitions(paths, gapless, crossfade_ms, vlc_args):
+    """Spielt paths nacheinander ab und sammelt die gemessenen Lücken pro Wechsel."""
+    from PySide6.QtCore import QCoreApplication, QTimer, Qt
+    from app import PlaybackEngine
+
+    qapp = QCoreApplication.instance() or QCoreApplication([])
+    engine = PlaybackEngine(*vlc_args)
+    engine.gapless = gapless
+    engine.crossfade_ms = crossfade_ms
+    gaps = []
+    current = [0]
+
+    def collect():
+        if engine.handover_gap_ms is not None:
+            gaps.append(engine.handover_gap_ms)
+            engine.handover_gap_ms = None
+
+    def on_end():
+        # ohne Vorladen: wie bisher erst am Ende den nächsten Titel öffnen
+        current[0] += 1
+        if current[0] < len(paths):
+            engine.play_file(paths[current[0]])
+        else:
+            QTimer.singleShot(200, qapp.quit)
+
+    def on_track_changed(path):
+        current[0] = paths.index(path)
+        engine.preload(paths[current[0] + 1] if current[0] + 1 < len(paths) else None)
+
+    engine.events.end_reached.connect(on_end, Qt.QueuedConnection)
+    engine.events.track_changed.connect(on_track_changed, Qt.QueuedConnection)
+    poll = QTimer()
+    poll.setInterval(10)
+    poll.timeout.connect(collect)
+    poll.start()
+
+    engine.play_file(paths[0])
+    engine.preload(paths[1])
+    QTimer.singleShot(60_000, qapp.quit)  # Notbremse
+    qapp.exec()
+    poll.stop()
+    collect()
+    engine.release()
+    return gaps
+
+
+class _StubEvents:
+    """Event-Manager-Attrappe: merkt sich die Callbacks, fire() löst sie aus."""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def event_attach(self, event_type, callback, *args):
+        self.handlers[event_type] = (callback, args)
+
+    def event_detach(self, event_type):
+        self.handlers.pop(event_type, None)
+
+    def fire(self, event_type, **values):
+        callback, args = self.handlers[event_type]
+        callback(types.SimpleNamespace(type=event_type, u=types.SimpleNamespace(**values)), *args)
+
+
+class _StubMedia:
+    def __init__(self, mrl):
+        self.mrl = mrl
+        self.options = []
+
+    def add_option(self, option):
+        self.options.append(option)
+
+    def event_manager(self):
+        return _StubEvents()
+
+    def release(self):
+        pass
+
+
+class _StubPlayer:
+    """Media-Player-Attrappe, die nur protokolliert, was die Engine mit ihr macht."""
+
+    def __init__(self):
+        self.media = None
+        self.volume = 100
+        self.state = "idle"
+        self.events = _StubEvents()
+
+    def event_manager(self):
+        return self.events
+
+    def set_media(self, media):
+        self.media = media
+
+    def get_media(self):
+        return self.media
+
+    def play(self):
+        self.state = "playing"
+        return 0
+
+    def set_pause(self, paused):
+        self.state = "paused" if paused else "playing"
+
+    def stop(self):
+        self.state = "stopped"
+
+    def is_playing(self):
+        return self.state == "playing"
+
+    def get_length(self):
+        return 1000
+
+    def audio_set_volume(self, volume):
+        self.volume = volume
+
+    def release(self):
+        pass
+
+
+class _StubInstance:
+    def media_player_new(self):
+        return _StubPlayer()
+
+    def media_new(self, mrl):
+        return _StubMedia(mrl)
+
+    def release(self):
+        pass
+
+
+def bench_handover():
+    """Vorladen und Übergabe mit Player-Attrappen (ohne libVLC): schlägt fehl, wenn der nächste
+    Titel nicht pausiert (:start-paused) im zweiten Player liegt oder am Titelende nicht
+    übernommen wird."""
+    import vlc
+    from PySide6.QtCore import QCoreApplication
+    from app import PlaybackEngine
+
+    qapp = QCoreApplication.instance() or QCoreApplication([])
+    E = vlc.EventType
+    engine = PlaybackEngine(instance=_StubInstance())
+    first, second = engine.player, engine._standby
+    changed, ended = [], []
+    engine.events.track_changed.connect(changed.append)
+    engine.events.end_reached.connect(lambda: ended.append(True))
+
+    engine.play_file("a.wav")
+    engine.preload("b.wav")
+    assert second.media.mrl == "b.wav" and ":start-paused" in second.media.options, "nicht pausiert vorgeladen"
+    assert second.volume == 0 and second.state == "playing", "Vorlade-Player nicht stumm gestartet"
+    second.events.fire(E.MediaPlayerPaused)         # bereit, steht bei 0
+    assert engine._standby_ready, "Vorlade-Player nicht als bereit erkannt"
+
+    first.events.fire(E.MediaPlayerEndReached)
+    qapp.processEvents()                            # handover_due ist gequeued
+    assert engine.player is second, "am Titelende nicht auf den vorgeladenen Player umgeschaltet"
+    assert second.state == "playing" and second.volume == 100, "übernommener Player spielt nicht"
+    assert changed == ["b.wav"] and not ended, (changed, ended)
+    assert engine._standby is first and first.media is None and first.state == "stopped"
+
+    # noch nicht bereit -> normales Titelende statt Übergabe
+    engine.preload("c.wav")
+    assert first.media.mrl == "c.wav"
+    second.events.fire(E.MediaPlayerEndReached)
+    qapp.processEvents()
+    assert engine.player is second and ended == [True], "Übergabe an einen nicht bereiten Player"
+    engine.release()
+    print(f"{'Übergabe (Attrappen)':<40} vorgeladen pausiert, am Ende umgeschaltet")
+
+
+def bench_gapless(tracks, seconds, crossfade_ms, dummy_audio, max_gap_ms=None):
+    """Misst die Lücke zwischen Titelende und Start des nächsten (braucht libVLC).
+
+    Mit max_gap_ms schlägt der Lauf fehl, wenn Gapless im Schnitt eine größere Lücke
+    lässt. Den Wechselpfad selbst prüft bench_handover."""
+    folder = tempfile.mkdtemp(prefix="beyondmusic_gapless_")
+    paths = []
+    for i in range(tracks):
+        path = os.path.join(folder, f"tone{i:02d}.wav")
+        _write_tone(path, seconds, 330 + 55 * i)
+        paths.append(path)
+    vlc_args = ("--aout=dummy",) if dummy_audio else ()
+    print(f"Gapless-Benchmark: {tracks} Titel à {seconds:g} s ({folder})")
+
+    modes = [("Neu öffnen am Titelende", False, 0), ("Gapless (vorgeladen)", True, 0)]
+    if crossfade_ms:
+        modes.append((f"Crossfade {crossfade_ms} ms", True, crossfade_ms))
+    for label, gapless, fade in modes:
+        gaps = _run_transitions(paths, gapless, fade, vlc_args)
+        if gaps:
+            print(f"{label:<40} Ø {sum(gaps) / len(gaps):7.1f} ms   max {max(gaps):7.1f} ms   ({len(gaps)} Wechsel)")
+        else:
+            print(f"{label:<40} keine Lücke gemessen (überblendet)")
+        if gapless and not fade and max_gap_ms is not None:
+            assert len(gaps) == tracks - 1, f"nur {len(gaps)} von {tracks - 1} Wechseln gemessen"
+            assert sum(gaps) / len(gaps) <= max_gap_ms, f"Gapless-Lücke über {max_gap_ms} ms"
+
+
+class _FakeStreamHandler:
+    """Lokale Stand-ins für Radiostreams: schnell, langsam, tot, Shoutcast v1, Weiterleitung."""
+    # Pfad -> (Verzögerung in s, Antwortkopf)
+    ROUTES = {
+        "/fast.mp3": (0.0, "HTTP/1.0 200 OK\r\nContent-Type: audio/mpeg\r\nicy-br: 128\r\n"
+                           "icy-metaint: 16000\r\nicy-name: Fast FM\r\n"),
+        "/aac": (0.05, "HTTP/1.1 200 OK\r\nContent-Type: audio/aacp\r\n"
+                       "ice-audio-info: ice-bitrate=64;ice-channels=2;ice-samplerate=44100\r\n"),
+        "/slow.mp3": (1.2, "HTTP/1.0 200 OK\r\nContent-Type: audio/mpeg\r\nicy-br: 192\r\n"),
+        "/shoutcast": (0.02, "ICY 200 OK\r\nicy-br: 96\r\ncontent-type: audio/mpeg\r\n"),
+        "/moved": (0.0, "HTTP/1.1 302 Found\r\nLocation: /fast.mp3\r\n"),
+        "/gone": (0.0, "HTTP/1.1 404 Not Found\r\nContent-Type: text/html\r\n"),
+    }
+    connections = 0     # angenommene Verbindungen, für die Cache-Prüfung
+
+    @classmethod
+    def serve(cls):
+        """Startet den Server in einem Thread und gibt die Basis-URL zurück."""
+        import socketserver
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                cls.connections += 1
+                request = self.rfile.readline().decode("latin-1").split()
+                while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                path = request[1].split("?")[0] if len(request) > 1 else "/"
+                delay, head = cls.ROUTES.get(path, (0.0, "HTTP/1.1 404 Not Found\r\n"))
+                time.sleep(delay)
+                try:
+                    self.wfile.write((head + "\r\n").encode("latin-1"))
+                    if head.split()[1] == "200":
+                        self.wfile.write(b"\xff\xfb" + bytes(4094))   # ein Stück "Audio"
+                except OSError:
+                    pass
+
+        class Server(socketserver.ThreadingTCPServer):
+            daemon_threads = True
+            request_queue_size = 64   # sonst verzögern volle Backlogs einzelne Verbindungen um 1 s
+
+        server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def bench_probe(stations, workers):
+    """Prüft stations URLs gegen lokale Stand-in-Streams und zeigt die Rangliste."""
+    from PySide6.QtCore import QCoreApplication, QTimer
+    from app import StreamProber
+
+    base = _FakeStreamHandler.serve()
+    routes = list(_FakeStreamHandler.ROUTES) + ["/missing"]
+    # ein Port ohne Server liefert "Verbindung abgelehnt"
+    urls = [f"{base}{routes[i % len(routes)]}?s={i}" for i in range(stations)] + ["http://127.0.0.1:9/dead"]
+    print(f"Stream-Prüfung: {len(urls)} URLs, {workers} parallel ({base})")
+
+    qapp = QCoreApplication.instance() or QCoreApplication([])
+    prober = StreamProber(cache_path=None, timeout=3.0, max_workers=workers)
+    done = []
+
+    def on_probed(url, result):
+        done.append(url)
+        if len(done) == len(urls):
+            qapp.quit()
+
+    prober.probed.connect(on_probed)
+    start = time.perf_counter()
+    prober.probe(urls)
+    QTimer.singleShot(60_000, qapp.quit)  # Notbremse
+    qapp.exec()
+    total = (time.perf_counter() - start) * 1000
+    seq = sum(prober.result(u)["first_byte_ms"] or 0 for u in urls if prober.result(u))
+    print(f"{'alle geprüft':<40} {total:10.1f} ms   (nacheinander wären es ≥ {seq:.0f} ms)")
+
+    seen = {}
+    for url in urls:
+        route = url.split("?")[0].replace(base, "")
+        seen.setdefault(route, prober.result(url))
+    for route, r in sorted(seen.items(), key=lambda kv: (not kv[1]["ok"], kv[1]["first_byte_ms"] or 0)):
+        if r["ok"]:
+            detail = f"{r['first_byte_ms']:7.1f} ms  {r['codec'] or '?':<5} {r['bitrate'] or '?'} kbit/s"
+        else:
+            detail = f"tot: {r['error']}"
+        print(f"  {route:<38} {prober.health(r['url']):<5} {detail}")
+    mirrors = [f"{base}/slow.mp3", f"{base}/gone", f"{base}/aac", f"{base}/fast.mp3"]
+    prober.probe(mirrors)
+    while any(prober.result(u) is None for u in mirrors):
+        qapp.processEvents()
+        time.sleep(0.01)
+    print(f"{'schnellster Spiegel':<40} {prober.best_url(mirrors).replace(base, '')}")
+    _check_probe_results(prober, base, seen, qapp)
+    prober.shutdown()
+
+
+def _check_probe_results(prober, base, seen, qapp):
+    """Erwartete Ergebnisse der Stand-ins, Cache-Treffer ohne Verbindung, Fehler statt Ausnahme."""
+    from app import StreamProber, probe_stream
+
+    fast = seen["/fast.mp3"]
+    assert fast["ok"] and fast["codec"] == "MP3" and fast["bitrate"] == 128, fast
+    assert fast["metaint"] == 16000 and fast["name"] == "Fast FM", fast
+    aac = seen["/aac"]
+    assert aac["ok"] and aac["codec"] == "AAC+" and aac["bitrate"] == 64 and aac["samplerate"] == 44100, aac
+    shoutcast = seen["/shoutcast"]      # "ICY 200 OK" statt HTTP
+    assert shoutcast["ok"] and shoutcast["status"] == 200 and shoutcast["bitrate"] == 96, shoutcast
+    moved = seen["/moved"]
+    assert moved["ok"] and moved["final_url"].endswith("/fast.mp3"), moved
+    for route in ("/gone", "/missing", "http://127.0.0.1:9/dead"):
+        assert not seen[route]["ok"] and seen[route]["error"], seen[route]
+    assert prober.health(f"{base}/gone") == "dead"
+
+    # innerhalb der TTL: kein neuer Job, keine Verbindung
+    before = _FakeStreamHandler.connections
+    prober.probe([f"{base}/fast.mp3", f"{base}/aac", f"{base}/gone"])
+    qapp.processEvents()
+    assert not prober._pending and not prober._running, "Cache-Treffer trotzdem geprüft"
+    assert _FakeStreamHandler.connections == before, "Cache-Treffer hat eine Verbindung geöffnet"
+
+    # Zeitüberschreitung und unbekannter Host kommen als Ergebnis zurück, nicht als Ausnahme
+    short = StreamProber(cache_path=None, timeout=0.3)
+    failing = [f"{base}/slow.mp3?timeout", "http://host.invalid/stream"]
+    short.probe(failing)
+    deadline = time.time() + 10
+    while any(short.result(u) is None for u in failing) and time.time() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    for url in failing:
+        result = short.result(url)
+        assert result is not None and not result["ok"] and result["error"], (url, result)
+    short.shutdown()
+    assert not probe_stream("http://127.0.0.1:9/")["ok"]
+    print(f"{'Prüfungen':<40} ICY-Köpfe, Cache-Treffer ohne Verbindung, Fehlerpfade wie erwartet")
+
+
+def bench_icy(megabytes, chunk):
+    """Schickt megabytes ICY-Datenstrom (metaint 16000) in Stücken von chunk Bytes durch den Parser."""
+    metaint = 16000
+    titles = [f"StreamTitle='Interpret {i} - Titel {i}';StreamUrl='';".encode() for i in range(50)]
+    period = bytearray()
+    for i, title in enumerate(titles):
+        period += bytes(metaint)
+        block = title + bytes(-len(title) % 16) if i % 4 == 0 else b""   # nicht jeder Block hat Text
+        period += bytes([len(block) // 16]) + block
+    repeats = max(1, megabytes * 1024 * 1024 // len(period))
+    data = bytes(period) * repeats
+    chunks = [data[i:i + chunk] for i in range(0, len(data), chunk)]
+    print(f"ICY-Parser: {len(data) / 1e6:.1f} MB in {len(chunks)} Stücken à {chunk} Bytes")
+
+    seen = []
+    parser = IcyMetadataParser(metaint, seen.append)
+    audio = [0]
+
+    def run():
+        for c in chunks:
+            for view in parser.feed(c):
+                audio[0] += len(view)
+
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{'feed() gesamt':<40} {elapsed * 1000:10.1f} ms   ({len(data) / 1e6 / elapsed:.0f} MB/s)")
+    print(f"{'pro Stück':<40} {elapsed / len(chunks) * 1e6:10.2f} µs")
+    print(f"{'Audio-Bytes / Titelwechsel':<40} {audio[0]} / {len(seen)}")
+
+
+def _serve_live_stream(kbit, latency, metaint=8192):
+    """Lokaler "Sender": endloser ICY-Stream mit kbit Datenrate und latency s Antwortzeit.
+
+    Audio-Byte Nummer i hat den Wert i % 251, so lässt sich jede Position prüfen."""
+    import socketserver
+    rate = kbit * 125
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                pass
+            time.sleep(latency)
+            pattern = bytes(i % 251 for i in range(251)) * (metaint // 251 + 2)
+            sent, start, song = 0, time.monotonic(), 0
+            try:
+                self.wfile.write((f"ICY 200 OK\r\ncontent-type: audio/mpeg\r\nicy-br: {kbit}\r\n"
+                                  f"icy-metaint: {metaint}\r\n\r\n").encode())
+                while True:
+                    offset = sent % 251
+                    self.wfile.write(pattern[offset:offset + metaint])
+                    sent += metaint
+                    song += 1
+                    meta = f"StreamTitle='Interpret - Titel {song // 4}';".encode()
+                    meta += bytes(-len(meta) % 16)
+                    self.wfile.write(bytes([len(meta) // 16]) + meta)
+                    time.sleep(max(0.0, start + sent / rate - time.monotonic()))
+            except OSError:
+                pass
+
+    class Server(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/live", server
+
+
+def _first_bytes(url, count=4096):
+    """Öffnet url wie VLC und gibt (ms bis zum ersten Byte, die ersten count Bytes) zurück."""
+    start = time.perf_counter()
+    sock, _, _, data, _, _ = open_stream(url, timeout=10)
+    try:
+        data = data or sock.recv(count)
+        elapsed = (time.perf_counter() - start) * 1000
+        while len(data) < count:
+            chunk = sock.recv(count - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        sock.close()
+    return elapsed, data[:count]
+
+
+def _check_pattern(data, offset):
+    return all(b == (offset + i) % 251 for i, b in enumerate(data))
+
+
+def bench_timeshift(seconds, kbit):
+    """Time-Shift gegen einen lokalen Sender: Fortsetzen, Zurückspulen, Ringpuffer, Export."""
+    from PySide6.QtCore import QCoreApplication
+    qapp = QCoreApplication.instance() or QCoreApplication([])
+    latency = 0.3
+    url, server = _serve_live_stream(kbit, latency)
+    print(f"Time-Shift-Benchmark: {kbit} kbit/s, Sender antwortet nach {latency * 1000:.0f} ms")
+
+    elapsed, _ = _first_bytes(url)
+    print(f"{'Sender neu verbinden (bisher)':<40} {elapsed:10.1f} ms")
+
+    recorder = StreamRecorder(url)
+    recorder.start()
+    titles = []
+    recorder.title_changed.connect(titles.append)
+    time.sleep(seconds)
+    qapp.processEvents()   # ICY-Titel kommen per Signal aus dem Lese-Thread
+    print(f"{'mitgeschnitten':<40} {len(recorder.buffer):10d} Bytes ({recorder.window_ms() / 1000:.1f} s)")
+
+    elapsed, data = _first_bytes(recorder.local_url())
+    print(f"{'Fortsetzen live (lokal)':<40} {elapsed:10.1f} ms")
+    offset = recorder.offset_behind(seconds * 500)
+    elapsed, data = _first_bytes(recorder.local_url(offset))
+    ok = "ok" if _check_pattern(data, offset) else "FEHLER"
+    print(f"{f'{seconds / 2:g} s zurückspulen':<40} {elapsed:10.1f} ms   Daten {ok}")
+    assert data and ok == "ok", "zurückgespulte Daten passen nicht zum Sender"
+
+    path = os.path.join(tempfile.mkdtemp(prefix="beyondmusic_timeshift_"), "mitschnitt.mp3")
+    start, written = recorder.buffer.start, _timed("Export", lambda: recorder.export(path))
+    with open(path, "rb") as f:
+        ok = "ok" if _check_pattern(f.read(), start) else "FEHLER"
+    print(f"{'exportiert':<40} {written:10d} Bytes   Daten {ok}   ICY-Titel: {len(titles)}")
+    assert written and ok == "ok", "Export passt nicht zum Sender"
+    recorder.stop()
+
+    server.shutdown()
+
+    # Ringpuffer: 4 x 64 KB und ein schneller Sender, der den Leser mehrfach überholt
+    url, server = _serve_live_stream(kbit * 16, 0.0)
+    small = StreamRecorder(url, segment_size=64 * 1024, segments=4)
+    small.start()
+    time.sleep(3 * small.buffer.capacity / (kbit * 16 * 125) + 0.5)
+    start, end = small.buffer.start, small.buffer.end
+    offset, data = small.buffer.read(0)
+    ok = "ok" if offset >= start and _check_pattern(data, offset) else "FEHLER"
+    print(f"{'Ringpuffer übergelaufen':<40} Fenster {start}-{end}, alter Offset -> {offset}   Daten {ok}")
+    assert end > small.buffer.capacity and data and ok == "ok", "überholter Leser nicht auf den Anfang gesetzt"
+    small.stop()
+    server.shutdown()
+    _check_ring_buffer()
+
+
+def _check_ring_buffer():
+    """TimeshiftBuffer ohne Netz: Bytes kommen unverändert zurück, überholte Leser springen
+    auf die ältesten Daten, ein Leser neben dem Schreiber sieht nie falsche Bytes."""
+    from app import TimeshiftBuffer
+
+    buf = TimeshiftBuffer(segment_size=4096, segments=4)
+    written = 0
+    for size in [1, 4095, 4097, 9000, 12345, 777] * 3:   # quer über Segmentgrenzen
+        buf.write(bytes((written + i) % 251 for i in range(size)))
+        written += size
+    assert buf.end == written and buf.start == written - buf.capacity, (buf.start, buf.end)
+
+    # alles im Fenster lesen: exakt die geschriebenen Bytes
+    offset, data = buf.read(0, timeout=0)
+    assert offset == buf.start, f"überholter Leser bei {offset} statt {buf.start}"
+    out = bytearray()
+    while offset < buf.end:
+        offset, data = buf.read(offset, 3000, timeout=0)
+        assert data and _check_pattern(data, offset), offset
+        out += data
+        offset += len(data)
+    assert len(out) == buf.capacity and _check_pattern(out, buf.start)
+
+    # Leser bleibt stehen, Schreiber überholt ihn
+    reader = buf.end - 100
+    buf.write(bytes((buf.end + i) % 251 for i in range(buf.capacity + 5000)))
+    offset, data = buf.read(reader, timeout=0)
+    assert offset == buf.start and _check_pattern(data, offset), (reader, offset, buf.start)
+
+    # Schreiber und Leser gleichzeitig, der Leser ist langsamer
+    done = threading.Event()
+    errors = []
+
+    def read_along():
+        pos = buf.start
+        while not done.is_set() or pos < buf.end:
+            new, data = buf.read(pos, 1500, timeout=0.05)
+            if new < pos or not _check_pattern(data, new):
+                errors.append((pos, new))
+                return
+            pos = new + len(data)
+            time.sleep(0.0005)
+
+    thread = threading.Thread(target=read_along)
+    thread.start()
+    for _ in range(200):
+        buf.write(bytes((buf.end + i) % 251 for i in range(1000)))
+    done.set()
+    thread.join(10)
+    assert not errors, errors
+    buf.close()
+    print(f"{'Ringpuffer (ohne Netz)':<40} Daten, Überholen und paralleles Lesen ok")
+
+
+def _tagged_mp3(title, artist, album, frames=8):
+    """Kleine, gültige MP3-Datei (ID3-Tags plus stille MPEG-Frames) als Bytes."""
+    from mutagen.id3 import ID3, TALB, TIT2, TPE1
+    tag = ID3()
+    tag.add(TIT2(encoding=3, text=title))
+    tag.add(TPE1(encoding=3, text=artist))
+    tag.add(TALB(encoding=3, text=album))
+    buf = io.BytesIO()
+    tag.save(buf)
+    return buf.getvalue() + (b"\xff\xfb\x90\x64" + bytes(413)) * frames
+
+
+def _make_music_tree(root, files, per_album=12):
+    """artistN/albumM/NN.mp3, jedes Album teilt sich eine Tag-Vorlage."""
+    paths = []
+    for i in range(files):
+        album, track = divmod(i, per_album)
+        folder = os.path.join(root, f"artist{album // 10:04d}", f"album{album:05d}")
+        if track == 0:
+            os.makedirs(folder, exist_ok=True)
+            data = _tagged_mp3(f"Album {album}", f"Artist {album // 10}", f"Album {album}")
+        path = os.path.join(folder, f"{track:02d}.mp3")
+        with open(path, "wb") as f:
+            f.write(data)
+        paths.append(path)
+    return paths
+
+
+def bench_library(files):
+    """Erst-Import, Abgleich ohne Änderungen und mit 1 % geänderten/verschobenen/gelöschten Dateien."""
+    root = tempfile.mkdtemp(prefix="beyondmusic_library_")
+    music = os.path.join(root, "music")
+    print(f"Bibliothek mit {files} Dateien")
+    paths = _timed("Testdateien schreiben", lambda: _make_music_tree(music, files))
+    library = MediaLibrary(path=os.path.join(root, "library.db"))
+
+    def report(label):
+        stats = _timed(label, lambda: library.sync([music]))
+        print(f"{'':<40} {stats['files']} Dateien, {stats['parsed']} gelesen, "
+              f"{stats['renamed']} verschoben, {stats['removed']} entfernt")
+
+    report("Erst-Import (alles parsen)")
+    report("Abgleich ohne Änderungen")
+    step = 100
+    for path in paths[::step]:          # 1 % geändert
+        with open(path, "ab") as f:
+            f.write(b"\0")
+    for path in paths[1::step]:         # 1 % verschoben
+        os.replace(path, path[:-4] + "_moved.mp3")
+    for path in paths[2::step]:         # 1 % gelöscht
+        os.remove(path)
+    report("Abgleich mit 3 % Änderungen")
+    print(f"{'':<40} {library.counts()}")
+    library.close()
+
+
+def _make_scan_tree(root, files, per_folder=20):
+    """genreN/artistM/albumK mit je per_folder leeren MP3s plus cover.jpg."""
+    for i in range(0, files, per_folder):
+        album = i // per_folder
+        folder = os.path.join(root, f"genre{album % 20:02d}", f"artist{album // 20 % 500:03d}", f"album{album:05d}")
+        os.makedirs(folder, exist_ok=True)
+        open(os.path.join(folder, "cover.jpg"), "wb").close()
+        for track in range(min(per_folder, files - i)):
+            open(os.path.join(folder, f"{track:02d} track.mp3"), "wb").close()
+
+
+def bench_scan(files, workers, latency_ms):
+    """os.walk (alte Variante) gegen DirectoryScanner und den gebündelten Import in die Playlist.
+    latency_ms simuliert ein Netzlaufwerk: jedes Verzeichnislisting wartet so lange."""
+    from PySide6.QtCore import QCoreApplication
+    qapp = QCoreApplication.instance() or QCoreApplication([])
+    root = tempfile.mkdtemp(prefix="beyondmusic_scan_")
+    print(f"Ordner-Scan mit {files} Dateien, Latenz {latency_ms} ms pro Ordner")
+    _timed("Testbaum schreiben", lambda: _make_scan_tree(root, files))
+
+    if latency_ms:
+        real_scandir = os.scandir
+        def slow_scandir(path="."):
+            time.sleep(latency_ms / 1000)
+            return real_scandir(path)
+        os.scandir = slow_scandir
+
+    def walk():
+        return [os.path.join(r, f) for r, _, names in os.walk(root) for f in names
+                if f.lower().endswith(SUPPORTED_FORMATS)]
+    found = _timed("os.walk + endswith", walk)
+    for n in sorted({1, workers}):
+        chunks = []
+        _timed(f"DirectoryScanner ({n} Worker)", lambda: DirectoryScanner(n).run([root], chunks.append))
+        assert sum(map(len, chunks)) == len(found)
+
+    # Import wie in der App: Pakete per Qt-Signal in das PlaylistModel
+    model = PlaylistModel()
+    scanner = FolderScanner(workers)
+    batches, slowest, done = [], [0.0], []
+    start = time.perf_counter()
+    def on_batch(paths):
+        t = time.perf_counter()
+        model.extend(paths)
+        slowest[0] = max(slowest[0], time.perf_counter() - t)
+        batches.append(t - start)
+    scanner.batch_ready.connect(on_batch)
+    scanner.finished.connect(done.append)
+    scanner.scan([root])
+    while not done:
+        qapp.processEvents()
+        time.sleep(0.001)
+    total = time.perf_counter() - start
+    print(f"{'FolderScanner -> PlaylistModel':<40} {total * 1000:10.1f} ms")
+    print(f"{'':<40} {len(model.paths)} Zeilen in {len(batches)} Paketen, erstes nach "
+          f"{batches[0] * 1000:.0f} ms, längstes extend {slowest[0] * 1000:.1f} ms, "
+          f"{done[0]['files_per_sec']:.0f} Dateien/s")
+    if latency_ms:
+        os.scandir = real_scandir
+
+
+def bench_search(count):
+    """Playlist-Suche: Indexaufbau beim Import, Tags nachtragen, Abfragen, Löschen."""
+    rng = random.Random(1)
+    syllables = ["ka", "lo", "mi", "ra", "sun", "ber", "to", "nix", "el", "da", "vo", "rin", "ex", "qu"]
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+    artists = [f"{word().title()} {word().title()}" for _ in range(2000)]
+    albums = [word().title() for _ in range(8000)]
+    paths, texts = [], {}
+    for i in range(count):
+        artist, album = artists[i % len(artists)], albums[i % len(albums)]
+        title = " ".join(word() for _ in range(rng.randint(1, 4))).title()
+        path = f"/music/{artist}/{album}/{i % 20 + 1:02d} - {title}.mp3"
+        paths.append(path)
+        texts[path] = f"{title} {artist} {album}"
+    print(f"Playlist-Suche mit {count} Titeln")
+
+    model = PlaylistModel()
+    _timed("PlaylistModel.extend (inkl. Index)", lambda: model.extend(paths))
+    _timed("Tags aus der Bibliothek nachtragen", lambda: model.add_search_text(texts))
+    index = model.search_index
+    print(f"{'':<40} {len(index._words)} Wörter, Index ~{index.memory_bytes() / 1024 / 1024:.1f} MB")
+
+    sample = paths[count // 2].split("/")
+    queries = ["k", "ka", "kal", "kalo", sample[2].split()[0], " ".join(sample[2:4]),
+               sample[-1][5:-4], "ra mi", "zzz"]
+    for query in queries:
+        rows = None
+        runs = 20
+        start = time.perf_counter()
+        for _ in range(runs):
+            rows = model.search(query)
+        ms = (time.perf_counter() - start) * 1000 / runs
+        print(f"  {query[:36]!r:<38} {ms:10.2f} ms   {len(rows)} Treffer")
+
+    _timed("1000 Zeilen löschen", lambda: [model.remove(len(model.paths) // 2) for _ in range(1000)])
+    _timed("Suche nach dem Löschen ('ka')", lambda: model.search("ka"))
+
+
+def bench_metadata(files):
+    """Wie oft jede Datei geparst wird: Playlist-Zeile, Now-Playing-Anzeige und Bibliothek."""
+    root = tempfile.mkdtemp(prefix="beyondmusic_metadata_")
+    music = os.path.join(root, "music")
+    paths = _make_music_tree(music, files)
+    parses = [0]
+    mutagen_file = app.MutagenFile
+
+    def counting(*args, **kwargs):
+        parses[0] += 1
+        return mutagen_file(*args, **kwargs)
+
+    app.MutagenFile = counting
+    thumbs = ThumbnailCache(directory=os.path.join(root, "thumbs"))
+    library = MediaLibrary(path=os.path.join(root, "library.db"))
+    print(f"Metadaten für {files} Dateien")
+
+    def report(label, func):
+        before = parses[0]
+        _timed(label, func)
+        print(f"{'':<40} {(parses[0] - before) / files:.2f} Parses pro Datei")
+
+    report("Playlist-Zeilen (Cover 52 px + Titel)", lambda: [thumbs.fetch(p, 52) for p in paths])
+    report("Now-Playing (260 px + 56 px)", lambda: [(thumbs.fetch(p, 260), thumbs.fetch(p, 56)) for p in paths])
+    report("Bibliothek (Tags, Dauer, Cover)", lambda: library.sync([music]))
+    report("read_track_metadata erneut", lambda: [read_track_metadata(p) for p in paths])
+    app.MutagenFile = mutagen_file
+    library.close()
+
+
+def bench_update(ttl):
+    """Update-Check gegen einen lokalen Stand-in der GitHub-API: ETag merken, TTL, 304."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from app import get_latest_version
+
+    etag = '"release-v9"'
+    seen = []       # If-None-Match je Anfrage (None = ohne)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            body = json.dumps({"tag_name": "v9.0.0"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/repos/test/releases/latest"
+    cache = os.path.join(tempfile.mkdtemp(prefix="beyondmusic_update_"), "update_check.json")
+    print(f"Update-Check gegen {url} (TTL {ttl:g} s)")
+
+    tag = _timed("erster Abruf (200)", lambda: get_latest_version(url, cache, ttl))
+    assert tag == "v9.0.0" and seen == [None], seen
+    with open(cache, encoding="utf-8") as f:
+        stored = json.load(f)
+    assert stored["etag"] == etag and stored["tag_name"] == "v9.0.0", stored
+
+    tag = _timed("innerhalb der TTL (keine Anfrage)", lambda: get_latest_version(url, cache, ttl))
+    assert tag == "v9.0.0" and len(seen) == 1, seen
+
+    time.sleep(ttl)
+    tag = _timed("nach der TTL (If-None-Match -> 304)", lambda: get_latest_version(url, cache, ttl))
+    assert tag == "v9.0.0" and seen == [None, etag], seen
+    with open(cache, encoding="utf-8") as f:
+        refreshed = json.load(f)
+    assert refreshed["checked_at"] > stored["checked_at"], refreshed
+    tag = _timed("danach wieder aus dem Cache", lambda: get_latest_version(url, cache, ttl))
+    assert tag == "v9.0.0" and len(seen) == 2, seen
+    server.shutdown()
+    print("Update-Check: ETag, TTL und 304 wie erwartet")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Beyond Music Benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+    p_playlist = sub.add_parser("playlist", help="Playlist-Import")
+    p_playlist.add_argument("--count", type=int, default=100_000)
+    p_stations = sub.add_parser("stations", help="Senderverzeichnis laden und durchsuchen")
+    p_stations.add_argument("--count", type=int, default=50_000)
+    p_gapless = sub.add_parser("gapless", help="Lücke beim Titelwechsel")
+    p_gapless.add_argument("--tracks", type=int, default=6)
+    p_gapless.add_argument("--seconds", type=float, default=2.0)
+    p_gapless.add_argument("--crossfade", type=int, default=0, help="zusätzlich mit Crossfade (ms) messen")
+    p_gapless.add_argument("--dummy-audio", action="store_true", help="ohne Soundkarte (--aout=dummy)")
+    p_gapless.add_argument("--max-gap", type=float, default=None, help="Fehler, wenn Gapless im Schnitt mehr ms Lücke lässt")
+    sub.add_parser("handover", help="Gapless-Übergabe mit Player-Attrappen prüfen (ohne libVLC)")
+    p_probe = sub.add_parser("probe", help="Stream-Prüfung gegen lokale Stand-in-Server")
+    p_probe.add_argument("--stations", type=int, default=40)
+    p_probe.add_argument("--workers", type=int, default=8)
+    p_icy = sub.add_parser("icy", help="Durchsatz des ICY-Metadaten-Parsers")
+    p_icy.add_argument("--megabytes", type=int, default=64)
+    p_icy.add_argument("--chunk", type=int, default=4096)
+    p_timeshift = sub.add_parser("timeshift", help="Time-Shift gegen einen lokalen Sender")
+    p_timeshift.add_argument("--seconds", type=float, default=4.0, help="so lange mitschneiden")
+    p_timeshift.add_argument("--kbit", type=int, default=128)
+    p_library = sub.add_parser("library", help="Bibliothek: Import und inkrementeller Abgleich")
+    p_library.add_argument("--files", type=int, default=100_000)
+    p_scan = sub.add_parser("scan", help="Ordner-Import: os.walk gegen parallelen Scanner")
+    p_scan.add_argument("--files", type=int, default=200_000)
+    p_scan.add_argument("--workers", type=int, default=8)
+    p_scan.add_argument("--latency", type=float, default=0.0, help="simulierte ms pro Verzeichnislisting")
+    p_search = sub.add_parser("search", help="Playlist-Suche über Titel/Interpret/Album/Dateiname")
+    p_search.add_argument("--count", type=int, default=100_000)
+    p_update = sub.add_parser("update", help="Update-Check: ETag/TTL/304 gegen einen lokalen Server")
+    p_update.add_argument("--ttl", type=float, default=0.5, help="TTL in Sekunden")
+    p_metadata = sub.add_parser("metadata", help="Tags lesen: ein Parse pro Datei für alle Anzeigen")
+    p_metadata.add_argument("--files", type=int, default=2000)
+    args = parser.parse_args()
+
+    if args.bench == "playlist":
+        bench_playlist(args.count)
+    elif args.bench == "stations":
+        bench_stations(args.count)
+    elif args.bench == "gapless":
+        bench_gapless(args.tracks, args.seconds, args.crossfade, args.dummy_audio, args.max_gap)
+    elif args.bench == "handover":
+        bench_handover()
+    elif args.bench == "probe":
+        bench_probe(args.stations, args.workers)
+    elif args.bench == "icy":
+        bench_icy(args.megabytes, args.chunk)
+    elif args.bench == "timeshift":
+        bench_timeshift(args.seconds, args.kbit)
+    elif args.bench == "library":
+        bench_library(args.files)
+    elif args.bench == "scan":
+        bench_scan(args.files, args.workers, args.latency)
+    elif args.bench == "search":
+        bench_search(args.count)
+    elif args.bench == "update":
+        bench_update(args.ttl)
+    elif args.bench == "metadata":
+        bench_metadata(args.files)
+
+
+if __name__ == "__main__":
+    main()